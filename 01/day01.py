@@ -1,7 +1,19 @@
 #!/usr/bin/env python3
 
-from aocd.models import Puzzle
-import numpy
+from collections import deque, namedtuple
+import os
+
+from aoc.stage import parse_stage
+
+# How many bytes of a depth file to parse at a time.
+CHUNK_BYTES = 1 << 24
+
+# The type of the depths in a binary depth file.
+BINARY_DTYPE = "<i4"
+
+# The depth counts of a run of depths: its first and last max(windows)
+# depths, and the increases within it for each window size.
+Segment = namedtuple("Segment", "head tail counts")
 
 
 def count_increases(vals: list[int]) -> int:
@@ -22,25 +34,237 @@ def count_increases_numpy(vals: list[int]) -> int:
     Works by substracting two offset numpy.arrays
     and counting positive entries.
     """
+    import numpy  # only this and part B need numpy, so import it lazily
+
     v = numpy.array(vals)
     return sum((v[1:] - v[:-1]) > 0)
 
 
+def count_window_increases(depths, k: int = 1) -> int:
+    """
+    Return the number of times that the sum of k successive depths
+    increases from one window to the next.
+
+    Successive windows share k - 1 depths, so the sum increases exactly
+    when the depth entering the window is larger than the one leaving
+    it: depths[i + k] > depths[i].  So no sums are needed, just one
+    vectorized comparison.
+    """
+    import numpy
+
+    if k < 1:
+        raise ValueError(f"Window size must be at least 1, not {k}")
+    d = numpy.asarray(depths)
+    return int(numpy.count_nonzero(d[k:] > d[:-k]))
+
+
+def count_window_increases_stream(chunks, windows=(1, 3)) -> dict:
+    """
+    Return, for each window size k, the number of times that the sum of
+    k successive depths increases, over a stream of chunks of depths
+    (arrays or lists), e.g. read from a file too large to hold at once.
+
+    The last max(windows) depths of a chunk are carried into the next,
+    so that the comparisons across chunk boundaries are made too.
+    """
+    monitor = DepthMonitor(windows)
+    for chunk in chunks:
+        monitor.extend(chunk)
+    return dict(monitor.counts)
+
+
+def boundary_increases(tail, head, k: int) -> int:
+    "Return the window-k increases from a depth of tail to one of head, which follows it."
+    import numpy
+
+    edge = numpy.concatenate([numpy.asarray(tail), numpy.asarray(head)])
+    t = len(tail)
+    # edge[j] > edge[j - k] with j - k in tail and j in head
+    lo, hi = max(t, k), min(len(edge), t + k)
+    if lo >= hi:
+        return 0
+    return int(numpy.count_nonzero(edge[lo:hi] > edge[lo - k:hi - k]))
+
+
+class DepthMonitor:
+    """
+    Keeps count of the window increases of a series of depths, as they
+    arrive, for a fixed set of window sizes.
+
+    Appending a depth compares it with the one k depths back, for each
+    window size k, so only the last max(windows) depths are kept, and
+    the counts are always up to date.
+    """
+
+    def __init__(self, windows=(1, 3)):
+        self.windows = tuple(windows)
+        if min(self.windows) < 1:
+            raise ValueError(f"Window sizes must be at least 1, not {min(self.windows)}")
+        self.recent = deque(maxlen=max(self.windows))
+        self.counts = dict.fromkeys(self.windows, 0)
+        self.readings = 0
+
+    def append(self, depth: int):
+        "Add one depth."
+        for k in self.windows:
+            if len(self.recent) >= k and depth > self.recent[-k]:
+                self.counts[k] += 1
+        self.recent.append(depth)
+        self.readings += 1
+
+    def extend(self, depths):
+        "Add a batch of depths (an array or list), counting them vectorized."
+        import numpy
+
+        d = numpy.asarray(depths)
+        for k in self.windows:
+            self.counts[k] += (boundary_increases(list(self.recent), d[:k], k) +
+                               count_window_increases(d, k))
+        self.recent.extend(d[-self.recent.maxlen:].tolist())
+        self.readings += len(d)
+
+    def increases(self, k: int) -> int:
+        "Return the number of window-k increases so far."
+        if k not in self.counts:
+            raise ValueError(f"Window size {k} is not monitored")
+        return self.counts[k]
+
+
+def segment_of(depths, windows: tuple) -> Segment:
+    "Return the segment of an array of depths."
+    carried = max(windows)
+    return Segment(depths[:carried].copy(), depths[-carried:].copy(),
+                   tuple(count_window_increases(depths, k) for k in windows))
+
+
+def join_segments(a: Segment, b: Segment, windows: tuple) -> Segment:
+    """
+    Return the segment of the depths of segment a followed by those of b.
+
+    Only the window comparisons across the boundary are new, and they
+    all lie within a's tail and b's head.
+    """
+    import numpy
+
+    carried = max(windows)
+    counts = tuple(count_a + count_b + boundary_increases(a.tail, b.head, k)
+                   for k, count_a, count_b in zip(windows, a.counts, b.counts))
+    return Segment(numpy.concatenate([a.head, b.head])[:carried],
+                   numpy.concatenate([a.tail, b.tail])[-carried:],
+                   counts)
+
+
+def file_ranges(path, parts: int, binary: bool = False) -> list:
+    """
+    Return about parts (start, end) byte ranges that split a depth file
+    between whole readings: after a line break, or a whole number of
+    binary depths.
+    """
+    import mmap
+
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    bounds = [0]
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for i in range(1, parts):
+            pos = size * i // parts
+            if binary:
+                pos -= pos % 4
+            else:
+                pos = mm.find(b"\n", pos) + 1 or size
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    if bounds[-1] < size:
+        bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def file_segment(path, start: int, end: int, windows: tuple,
+                 binary: bool = False) -> Segment:
+    """
+    Return the segment of the depths in a byte range of a depth file,
+    memory-mapping the file and parsing CHUNK_BYTES of it at a time
+    into int32 arrays.
+    """
+    import mmap
+    import numpy
+    from aoc.ints import read_ints
+
+    # binary chunks hold whole depths, so that the next starts on one
+    step = max(4, CHUNK_BYTES - CHUNK_BYTES % 4) if binary else CHUNK_BYTES
+    segment = None
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        pos = start
+        while pos < end:
+            stop = min(end, pos + step)
+            if binary:
+                depths = numpy.frombuffer(mm, BINARY_DTYPE, (stop - pos) // 4, pos)
+            else:
+                if stop < end:
+                    stop = mm.find(b"\n", stop, end) + 1 or end
+                depths = read_ints(mm[pos:stop], dtype=numpy.int32)
+            chunk = segment_of(depths, windows)
+            del depths  # the map cannot close while an array views it
+            segment = chunk if segment is None else join_segments(segment, chunk, windows)
+            pos = stop
+    return segment
+
+
+def count_file_increases(path, windows=(1, 3), workers: int = None,
+                         binary: bool = False) -> dict:
+    """
+    Return, for each window size k, the number of times that the sum of
+    k successive depths increases, in a depth file: one depth per line,
+    or with binary, little-endian int32 depths.
+
+    The file is split into ranges that worker processes (by default, one
+    per CPU) parse and count in bounded memory; the counts across the
+    ranges' boundaries are then made from the depths at their ends.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+    import functools
+
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    parts = max(1, min(4 * workers, -(-size // CHUNK_BYTES)))
+    ranges = file_ranges(path, parts, binary)
+    if not ranges:
+        return dict.fromkeys(windows, 0)
+    starts, ends = zip(*ranges)
+    n = len(ranges)
+    if workers == 1 or n == 1:
+        segments = list(map(file_segment, [path] * n, starts, ends,
+                            [windows] * n, [binary] * n))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            segments = list(pool.map(file_segment, [path] * n, starts, ends,
+                                     [windows] * n, [binary] * n))
+    total = functools.reduce(lambda a, b: join_segments(a, b, windows), segments)
+    return dict(zip(windows, total.counts))
+
+
+@parse_stage
+def parse(input_data: str) -> list[int]:
+    "Return the list of depths; both parts accept it in place of the input."
+    return [int(line) for line in input_data.split('\n')]
+
+
 def part_a(input_data: str) -> int:
     "Given the puzzle input data, return the solution for part A."
-    depths = [int(line) for line in input_data.split('\n')]
+    depths = parse(input_data)
     return count_increases(depths)
 
 
 def part_b(input_data: str) -> int:
     "Given the puzzle input data, return the solution for part B."
-    depths = [int(line) for line in input_data.split('\n')]
-    d = numpy.array(depths)
-    depth_windows = d[:-2] + d[1:-1] + d[2:]
-    return count_increases(depth_windows)
+    depths = parse(input_data)
+    return count_window_increases(depths, 3)
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=1)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -1,3 +1,5 @@
+import pytest
+
 import day01
 
 test_input_data = """199
@@ -20,3 +22,93 @@ def test_part_a():
 def test_part_b():
     "Test the solution on sample data for part B."
     assert day01.part_b(test_input_data) == 5
+
+
+def test_count_window_increases():
+    "Window increases match summing the windows, for several sizes."
+    import random
+
+    rng = random.Random(1)
+    depths = [rng.randrange(100) for _ in range(500)]
+    for k in [1, 2, 3, 7]:
+        sums = [sum(depths[i:i + k]) for i in range(len(depths) - k + 1)]
+        assert day01.count_window_increases(depths, k) == day01.count_increases(sums)
+    assert day01.count_window_increases([5, 6], 3) == 0
+    for k in [0, -1]:
+        with pytest.raises(ValueError):
+            day01.count_window_increases(depths, k)
+        with pytest.raises(ValueError):
+            day01.count_window_increases_stream([depths], (1, k))
+
+
+def test_count_window_increases_stream():
+    "Chunks give the same counts as the whole, whatever their sizes."
+    import random
+
+    rng = random.Random(2)
+    depths = [rng.randrange(100) for _ in range(500)]
+    expected = {k: day01.count_window_increases(depths, k) for k in (1, 3, 5)}
+    for size in [1, 2, 4, 97, 1000]:
+        chunks = [depths[i:i + size] for i in range(0, len(depths), size)]
+        assert day01.count_window_increases_stream(chunks, (1, 3, 5)) == expected
+
+
+def test_count_file_increases(tmp_path, monkeypatch):
+    "Files split into many ranges and chunks count like the whole."
+    import random
+    import numpy
+
+    rng = random.Random(3)
+    depths = [rng.randrange(10000) for _ in range(3000)]
+    expected = {k: day01.count_window_increases(depths, k) for k in (1, 3, 4)}
+    text = tmp_path / "depths.txt"
+    text.write_text("\n".join(map(str, depths)))
+    binary = tmp_path / "depths.bin"
+    numpy.array(depths, dtype="<i4").tofile(binary)
+
+    for chunk_bytes, workers in [(64, 1), (64, 3), (63, 1), (3, 1)]:
+        monkeypatch.setattr(day01, "CHUNK_BYTES", chunk_bytes)
+        assert day01.count_file_increases(text, (1, 3, 4), workers) == expected
+        assert day01.count_file_increases(binary, (1, 3, 4), workers,
+                                          binary=True) == expected
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+    assert day01.count_file_increases(empty) == {1: 0, 3: 0}
+
+
+def test_join_segments_short():
+    "Segments shorter than the window still join correctly."
+    import numpy
+
+    depths = numpy.array([5, 1, 7, 2, 9, 3, 8])
+    windows = (1, 3)
+    pieces = [depths[:1], depths[1:2], depths[2:5], depths[5:]]
+    total = day01.segment_of(pieces[0], windows)
+    for piece in pieces[1:]:
+        total = day01.join_segments(total, day01.segment_of(piece, windows), windows)
+    assert total.counts == (day01.count_window_increases(depths, 1),
+                            day01.count_window_increases(depths, 3))
+
+
+def test_depth_monitor():
+    "Appending one by one or in batches keeps the counts up to date."
+    import random
+
+    rng = random.Random(4)
+    depths = [rng.randrange(100) for _ in range(300)]
+    monitor = day01.DepthMonitor((1, 3, 10))
+    batched = day01.DepthMonitor((1, 3, 10))
+    i = 0
+    while i < len(depths):
+        n = rng.randrange(1, 15)
+        for depth in depths[i:i + n]:
+            monitor.append(depth)
+        batched.extend(depths[i:i + n])
+        i += n
+        for k in (1, 3, 10):
+            expected = day01.count_window_increases(depths[:i], k)
+            assert monitor.increases(k) == batched.increases(k) == expected
+    assert len(monitor.recent) == 10
+    assert monitor.readings == batched.readings == len(depths)
+    with pytest.raises(ValueError):
+        monitor.increases(2)
@@ -1,67 +1,212 @@
 #!/usr/bin/env python3
 
-from aocd.models import Puzzle
+from collections import namedtuple
+import functools
+import os
 
-def count_increases(vals: list[int]) -> int:
-    "Return the number of times that the list members increase successively."
-    num_incs = 0
-    prev_val = vals[0]
-    for v in vals[1:]:
-        if v > prev_val:
-            num_incs += 1
-        prev_val = v
-    return num_incs
+import numpy as np
 
+from aoc.grid import INVALID, table
+from aoc.stage import parse_stage
 
-def count_increases_numpy(vals: list[int]) -> int:
+
+# The code of each heading, as the engine encodes it.
+HEADINGS = {"forward": 0, "down": 1, "up": 2}
+
+# The headings' codes, by the first byte of their names.
+HEADING_CODES = table({heading[0]: code for heading, code in HEADINGS.items()})
+
+# Each heading's name and the space after it, by code.
+HEADING_NAMES = [heading.encode() + b" "
+                 for heading in sorted(HEADINGS, key=HEADINGS.get)]
+
+# Their lengths, and, to check them 8 bytes at a time, their bytes as
+# little-endian integers and the masks of those bytes.
+HEADING_LENGTHS = np.array([len(name) for name in HEADING_NAMES])
+HEADING_WORDS = np.array([int.from_bytes(name, "little") for name in HEADING_NAMES],
+                         dtype=np.uint64)
+HEADING_MASKS = np.array([(1 << 8 * len(name)) - 1 for name in HEADING_NAMES],
+                         dtype=np.uint64)
+
+# A course as arrays: the code of each command's heading, and its distance.
+Course = namedtuple("Course", "headings distances")
+
+# Where a run of commands leads from the surface, with part B's aim.
+Leg = namedtuple("Leg", "horizontal depth aim")
+
+# The most digits a distance may have, so that it fits in an int64.
+MAX_DIGITS = 18
+
+# How many bytes of a course file to read at a time.
+CHUNK_BYTES = 1 << 24
+
+
+def encode_course(input_data) -> Course:
     """
-    Return the number of times that the list members increase successively.
+    Return the course of a str or bytes-like input as arrays, without
+    making a Python object per command.
 
-    Works by substracting two offset numpy.arrays
-    and counting positive entries.
+    The heading of a line is told by its first byte, and every line must
+    start with a whole heading name and a space; the rest of the line must
+    be the digits of its distance, which are read a column at a time.
     """
-    v = numpy.array(vals)
-    return sum((v[1:] - v[:-1]) > 0)
+    data = input_data.encode() if isinstance(input_data, str) else bytes(input_data)
+    data = data.replace(b"\r\n", b"\n").rstrip(b"\n")
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    starts = np.concatenate([[0], np.flatnonzero(buffer == ord("\n")) + 1])
+    if not len(buffer):
+        starts = starts[:0]
+    headings = HEADING_CODES[buffer[starts]]
+    if np.any(headings == INVALID):
+        raise ValueError("invalid heading")
+    # the 8 bytes from each line start, as one little-endian integer
+    words = np.ndarray((len(data) + 1,), dtype="<u8", buffer=data + bytes(8),
+                       strides=(1,))
+    if np.any(words[starts] & HEADING_MASKS[headings] != HEADING_WORDS[headings]):
+        raise ValueError("invalid heading")
+    firsts = starts + HEADING_LENGTHS[headings]
+    widths = np.append(starts[1:] - 1, len(buffer)) - firsts
+    if np.any(widths < 1):
+        raise ValueError("Expected one heading and distance per line")
+    if len(widths) and widths.max() > MAX_DIGITS:
+        raise ValueError(f"Distances have at most {MAX_DIGITS} digits")
+    distances = np.zeros(len(starts), dtype=np.int64)
+    for column in range(widths.max() if len(widths) else 0):
+        within = widths > column
+        digits = buffer[np.where(within, firsts + column, 0)] - np.uint8(ord("0"))
+        if np.any(within & (digits > 9)):
+            raise ValueError("Expected one heading and distance per line")
+        distances = np.where(within, distances * 10 + digits, distances)
+    return Course(headings.astype(np.int8), distances)
+
+
+@parse_stage
+def parse(input_data: str) -> Course:
+    "Return the course as arrays; both parts accept it."
+    return encode_course(input_data)
+
+
+def navigate(course: Course) -> Leg:
+    """
+    Return the leg (horizontal position, depth, aim) reached by following
+    the course from the surface, with part B's aim.
+
+    The aim after each command is a cumulative sum of the downs and ups,
+    so part B's depth is the dot product of the aims with the forward
+    moves; part A's depth is just the final aim.
+    """
+    forward = np.where(course.headings == HEADINGS["forward"], course.distances, 0)
+    turns = np.where(course.headings == HEADINGS["down"], course.distances, 0)
+    turns -= np.where(course.headings == HEADINGS["up"], course.distances, 0)
+    aims = np.cumsum(turns)
+    aim = int(aims[-1]) if len(aims) else 0
+    return Leg(int(forward.sum()), int(np.dot(aims, forward)), aim)
+
+
+def join_legs(a: Leg, b: Leg) -> Leg:
+    """
+    Return the leg of the commands of leg a followed by those of b.
+
+    Each command is an affine update of (horizontal, depth, aim), so legs
+    compose associatively: b's forward moves also dive by a's final aim.
+    """
+    return Leg(a.horizontal + b.horizontal,
+               a.depth + b.depth + a.aim * b.horizontal,
+               a.aim + b.aim)
+
+
+def file_ranges(path, parts: int) -> list:
+    """
+    Return about parts (start, end) byte ranges that split a course file
+    after line breaks.
+    """
+    size = os.path.getsize(path)
+    if size == 0:
+        return []
+    bounds = [0]
+    with open(path, "rb") as f:
+        for i in range(1, parts):
+            pos = max(size * i // parts, bounds[-1])
+            f.seek(pos)
+            f.readline()
+            pos = min(f.tell(), size)
+            if pos > bounds[-1]:
+                bounds.append(pos)
+    if bounds[-1] < size:
+        bounds.append(size)
+    return list(zip(bounds, bounds[1:]))
+
+
+def file_leg(path, start: int, end: int) -> Leg:
+    """
+    Return the leg of the commands in a byte range of a course file,
+    reading CHUNK_BYTES of it at a time.
+    """
+    leg = Leg(0, 0, 0)
+    with open(path, "rb") as f:
+        f.seek(start)
+        pos, carried = start, b""
+        while pos < end:
+            data = carried + f.read(min(CHUNK_BYTES, end - pos))
+            pos = f.tell()
+            # a chunk ends at a line break; the rest waits for the next one
+            cut = len(data) if pos >= end else data.rfind(b"\n") + 1
+            data, carried = data[:cut], data[cut:]
+            if data.strip():
+                leg = join_legs(leg, navigate(encode_course(data)))
+    return leg
+
+
+def navigate_file(path, workers: int = None) -> Leg:
+    """
+    Return the leg of a course file, which may be larger than memory.
+
+    The file is split into ranges that worker processes (by default, one
+    per CPU) each read and navigate from the surface in bounded memory;
+    their legs are then joined in order.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    workers = workers or os.cpu_count() or 1
+    size = os.path.getsize(path)
+    parts = max(1, min(4 * workers, -(-size // CHUNK_BYTES)))
+    ranges = file_ranges(path, parts)
+    if not ranges:
+        return Leg(0, 0, 0)
+    starts, ends = zip(*ranges)
+    n = len(ranges)
+    if workers == 1 or n == 1:
+        legs = list(map(file_leg, [path] * n, starts, ends))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            legs = list(pool.map(file_leg, [path] * n, starts, ends))
+    return functools.reduce(join_legs, legs)
 
 
 def part_a(input_data: str) -> int:
     "Given the puzzle input data, return the solution for part A."
 
-    course = [line.split(' ') for line in input_data.split('\n')]
-    horizontal, depth = 0, 0
-    for heading, dist_str in course:
-        dist = int(dist_str)
-        if heading == "forward":
-            horizontal += dist
-        elif heading == "down":
-            depth += dist
-        elif heading == "up":
-            depth -= dist
-        else:
-            raise ValueError(f"invalid heading: {heading}")
+    horizontal, _, depth = navigate(parse(input_data))
     return horizontal * depth
 
 
 def part_b(input_data: str) -> int:
     "Given the puzzle input data, return the solution for part B."
 
-    course = [line.split(' ') for line in input_data.split('\n')]
-    horizontal, depth, aim = 0, 0, 0
-    for heading, x_str in course:
-        x = int(x_str)
-        if heading == "forward":
-            horizontal += x
-            depth += aim * x
-        elif heading == "down":
-            aim += x
-        elif heading == "up":
-            aim -= x
-        else:
-            raise ValueError(f"invalid heading: {heading}")
+    horizontal, depth, _ = navigate(parse(input_data))
+    return horizontal * depth
+
+
+def part_b_file(path, workers: int = None) -> int:
+    "Return the solution for part B of a course file, across worker processes."
+
+    horizontal, depth, _ = navigate_file(path, workers)
     return horizontal * depth
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=2)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -1,3 +1,5 @@
+import pytest
+
 import day02
 
 test_input_data = """forward 5
@@ -16,3 +18,75 @@ def test_part_a():
 def test_part_b():
     "Test the solution on sample data for part B."
     assert day02.part_b(test_input_data) == 900
+
+
+def follow(input_data: str) -> tuple:
+    "Follow the course command by command: (horizontal, part A depth, part B depth)."
+    horizontal, depth, aim = 0, 0, 0
+    for line in input_data.split("\n"):
+        heading, x = line.split(" ")
+        x = int(x)
+        if heading == "forward":
+            horizontal += x
+            depth += aim * x
+        else:
+            aim += x if heading == "down" else -x
+    return horizontal, aim, depth
+
+
+def test_navigate_generated():
+    "The vectorized engine agrees with following the commands one by one."
+    from aoc import generators
+
+    for seed in range(3):
+        input_data = generators.generate_text(2, 1000, seed=seed)
+        horizontal, depth_a, depth_b = follow(input_data)
+        assert day02.part_a(input_data) == horizontal * depth_a
+        assert day02.part_b(input_data) == horizontal * depth_b
+
+
+def test_crlf_and_long_distances():
+    "Windows line endings and distances of several digits are read."
+    course = day02.parse("forward 15\r\ndown 1234\r\nup 7\r\n")
+    assert course.headings.tolist() == [0, 1, 2]
+    assert course.distances.tolist() == [15, 1234, 7]
+
+
+@pytest.mark.parametrize("input_data", ["forward 5\nsideways 3", "forward 5\nfoo 3",
+                                        "forward 5\ndown", "up",
+                                        "forward 5 6\ndown \nup 3", "down 3x\nup 1",
+                                        "fxxxxxx 5", "upward 3", "down -3"])
+def test_invalid_course(input_data):
+    "Unknown headings and missing distances are rejected."
+    with pytest.raises(ValueError):
+        day02.parse(input_data)
+
+
+def test_join_legs():
+    "Legs joined in any grouping lead where the whole course does."
+    from aoc import generators
+
+    lines = generators.generate_text(2, 300, seed=4).split("\n")
+    legs = [day02.navigate(day02.parse("\n".join(lines[i:i + 100])))
+            for i in range(0, 300, 100)]
+    whole = day02.navigate(day02.parse("\n".join(lines)))
+    assert day02.join_legs(day02.join_legs(legs[0], legs[1]), legs[2]) == whole
+    assert day02.join_legs(legs[0], day02.join_legs(legs[1], legs[2])) == whole
+
+
+def test_navigate_file(tmp_path, monkeypatch):
+    "Files split into many ranges and chunks navigate like the whole."
+    from aoc import generators
+
+    input_data = generators.generate_text(2, 3000, seed=5)
+    course = tmp_path / "course.txt"
+    course.write_text(input_data + "\n")
+    expected = day02.navigate(day02.parse(input_data))
+
+    monkeypatch.setattr(day02, "CHUNK_BYTES", 64)
+    for workers in [1, 3]:
+        assert day02.navigate_file(course, workers) == expected
+    assert day02.part_b_file(course, 2) == day02.part_b(input_data)
+    empty = tmp_path / "empty.txt"
+    empty.write_text("")
+    assert day02.navigate_file(empty) == (0, 0, 0)
@@ -1,7 +1,10 @@
 """Solves adventofcode.com/2021/day/3"""
 import numpy as np
 
-from aocd.models import Puzzle
+from aoc.grid import read_grid, table
+from aoc.stage import parse_stage
+
+BITS = table({"0": 0, "1": 1})
 
 
 def most_common_bits(bit_array: np.array) -> np.array:
@@ -22,13 +25,33 @@ def bit_vector_to_int(bit_vector: np.array) -> int:
     return int(bitvec_str, base=2)
 
 
+@parse_stage
+def parse(input_data: str) -> np.array:
+    """Returns the report as a (m x n) bit array; both parts accept it."""
+
+    bit_array = read_grid(input_data, BITS)
+    bit_array.flags.writeable = False
+    return bit_array
+
+
+# Bump when parse or its array form changes, to invalidate cached parses.
+PARSE_VERSION = 2
+
+
+def to_arrays(bit_array: np.array) -> dict:
+    """Returns the parsed report as named arrays, for aoc.parse_cache."""
+    return {"bits": bit_array}
+
+
+def from_arrays(arrays: dict) -> np.array:
+    """Returns the parsed report given by to_arrays."""
+    return arrays["bits"]
+
+
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    # split input into list of lists, then convert to np.array
-    bit_lists = [[bit for bit in line] for line in input_data.split()]
-    bit_array = np.array(bit_lists, dtype=int)
-
+    bit_array = parse(input_data)
 
     mcb = most_common_bits(bit_array)
     # lcb: least common bits
@@ -54,10 +77,7 @@ def filter_by_bit_criteria(data: np.array, bit_number: int, criteria: int) -> np
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    # split input into list of lists, then convert to np.array
-    bit_lists = [[bit for bit in line] for line in input_data.split()]
-    bit_array = np.array(bit_lists, dtype=int)
-
+    bit_array = parse(input_data)
 
     # these refer to the same object, but this is OK since it won't be mutated
     oxy = bit_array
@@ -85,6 +105,8 @@ def part_b(input_data: str) -> int:
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=3)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -1,8 +1,9 @@
 """Solves adventofcode/2021/day/4"""
 
-from aocd.models import Puzzle
 import numpy as np
 
+from aoc.stage import parse_stage
+
 
 def process_input(input_data: str) -> (list, list):
     """Convert input data string to drawn numbers and boards."""
@@ -18,6 +19,13 @@ def process_input(input_data: str) -> (list, list):
     return draws, [board_string_to_array(s) for s in board_strings]
 
 
+@parse_stage
+def parse(input_data: str) -> (list, list):
+    """Returns the drawn numbers and boards; both parts accept them."""
+
+    return process_input(input_data)
+
+
 def winning_combos(board: np.array) -> list:
     """Return a list of the winning rows for a board.
 
@@ -64,7 +72,7 @@ def winning_draw(draws: list, board: np.array) -> (int, int):
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    draws, boards = process_input(input_data)
+    draws, boards = parse(input_data)
     wins = [winning_draw(draws, b) for b in boards]
     first_winning_score = sorted(wins)[0][1]
 
@@ -74,7 +82,7 @@ def part_a(input_data: str) -> int:
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    draws, boards = process_input(input_data)
+    draws, boards = parse(input_data)
     wins = [winning_draw(draws, b) for b in boards]
     last_winning_score = sorted(wins)[-1][1]
 
@@ -82,6 +90,8 @@ def part_b(input_data: str) -> int:
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=4)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -1,18 +1,44 @@
 """Solves day 05, Advent of Code 2021."""
 
 import numpy as np
-from aocd.models import Puzzle
-from parse import parse
+import re
 from collections import namedtuple
 
+from aoc.ints import read_ints
+from aoc.stage import parse_stage
+
 Segment = namedtuple("Segment", "x1 y1 x2 y2")
 
+SEGMENT = re.compile(r"^-?\d+,-?\d+ -> -?\d+,-?\d+$", re.MULTILINE)
+
 def get_segments(input_data: str) -> list:
     """Convert input data string into a list of Segments."""
 
-    data = [parse("{x1:d},{y1:d} -> {x2:d},{y2:d}", line).named
-            for line in input_data.split("\n")]
-    return [Segment(**d) for d in data]
+    if len(SEGMENT.findall(input_data)) != input_data.count("\n") + 1:
+        raise ValueError("Expected one segment x1,y1 -> x2,y2 per line")
+    coords = read_ints(input_data, columns=4)
+    return [Segment(*c) for c in coords.tolist()]
+
+
+@parse_stage
+def parse(input_data: str) -> list:
+    """Returns the list of Segments; both parts accept it."""
+
+    return get_segments(input_data)
+
+
+# Bump when parse or its array form changes, to invalidate cached parses.
+PARSE_VERSION = 1
+
+
+def to_arrays(segments: list) -> dict:
+    """Returns the Segments as a (n x 4) array, for aoc.parse_cache."""
+    return {"segments": np.array(segments, dtype=np.int64).reshape(-1, 4)}
+
+
+def from_arrays(arrays: dict) -> list:
+    """Returns the list of Segments given by to_arrays."""
+    return [Segment(*s) for s in arrays["segments"].tolist()]
 
 
 def make_field(segments: list) -> np.array:
@@ -66,7 +92,7 @@ def count_overlaps(field: np.array) -> int:
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    segments = get_segments(input_data)
+    segments = parse(input_data)
     field = make_field(segments)
     for s in segments:
         add_segment_to_field(s, field, allow_diagonal=False)
@@ -76,7 +102,7 @@ def part_a(input_data: str) -> int:
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    segments = get_segments(input_data)
+    segments = parse(input_data)
     field = make_field(segments)
     for s in segments:
         add_segment_to_field(s, field, allow_diagonal=True)
@@ -84,6 +110,8 @@ def part_b(input_data: str) -> int:
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=5)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -1,5 +1,7 @@
 """Tests for day 05 of Advent of Code 2021."""
 
+import pytest
+
 import day05
 
 # Test data given as a multiline string.
@@ -27,3 +29,11 @@ def test_part_a():
 def test_part_b():
     """Test the solution on sample data for part B."""
     assert day05.part_b(sample_input_data) == sample_solution_b
+
+
+@pytest.mark.parametrize("input_data", ["0,9 -> 5,9,1\n8,0 -> 0", "0,9 -> 5\n8,0 -> 0,8,1",
+                                        "0,9 5,9\n8,0 -> 0,8", "0,9 -> 5,9\n8,0 -> 0,8 x"])
+def test_invalid_segments(input_data):
+    """Lines that are not one segment x1,y1 -> x2,y2 are rejected."""
+    with pytest.raises(ValueError):
+        day05.parse(input_data)
@@ -1,6 +1,6 @@
 """Solves day 06, Advent of Code 2021."""
 
-from aocd.models import Puzzle
+from aoc.stage import parse_stage
 
 
 def get_fish(input_data: str) -> list:
@@ -15,6 +15,13 @@ def get_fish(input_data: str) -> list:
     return fish
 
 
+@parse_stage
+def parse(input_data: str) -> list:
+    """Returns the fish population; both parts accept it."""
+
+    return get_fish(input_data)
+
+
 def advance_day(fish: list) -> list:
     """Given one day's fish population, return the next day's population."""
 
@@ -35,7 +42,7 @@ def advance_day(fish: list) -> list:
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    fish = get_fish(input_data)
+    fish = parse(input_data)
     for _ in range(80):
         fish = advance_day(fish)
     return sum(fish)
@@ -44,13 +51,62 @@ def part_a(input_data: str) -> int:
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    fish = get_fish(input_data)
+    fish = parse(input_data)
     for _ in range(256):
         fish = advance_day(fish)
     return sum(fish)
 
 
+def descendants(days: int) -> list:
+    """Returns, for each timer, how many fish one fish with that timer
+    becomes after the given number of days."""
+
+    counts = []
+    for timer in range(9):
+        fish = [0] * 9
+        fish[timer] = 1
+        for _ in range(days):
+            fish = advance_day(fish)
+        counts.append(sum(fish))
+    return counts
+
+
+def fish_after_batch(inputs: list, days: int) -> list:
+    """Returns the number of fish after the given number of days for
+    each of many inputs.
+
+    The population grows linearly in the initial one, so each answer is
+    the dot product of the input's timer histogram with descendants(days):
+    the histograms of all the inputs are stacked into one (n x 9) matrix
+    and multiplied at once."""
+    import numpy as np
+    from aoc.ints import read_ints
+
+    timers = read_ints(",".join(inputs))
+    counts = [s.count(",") + 1 for s in inputs]
+    if len(timers) != sum(counts) or np.any((timers < 0) | (timers > 8)):
+        raise ValueError("Fish timers must be comma-separated digits 0 to 8")
+    rows = np.repeat(np.arange(len(inputs)), counts)
+    histograms = np.bincount(rows * 9 + timers,
+                             minlength=9 * len(inputs)).reshape(-1, 9)
+    return (histograms @ np.array(descendants(days), dtype=np.int64)).tolist()
+
+
+def part_a_batch(inputs: list) -> list:
+    """Returns the solutions for part A of many inputs."""
+
+    return fish_after_batch(inputs, 80)
+
+
+def part_b_batch(inputs: list) -> list:
+    """Returns the solutions for part B of many inputs."""
+
+    return fish_after_batch(inputs, 256)
+
+
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=6)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
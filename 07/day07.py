@@ -1,15 +1,24 @@
 """Solves day 07, Advent of Code 2021."""
 
-from aocd.models import Puzzle
 import numpy as np
 import math
 
+from aoc.ints import read_ints
+from aoc.stage import parse_stage
+
 
 def get_crabs(input_data: str) -> list:
     """Provides a list of crab positions."""
     return [int(x) for x in input_data.split(",")]
 
 
+@parse_stage
+def parse(input_data: str) -> list:
+    """Returns the crab positions; both parts accept them."""
+
+    return get_crabs(input_data)
+
+
 """Justification for the solution of part A.
 
 For a number x0, let L(x0), M(x0), R(x0) be the total numbers
@@ -44,7 +53,7 @@ is located in this region.
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    crabs = get_crabs(input_data)
+    crabs = parse(input_data)
 
     def cost(x0: int) -> int:
         """Total cost for a selection of x0."""
@@ -71,7 +80,7 @@ x0 is either the floor or ceiling of this value.
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    crabs = get_crabs(input_data)
+    crabs = parse(input_data)
 
     def cost(x0: int) -> int:
         """Total cost for a selection of x0."""
@@ -81,7 +90,52 @@ def part_b(input_data: str) -> int:
     return min(cost(math.floor(xm)), cost(math.ceil(xm)))
 
 
+def stacked_crabs(inputs: list) -> (np.array, np.array, np.array):
+    """Returns the crab positions of many inputs as one array, sorted
+    within each input, with the input (row) of each crab and the index
+    at which each input's crabs start."""
+
+    positions = read_ints(",".join(inputs))
+    counts = [s.count(",") + 1 for s in inputs]
+    if len(positions) != sum(counts):
+        raise ValueError("Crab positions must be comma-separated integers")
+    rows = np.repeat(np.arange(len(inputs)), counts)
+    order = np.lexsort((positions, rows))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    return positions[order], rows, starts
+
+
+def part_a_batch(inputs: list) -> list:
+    """Returns the solutions for part A of many inputs, with the crabs
+    of all of them in one array."""
+
+    crabs, rows, starts = stacked_crabs(inputs)
+    counts = np.diff(np.append(starts, len(crabs)))
+    # the floor of the median, as in part_a
+    x0 = (crabs[starts + (counts - 1) // 2] + crabs[starts + counts // 2]) // 2
+    return np.add.reduceat(np.abs(crabs - x0[rows]), starts).tolist()
+
+
+def part_b_batch(inputs: list) -> list:
+    """Returns the solutions for part B of many inputs, with the crabs
+    of all of them in one array."""
+
+    crabs, rows, starts = stacked_crabs(inputs)
+    counts = np.diff(np.append(starts, len(crabs)))
+    xm = np.add.reduceat(crabs, starts) / counts
+
+    def cost(x0: np.array) -> np.array:
+        """Total cost of each input for a selection of x0 per input."""
+        d = np.abs(crabs - x0[rows])
+        return np.add.reduceat(d * (1 + d) // 2, starts)
+
+    return np.minimum(cost(np.floor(xm).astype(np.int64)),
+                      cost(np.ceil(xm).astype(np.int64))).tolist()
+
+
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=7)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -1,8 +1,9 @@
 """Solves day 08, Advent of Code 2021."""
 
-from aocd.models import Puzzle
 from functools import reduce
 
+from aoc.stage import parse_stage
+
 def get_segments(input_line: str) -> (list, list):
     """Returns the encoded pattern list and output list."""
 
@@ -13,6 +14,13 @@ def get_segments(input_line: str) -> (list, list):
     return patterns, outputs
 
 
+@parse_stage
+def parse(input_data: str) -> list:
+    """Returns the (patterns, outputs) of each line; both parts accept them."""
+
+    return [get_segments(line) for line in input_data.split('\n')]
+
+
 def pattern_dictionary(patterns: list) -> dict:
     """Returns a mapping of each pattern to its digit."""
 
@@ -64,10 +72,10 @@ def pattern_dictionary(patterns: list) -> dict:
     return {code[digit]: digit for digit in range(10)}
 
 
-def count_digits_1478(input_line: str) -> int:
-    """Returns the total number of [1478] digits encoded in input_line."""
+def count_digits_1478(entry: tuple) -> int:
+    """Returns the total number of [1478] digits encoded in an entry."""
 
-    patterns, outputs = get_segments(input_line)
+    patterns, outputs = entry
 
     # digits 1,4,7,8 use 2,4,3,7 segments each.
     count_segs_2347 = [1 for code in outputs
@@ -78,14 +86,14 @@ def count_digits_1478(input_line: str) -> int:
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    return sum(map(count_digits_1478, input_data.split('\n')))
+    return sum(map(count_digits_1478, parse(input_data)))
                
 
-def decode_output(input_line: str) -> int:
+def decode_output(entry: tuple) -> int:
                
-    """Return the 4-digit output value encoded in a line."""
+    """Return the 4-digit output value encoded in an entry."""
 
-    patterns, outputs = get_segments(input_line)
+    patterns, outputs = entry
     pd = pattern_dictionary(patterns)
     output_digits = [pd[o] for o in outputs]
     return reduce(lambda a, b: a * 10 + b, output_digits)
@@ -93,10 +101,91 @@ def decode_output(input_line: str) -> int:
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    return sum(map(decode_output, input_data.split('\n')))
+    return sum(map(decode_output, parse(input_data)))
+
+
+# The segments lit for each digit, on a display wired as intended.
+DIGIT_SEGMENTS = ("abcefg", "cf", "acdeg", "acdfg", "bcdf",
+                  "abdfg", "abdefg", "acf", "abcdefg", "abcdfg")
+
+# Patterns and outputs on each line of an entry.
+WORDS_PER_LINE = 14
+
+
+def segment_mask(segments: str) -> int:
+    """Returns the segments as a 7-bit mask, bit 0 for a."""
+    return sum(1 << (ord(s) - ord("a")) for s in set(segments))
+
+
+"""Decoding all the entries at once.
+
+However the wires are scrambled, a digit's pattern can be told apart by
+the number of segments it lights, together with how many of them it
+shares with the patterns of 1 and of 4 (the patterns lighting 2 and 4
+segments).  With the patterns as bit masks, that is a table lookup for
+every output of every entry at once.
+"""
+
+
+def display_masks(inputs: list):
+    """Returns the patterns and outputs of all the entries of many inputs,
+    as an (entries x 14) array of segment masks, and the number of
+    entries in each input."""
+    import numpy as np
+
+    text = np.frombuffer("\n".join(inputs).encode(), dtype=np.uint8)
+    letter = (text >= ord("a")) & (text <= ord("g"))
+    word_start = letter & ~np.concatenate(([False], letter[:-1]))
+    bits = np.left_shift(1, text[letter].astype(np.int64) - ord("a"))
+    masks = np.bitwise_or.reduceat(bits, np.flatnonzero(word_start[letter]))
+    entries = [s.count("\n") + 1 for s in inputs]
+    if len(masks) != WORDS_PER_LINE * sum(entries):
+        raise ValueError(f"Entries must have {WORDS_PER_LINE} patterns and outputs")
+    return masks.reshape(-1, WORDS_PER_LINE), entries
+
+
+def part_a_batch(inputs: list) -> list:
+    """Returns the solutions for part A of many inputs."""
+    import numpy as np
+
+    masks, entries = display_masks(inputs)
+    popcount = np.array([bin(m).count("1") for m in range(128)])
+    easy = np.isin(popcount[masks[:, 10:]], [2, 3, 4, 7]).sum(axis=1)
+    starts = np.concatenate(([0], np.cumsum(entries)[:-1]))
+    return np.add.reduceat(easy, starts).tolist()
+
+
+def part_b_batch(inputs: list) -> list:
+    """Returns the solutions for part B of many inputs."""
+    import numpy as np
+
+    masks, entries = display_masks(inputs)
+    patterns, outputs = masks[:, :10], masks[:, 10:]
+    popcount = np.array([bin(m).count("1") for m in range(128)])
+
+    # digits by (segments lit, shared with 1, shared with 4); -1 for none
+    digit = np.full((8, 3, 5), -1)
+    one, four = segment_mask(DIGIT_SEGMENTS[1]), segment_mask(DIGIT_SEGMENTS[4])
+    for d, segments in enumerate(DIGIT_SEGMENTS):
+        m = segment_mask(segments)
+        digit[popcount[m], popcount[m & one], popcount[m & four]] = d
+
+    entry = np.arange(len(masks))
+    ones = patterns[entry, np.argmax(popcount[patterns] == 2, axis=1)]
+    fours = patterns[entry, np.argmax(popcount[patterns] == 4, axis=1)]
+    digits = digit[popcount[outputs],
+                   popcount[outputs & ones[:, None]],
+                   popcount[outputs & fours[:, None]]]
+    if np.any(digits < 0):
+        raise ValueError("An output matches no digit")
+    values = digits @ np.array([1000, 100, 10, 1])
+    starts = np.concatenate(([0], np.cumsum(entries)[:-1]))
+    return np.add.reduceat(values, starts).tolist()
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=8)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
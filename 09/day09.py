@@ -1,15 +1,15 @@
 """Solves day 09, Advent of Code 2021."""
 
-from aocd.models import Puzzle
 import numpy as np
 import math
 
+from aoc.grid import read_grid
+from aoc.stage import parse_stage
+
 class Heightmap():
     """Represents a rectangular heightmap."""
     def __init__(self, input_data: str):
-        height_data = [list(line)
-                      for line in input_data.split('\n')]
-        self.heights = np.array(height_data, dtype=int)
+        self.heights = read_grid(input_data)
         self.rows, self.cols = self.heights.shape
 
     def in_bounds(self, coord: tuple) -> bool:
@@ -37,11 +37,18 @@ class Heightmap():
                       [(i - 1, j), (i + 1, j),
                        (i, j - 1), (i, j + 1)])
 
+
+@parse_stage
+def parse(input_data: str) -> Heightmap:
+    """Returns the Heightmap; both parts accept it."""
+
+    return Heightmap(input_data)
+
     
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    hm = Heightmap(input_data)
+    hm = parse(input_data)
 
     def is_low_point(coord):
         adjacent_heights = [hm.heights[adj]
@@ -53,7 +60,8 @@ def part_a(input_data: str) -> int:
                   if is_low_point((i,j))]
 
     def risk_level(coord):
-        return 1 + hm.heights[coord]
+        # (int, lest the uint8 heights wrap around when summed)
+        return 1 + int(hm.heights[coord])
 
     return sum(map(risk_level, low_points))
 
@@ -61,7 +69,7 @@ def part_a(input_data: str) -> int:
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    hm = Heightmap(input_data)
+    hm = parse(input_data)
     visited = hm.heights == 9
 
     basins = []
@@ -89,6 +97,8 @@ def part_b(input_data: str) -> int:
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=9)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
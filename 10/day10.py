@@ -1,6 +1,6 @@
 """Solves day 10, Advent of Code 2021."""
 
-from aocd.models import Puzzle
+from aoc.stage import parse_stage
 
 
 DELIMITER_PAIR = {
@@ -56,10 +56,17 @@ def autocompletion_score(input_line: str) -> int:
     """Returns the autocompletion score for a line."""
 
 
+@parse_stage
+def parse(input_data: str) -> list:
+    """Returns the lines of the navigation subsystem; both parts accept them."""
+
+    return input_data.split('\n')
+
+
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    score_info = [syntax_score(line) for line in input_data.split('\n')]
+    score_info = [syntax_score(line) for line in parse(input_data)]
     corrupt_scores = [score for err, score in score_info
                       if err == "corrupt"]
     return sum(corrupt_scores)
@@ -68,7 +75,7 @@ def part_a(input_data: str) -> int:
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    score_info = [syntax_score(line) for line in input_data.split('\n')]
+    score_info = [syntax_score(line) for line in parse(input_data)]
     incomplete_scores = [score for err, score in score_info
                          if err == "incomplete"]
 
@@ -83,6 +90,8 @@ def part_b(input_data: str) -> int:
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=10)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
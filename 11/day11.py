@@ -1,12 +1,23 @@
 """Solves day 11, Advent of Code 2021."""
 
-from aocd.models import Puzzle
+import numpy as np
+
+from aoc import checkpoint
+from aoc.grid import read_grid
+from aoc.stage import parse_stage
 
 
 def make_grid(input_data: str) -> list:
     """Converts input data string into a list of 100 ints."""
 
-    return [int(ch) for ch in input_data if ch != '\n']
+    return read_grid(input_data).ravel().tolist()
+
+
+@parse_stage
+def parse(input_data: str) -> list:
+    """Returns the grid of energy levels; both parts accept it."""
+
+    return make_grid(input_data)
 
 
 def neighbor_coords(x, y: int) -> list:
@@ -56,7 +67,7 @@ def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
     total_flashes = 0
-    grid = make_grid(input_data)
+    grid = parse(input_data)
     for step in range(100):
         grid = advance_grid(grid)
         total_flashes += count_flashes(grid)
@@ -65,18 +76,35 @@ def part_a(input_data: str) -> int:
     return "Solution not implemented"
 
 def part_b(input_data: str) -> int:
-    """Given the puzzle input data, return the solution for part B."""
-    
+    """Given the puzzle input data, return the solution for part B.
+
+    With checkpoints (see aoc.checkpoint), the steps resume from the
+    latest one saved for the same grid."""
+
     step = 0
-    grid = make_grid(input_data)
-    while True:
+    grid = parse(input_data)
+    sim = checkpoint.simulation("day11", bytes(grid))
+    if sim is not None:
+        step, arrays = sim.resume()
+        if arrays is not None:
+            grid = arrays["grid"].tolist()
+
+    def state():
+        return {"grid": np.array(grid, dtype=np.uint8)}
+
+    while step == 0 or count_flashes(grid) != 100:
         grid = advance_grid(grid)
         step += 1
-        if count_flashes(grid) == 100:
-            return step
+        if sim is not None:
+            sim.save_if_due(step, state)
+    if sim is not None:
+        sim.save(step, state())
+    return step
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=11)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -1,6 +1,7 @@
 """Solves day 12, Advent of Code 2021."""
 
-from aocd.models import Puzzle
+from aoc import stats
+from aoc.stage import parse_stage
 
 
 def make_graph(input_data: str) -> dict:
@@ -31,6 +32,13 @@ def make_graph(input_data: str) -> dict:
     return adj_list
 
 
+@parse_stage
+def parse(input_data: str) -> dict:
+    """Returns the cave graph; both parts accept it."""
+
+    return make_graph(input_data)
+
+
 def count_cave_paths_a(graph: dict) -> int:
     """Counts the cave paths subject to part A constraints.
 
@@ -40,8 +48,11 @@ def count_cave_paths_a(graph: dict) -> int:
     - Big caves are visited any number of times."""
 
     is_small = str.islower
+    counters = stats.current()
 
     def count_paths_dfs(path: list) -> int:
+        if counters is not None:
+            counters["dfs_calls"] += 1
         total_paths = 0
         cur_node = path[-1]
         next_nodes = graph[cur_node]
@@ -63,7 +74,7 @@ def count_cave_paths_a(graph: dict) -> int:
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    g = make_graph(input_data)    
+    g = parse(input_data)
     return count_cave_paths_a(g)
 
 
@@ -78,8 +89,11 @@ def count_cave_paths_b(graph: dict) -> int:
     - Big caves are visited any number of times."""
 
     is_small = str.islower
+    counters = stats.current()
 
     def count_paths_dfs(path: list, double_cave = None) -> int:
+        if counters is not None:
+            counters["dfs_calls"] += 1
         total_paths = 0
         cur_node = path[-1]
         next_nodes = graph[cur_node]
@@ -106,11 +120,13 @@ def count_cave_paths_b(graph: dict) -> int:
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    g = make_graph(input_data)    
+    g = parse(input_data)
     return count_cave_paths_b(g)
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=12)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -1,9 +1,11 @@
 """Solves day 13, Advent of Code 2021."""
 
-from aocd.models import Puzzle
-from parse import parse
 from collections import namedtuple
 import numpy as np
+import re
+
+from aoc.ints import read_ints
+from aoc.stage import parse_stage
 
 
 
@@ -13,20 +15,37 @@ Dot = namedtuple("Dot", "x y")
 Instruction = namedtuple("Instruction", "axis intercept")
 
 
+DOT = re.compile(r"^-?\d+,-?\d+$", re.MULTILINE)
+
+
+FOLD = re.compile(r"^fold along ([xy])=(\d+)$", re.MULTILINE)
+
+
 def parse_input(input_data: str) -> (set, list):
     """Returns a set of dots and a list of Instructions."""
 
     dots_str, instructions_str = input_data.split('\n\n')
     
-    dots = {Dot(**parse("{x:d},{y:d}", line).named)
-            for line in dots_str.split('\n')}
-
-    instructions = [Instruction(**parse("fold along {axis}={intercept:d}", line).named)
-                    for line in instructions_str.split('\n')]
+    if len(DOT.findall(dots_str)) != dots_str.count('\n') + 1:
+        raise ValueError("Expected one dot x,y per line")
+    coords = read_ints(dots_str, columns=2)
+    dots = {Dot(*c) for c in coords.tolist()}
+
+    instructions = [Instruction(axis, int(intercept))
+                    for axis, intercept in FOLD.findall(instructions_str)]
+    if len(instructions) != instructions_str.count('\n') + 1:
+        raise ValueError("Expected one fold instruction per line")
     
     return dots, instructions
 
 
+@parse_stage
+def parse(input_data: str) -> (set, list):
+    """Returns the dots and Instructions; both parts accept them."""
+
+    return parse_input(input_data)
+
+
 def apply_fold(dots: set, fold: Instruction) -> set:
     """Returns a new set of dots created by folding the input set of dots."""
 
@@ -73,7 +92,7 @@ def draw_dots(dots: set) -> str:
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    dots, instructions = parse_input(input_data)
+    dots, instructions = parse(input_data)
     folded_dots = apply_fold(dots, instructions[0])
     return len(folded_dots)
 
@@ -81,13 +100,15 @@ def part_a(input_data: str) -> int:
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    dots, instructions = parse_input(input_data)
+    dots, instructions = parse(input_data)
     for i in instructions:
         dots = apply_fold(dots, i)
     return draw_dots(dots)
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=13)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -1,5 +1,7 @@
 """Tests for day 13 of Advent of Code 2021."""
 
+import pytest
+
 import day13
 
 # Test data given as a multiline string.
@@ -48,3 +50,11 @@ def test_part_a():
 def test_part_b():
     """Test the solution on sample data for part B."""
     assert day13.part_b(sample_input_data) == sample_solution_b
+
+
+@pytest.mark.parametrize("dots", ["6,10,0\n14", "6\n10,0,14", "6,10\n0;14",
+                                  "6,10\n0,14,"])
+def test_invalid_dots(dots):
+    """Lines that are not one dot x,y are rejected."""
+    with pytest.raises(ValueError):
+        day13.parse(dots + "\n\nfold along y=7")
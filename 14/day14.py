@@ -1,19 +1,33 @@
 """Solves day 14, Advent of Code 2021."""
 
-from aocd.models import Puzzle
-from parse import parse
 from collections import namedtuple, defaultdict
+import re
+
+from aoc import checkpoint
+from aoc.stage import parse_stage
+
+
+RULE = re.compile(r"^(\w\w) -> (\w)$", re.MULTILINE)
 
 
 def parse_input(input_data: str) -> (str, list):
     """Returns the polymer template string and a list of insertion rules."""
 
     polymer_template, rules_lines = input_data.split('\n\n')
-    rules = [parse("{} -> {}", line) for line in rules_lines.split('\n')]
+    rules = RULE.findall(rules_lines)
+    if len(rules) != rules_lines.count('\n') + 1:
+        raise ValueError("Expected one insertion rule AB -> C per line")
     
     return polymer_template, rules
 
 
+@parse_stage
+def parse(input_data: str) -> (str, list):
+    """Returns the polymer template and insertion rules; both parts accept them."""
+
+    return parse_input(input_data)
+
+
 def get_polyset(polymer: str) -> defaultdict:
     """Returns an accounting of how many times each pair occurs in a polymer string.
 
@@ -83,29 +97,56 @@ def polymer_quantity_difference(polyset: defaultdict, orig_polymer: str) -> int:
     return max(elt_count.values()) - min(elt_count.values())
 
 
-def part_a(input_data: str) -> int:
-    """Given the puzzle input data, return the solution for part A."""
+def quantity_difference_after(input_data: str, steps: int) -> int:
+    """Returns the difference between the quantities of the most and least
+    common elements after steps steps of pair insertion.
 
-    polymer_template, rules = parse_input(input_data)
+    With checkpoints (see aoc.checkpoint), the steps carry on from the
+    latest one saved for the same input, up to steps."""
+
+    polymer_template, rules = parse(input_data)
     polyset = get_polyset(polymer_template)
     sub_rules = pair_substitutions(rules)
-    for x in range(10):
+    step = 0
+    sim = checkpoint.simulation("day14", polymer_template, repr(sorted(rules)))
+    if sim is not None:
+        step, arrays = sim.resume(steps)
+        if arrays is not None:
+            # the counts outgrow 64 bits, so they are kept as decimal strings
+            polyset = defaultdict(int, zip(arrays["pairs"].tolist(),
+                                           map(int, arrays["counts"].tolist())))
+
+    def state():
+        import numpy as np
+
+        return {"pairs": np.array(list(polyset.keys())),
+                "counts": np.array([str(n) for n in polyset.values()])}
+
+    while step < steps:
         polyset = grow_polyset(polyset, sub_rules)
+        step += 1
+        if sim is not None:
+            sim.save_if_due(step, state)
+    if sim is not None:
+        sim.save(step, state())
     return polymer_quantity_difference(polyset, polymer_template)
 
 
+def part_a(input_data: str) -> int:
+    """Given the puzzle input data, return the solution for part A."""
+
+    return quantity_difference_after(input_data, 10)
+
+
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    polymer_template, rules = parse_input(input_data)
-    polyset = get_polyset(polymer_template)
-    sub_rules = pair_substitutions(rules)
-    for x in range(40):
-        polyset = grow_polyset(polyset, sub_rules)
-    return polymer_quantity_difference(polyset, polymer_template)
+    return quantity_difference_after(input_data, 40)
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=14)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -4,11 +4,17 @@ This is not an alternative method, but a modification of my day15.py.
 It still uses Dijkstra's with heapq, but there are a few optimizations
 to cut the running time by roughly 40%."""
 
-from aocd.models import Puzzle
 import heapq
 import numpy as np
 from dataclasses import dataclass
 
+from aoc import stats
+from aoc.grid import read_grid
+from aoc.stage import parse_stage
+
+# The implementation whose answers this one must agree with (see aoc.differential).
+REFERENCE_IMPLEMENTATION = "day15"
+
 INFTY = float("inf")
 
 # input data for the puzzle is 100x100, hence:
@@ -40,9 +46,30 @@ class Graph:
 def parse_multiline_digits(input_data: str) -> np.array:
     """Read multiline digits into numpy array."""
 
-    digits = [[d for d in line]
-              for line in input_data.split()]
-    return np.array(digits, dtype=int)
+    return read_grid(input_data)
+
+
+@parse_stage
+def parse(input_data: str) -> np.array:
+    """Returns the array of risk levels; both parts accept it."""
+
+    a = parse_multiline_digits(input_data)
+    a.flags.writeable = False
+    return a
+
+
+# Bump when parse or its array form changes, to invalidate cached parses.
+PARSE_VERSION = 2
+
+
+def to_arrays(a: np.array) -> dict:
+    """Returns the risk levels as named arrays, for aoc.parse_cache."""
+    return {"risk": a}
+
+
+def from_arrays(arrays: dict) -> np.array:
+    """Returns the array of risk levels given by to_arrays."""
+    return arrays["risk"]
 
 
 def augment_array(small_array: np.array, times: int) -> np.array:
@@ -78,7 +105,8 @@ def make_graph(input_array: np.array) -> Graph:
     rows, cols = np.shape(input_array)
     nodes = rows * cols
     edges = [None for x in range(nodes)]
-    costs = input_array.flatten()
+    # (as Python ints, since the uint8 risk levels would wrap around in sums)
+    costs = input_array.ravel().tolist()
 
     return Graph(nodes=nodes, rows=rows, cols=cols, weights=costs)
 
@@ -100,6 +128,7 @@ def dijkstra(g: Graph, start, finish) -> int:
     # where cost is the best code for that node when added to the heap.
     
     to_visit = [(0, start)]
+    pushes = 1
     
     while to_visit:
         node_cost, node = heapq.heappop(to_visit)
@@ -111,26 +140,36 @@ def dijkstra(g: Graph, start, finish) -> int:
             if trial_cost < cost[neighbor]:
                 cost[neighbor] = trial_cost
                 heapq.heappush(to_visit, (trial_cost, neighbor))
+                pushes += 1
+
+    counters = stats.current()
+    if counters is not None:
+        # every entry pushed is popped, as the heap is emptied
+        counters["heap_pushes"] += pushes
+        counters["heap_pops"] += pushes
+        counters["nodes_visited"] += sum(visited_nodes)
     return cost[finish]
 
 
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    a = parse_multiline_digits(input_data)
+    a = parse(input_data)
     g = make_graph(a)
     return dijkstra(g, 0, g.nodes - 1)
 
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    a = parse_multiline_digits(input_data)
+    a = parse(input_data)
     a = augment_array(a, 5)
     g = make_graph(a)
     return dijkstra(g, 0, g.nodes - 1)
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=15)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
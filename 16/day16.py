@@ -1,8 +1,9 @@
 """Solves day 16, Advent of Code 2021."""
 
-from aocd.models import Puzzle
 from math import prod
 
+from aoc.stage import parse_stage
+
 def parse_input(input_data: str) -> tuple:
     """Given a hex string, return a tuple of bits."""
     hex_to_nibbles = {digit: f"{int(digit, 16):04b}"
@@ -109,6 +110,13 @@ class Packet:
         if id == 7: return int(sp_values[0] == sp_values[1])
             
 
+@parse_stage
+def parse(input_data: str) -> Packet:
+    """Returns the outermost Packet; both parts accept it."""
+
+    return Packet(parse_input(input_data))
+
+
 def packet_version_sum(p: Packet):
     """Sums the version numbers of the packet and subpackets."""
     return p.version + sum([packet_version_sum(sp) for sp in p.subpackets])
@@ -117,18 +125,20 @@ def packet_version_sum(p: Packet):
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    p = Packet(parse_input(input_data))
+    p = parse(input_data)
     return packet_version_sum(p)
 
 
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    p = Packet(parse_input(input_data))
+    p = parse(input_data)
     return p.value
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=16)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -1,9 +1,13 @@
 """Solves day 17, Advent of Code 2021."""
 
-from aocd.models import Puzzle
 from collections import defaultdict
-from parse import parse
 import math
+import re
+
+from aoc.stage import parse_stage
+
+# The implementation whose answers this one must agree with (see aoc.differential).
+REFERENCE_IMPLEMENTATION = "day17sim"
 
 """
 Notes on the problem.
@@ -75,7 +79,8 @@ def x_range_in_target(x1: int, x2: int) -> dict:
             continue
         else:
             s1 = math.ceil(s1)
-        if s2 is None:
+        if s2 is None or vx * (vx + 1) // 2 <= x2:
+            # the probe comes to rest within [x1, x2]
             s2 = math.inf
         else:
             s2 = math.floor(s2)
@@ -146,16 +151,30 @@ def velocities_for_target(x1: int, x2: int, y1: int, y2: int) -> set:
             for vy in vy_dict[step]}
 
 
+TARGET = re.compile(r"target area: x=(?P<x1>-?\d+)\.\.(?P<x2>-?\d+), "
+                    r"y=(?P<y1>-?\d+)\.\.(?P<y2>-?\d+)")
+
+
 def parse_input_data(input_data: str) -> dict:
     """Return the target's specifications."""
 
-    return parse('target area: x={x1:d}..{x2:d}, y={y1:d}..{y2:d}', input_data).named
+    match = TARGET.fullmatch(input_data)
+    if match is None:
+        raise ValueError(f"Unexpected target: {input_data}")
+    return {k: int(v) for k, v in match.groupdict().items()}
+
+
+@parse_stage
+def parse(input_data: str) -> dict:
+    """Returns the target's specifications; both parts accept them."""
+
+    return parse_input_data(input_data)
 
 
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    vs = velocities_for_target(**parse_input_data(input_data))
+    vs = velocities_for_target(**parse(input_data))
     max_vy = max(vs, key=lambda x: x[1])[1]
     return max_vy * (max_vy + 1) // 2
     
@@ -163,11 +182,13 @@ def part_a(input_data: str) -> int:
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    vs = velocities_for_target(**parse_input_data(input_data))
+    vs = velocities_for_target(**parse(input_data))
     return len(vs)
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=17)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
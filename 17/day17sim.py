@@ -13,9 +13,10 @@ model for the probe's dynamics if we ever wanted to.
 """
 
 
-from aocd.models import Puzzle
 from collections import namedtuple
-from parse import parse
+import re
+
+from aoc.stage import parse_stage
 
 State = namedtuple("State", "x y vx vy")
 
@@ -52,22 +53,35 @@ def probe_missed_target(s: State, t: Target) -> bool:
     
     return False
 
+TARGET_AREA = re.compile(r"target area: x=(?P<x1>-?\d+)\.\.(?P<x2>-?\d+), "
+                         r"y=(?P<y1>-?\d+)\.\.(?P<y2>-?\d+)")
+
+
 def parse_input_data(input_data: str) -> Target:
     """Return the target's specifications."""
 
-    data = parse('target area: x={x1:d}..{x2:d}, y={y1:d}..{y2:d}',
-                 input_data).named
+    match = TARGET_AREA.fullmatch(input_data)
+    if match is None:
+        raise ValueError(f"Unexpected target: {input_data}")
+    data = {k: int(v) for k, v in match.groupdict().items()}
     return Target(xmin = min(data["x1"], data["x2"]),
                   xmax = max(data["x1"], data["x2"]),
                   ymin = min(data["y1"], data["y2"]),
                   ymax = max(data["y1"], data["y2"]))
 
 
+@parse_stage
+def parse(input_data: str) -> Target:
+    """Returns the Target; both parts accept it."""
+
+    return parse_input_data(input_data)
+
+
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
     # get target
-    target = parse_input_data(input_data)
+    target = parse(input_data)
     if target.xmin <= 0 or target.ymax >= 0:
         raise ValueError(f"Unexpected target range: {target}")
     ymax_list = []
@@ -89,7 +103,7 @@ def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
     # get target
-    target = parse_input_data(input_data)
+    target = parse(input_data)
     if target.xmin <= 0 or target.ymax >= 0:
         raise ValueError(f"Unexpected target range: {target}")
     v_list = []
@@ -106,6 +120,8 @@ def part_b(input_data: str) -> int:
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=17)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -18,3 +18,9 @@ def test_part_a():
 def test_part_b():
     """Test the solution on sample data for part B."""
     assert day17.part_b(sample_input_data) == sample_solution_b
+
+
+def test_part_b_probe_stops_on_edge():
+    """A probe that comes to rest on the target's far edge stays in the target."""
+    # vx = 11 stops at x = 66
+    assert day17.part_b("target area: x=48..66, y=-44..-31") == 460
@@ -1,6 +1,6 @@
 """Tests for day 17 of Advent of Code 2021."""
 
-import day17
+import day17sim
 
 # Test data given as a multiline string.
 sample_input_data = """target area: x=20..30, y=-10..-5"""
@@ -12,9 +12,9 @@ sample_solution_b = 112
 
 def test_part_a():
     """Test the solution on sample data for part A."""
-    assert day17.part_a(sample_input_data) == sample_solution_a
+    assert day17sim.part_a(sample_input_data) == sample_solution_a
 
 
 def test_part_b():
     """Test the solution on sample data for part B."""
-    assert day17.part_b(sample_input_data) == sample_solution_b
+    assert day17sim.part_b(sample_input_data) == sample_solution_b
@@ -1,6 +1,10 @@
 """Solves day 18, Advent of Code 2021."""
 
-from aocd.models import Puzzle
+from aoc import stats
+from aoc.stage import parse_stage
+
+# The implementation whose answers this one must agree with (see aoc.differential).
+REFERENCE_IMPLEMENTATION = "day18string"
 
 MAX_DEPTH = 5
 MAX_NODES = 2**(MAX_DEPTH+1) - 1
@@ -134,14 +138,22 @@ class Snailfish:
     def reduce(self):
         """Reduces the snailfish number by exploding and splitting."""
 
+        explodes, splits = 0, 0
         while True:
             if self.explode() == True:
+                explodes += 1
                 continue
             elif self.split() == True:
+                splits += 1
                 continue
             else:
                 break
 
+        counters = stats.current()
+        if counters is not None:
+            counters["explodes"] += explodes
+            counters["splits"] += splits
+
 
     def magnitude(self, idx=0) -> int:
         """Returns the magnitude of the snailfish number."""
@@ -180,15 +192,24 @@ def snailfish_sum(snlist: list) -> Snailfish:
     return total
 
 
+@parse_stage
+def parse(input_data: str) -> list:
+    """Returns the list of snailfish numbers; both parts accept it.
+
+    Adding a snailfish number reduces it in place, which leaves an
+    already reduced number (like those of the puzzle) unchanged."""
+    return [Snailfish(s) for s in input_data.split()]
+
+
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
-    sn_list = [Snailfish(s) for s in input_data.split()]
+    sn_list = parse(input_data)
     return snailfish_sum(sn_list).magnitude()
 
 
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
-    sn_list = [Snailfish(s) for s in input_data.split()]
+    sn_list = parse(input_data)
     n = len(sn_list)
     return max(sn_list[i].add(sn_list[j]).magnitude()
                for i in range(n)
@@ -197,6 +218,8 @@ def part_b(input_data: str) -> int:
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=18)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
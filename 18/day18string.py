@@ -7,7 +7,10 @@ and explode operations anyway.
 """
 
 
-from aocd.models import Puzzle
+
+from aoc import stats
+from aoc.stage import parse_stage
+
 
 def find_bracket_depth(s: str, depth: int) -> int:
     """Return the first index at which the bracket depth is found.
@@ -100,16 +103,24 @@ def add(s1: str, s2: str) -> str:
 def reduce(s: str) -> str:
     """Returns a fully reduced snailfish number."""
 
+    explodes, splits = 0, 0
     while True:
         attempt = explode(s)
         if attempt != "":
             s = attempt
+            explodes += 1
             continue
         attempt = split(s)
         if attempt != "":
             s = attempt
+            splits += 1
             continue
         break
+
+    counters = stats.current()
+    if counters is not None:
+        counters["explodes"] += explodes
+        counters["splits"] += splits
     return s
 
 
@@ -129,9 +140,15 @@ def magnitude(s: str) -> int:
     return -1
 
 
+@parse_stage
+def parse(input_data: str) -> list:
+    """Returns the snailfish numbers as strings; both parts accept them."""
+    return input_data.split()
+
+
 def homework(data: str) -> int:
     """Returns the magnitude of a snailfish homework assignment."""
-    lines = data.split()
+    lines = parse(data)
     sum = reduce(lines[0])
     for sn in lines[1:]:
         sum = reduce(add(sum, sn))
@@ -139,7 +156,7 @@ def homework(data: str) -> int:
 
 def max_pair_sum(data: str) -> int:
     """Returns the maximum magnitude of the sums of pairs of snailfish numbers."""
-    lines = data.split()
+    lines = parse(data)
     return max(magnitude(reduce(add(a,b)))
                for a in lines
                for b in lines
@@ -159,6 +176,8 @@ def part_b(input_data: str) -> int:
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=18)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
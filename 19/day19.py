@@ -1,11 +1,12 @@
 """Solves day 19, Advent of Code 2021."""
 
-from aocd.models import Puzzle
 import numpy as np
 import re
-from io import StringIO
 from collections import namedtuple
 
+from aoc.ints import read_ints
+from aoc.stage import parse_stage
+
 Fingerprint = namedtuple("Fingerprint", "all_dists each_dist")
 
 def parse_data(input_data: str) -> list:
@@ -14,9 +15,32 @@ def parse_data(input_data: str) -> list:
     # split input data into a list of csv-formatted beacon data
     scanners = re.split("--- scanner .* ---", input_data)[1:]
     
-    # convert the csv data into numpy.arrays
-    return [np.loadtxt(StringIO(scanner),delimiter=',',dtype=int)
-            for scanner in scanners]
+    # convert the csv data into (n x 3) numpy.arrays
+    return [read_ints(scanner, columns=3) for scanner in scanners]
+
+
+@parse_stage
+def parse(input_data: str) -> tuple:
+    """Returns each scanner's beacon data, as part_ab accepts it."""
+
+    return tuple(parse_data(input_data))
+
+
+# Bump when parse or its array form changes, to invalidate cached parses.
+PARSE_VERSION = 1
+
+
+def to_arrays(beacon_data: tuple) -> dict:
+    """Returns all scanners' beacons in one array, with the number of
+    beacons of each scanner, for aoc.parse_cache."""
+    return {"beacons": np.vstack(beacon_data),
+            "counts": np.array([len(s) for s in beacon_data])}
+
+
+def from_arrays(arrays: dict) -> tuple:
+    """Returns each scanner's beacon data given by to_arrays."""
+    ends = np.cumsum(arrays["counts"])[:-1]
+    return tuple(np.split(arrays["beacons"], ends))
 
 
 def fingerprint(s: np.array) -> Fingerprint:
@@ -158,7 +182,8 @@ def reconcile_beacon_data(beacon_data: list) -> list:
 
 def part_ab(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
-    beacon_data = parse_data(input_data)
+    # reconcile_beacon_data works in-place, on a copy of the parsed list
+    beacon_data = list(parse(input_data))
     scanners_list = reconcile_beacon_data(beacon_data)
 
     all_beacons = np.vstack(beacon_data)
@@ -174,6 +199,8 @@ def part_ab(input_data: str) -> int:
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=19)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
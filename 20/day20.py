@@ -1,9 +1,14 @@
 """Solves day 20, Advent of Code 2021."""
 
-from aocd.models import Puzzle
 import numpy as np
 from dataclasses import dataclass
 
+from aoc import checkpoint
+from aoc.grid import read_grid, table
+from aoc.stage import parse_stage
+
+PIXELS = table({".": 0, "#": 1})
+
 @dataclass
 class Image:
     """Represents the image that's being enhanced."""
@@ -15,11 +20,17 @@ def parse_input(input_data: str) -> (np.array, Image):
     """Returns the enhancement algorithm and the initial image."""
     alg_str = input_data[0:512]
     algorithm = np.array([c == '#' for c in alg_str], dtype=int)
-    lines = input_data[512:].split()
-    data = np.array([[c == '#' for c in line] for line in lines], dtype=int)
+    data = read_grid(input_data[512:].lstrip(), PIXELS)
     return algorithm, Image(data=data, background=0)
 
 
+@parse_stage
+def parse(input_data: str) -> (np.array, Image):
+    """Returns the algorithm and initial image; both parts accept them."""
+
+    return parse_input(input_data)
+
+
 def enhancement_index(e: np.array) -> np.array:
     """Given an (m+2)x(n+2) binary valued array, return a mxn index array.
     
@@ -48,25 +59,50 @@ def enhance(algorithm: np.array, im: Image) -> Image:
     return Image(data = new_data, background = new_background)
 
 
+def lit_after(input_data: str, steps: int) -> int:
+    """Returns the number of lit pixels after enhancing the image steps times.
+
+    With checkpoints (see aoc.checkpoint), the enhancements carry on from
+    the latest one saved for the same input, up to steps."""
+
+    al, im = parse(input_data)
+    step = 0
+    sim = checkpoint.simulation("day20", al, im.data)
+    if sim is not None:
+        step, arrays = sim.resume(steps)
+        if arrays is not None:
+            im = Image(data=arrays["data"].astype(int),
+                       background=int(arrays["background"]))
+
+    def state():
+        return {"data": im.data.astype(np.uint8),
+                "background": np.array(im.background)}
+
+    while step < steps:
+        im = enhance(al, im)
+        step += 1
+        if sim is not None:
+            sim.save_if_due(step, state)
+    if sim is not None:
+        sim.save(step, state())
+    return im.data.sum()
+
+
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    al, im = parse_input(input_data)
-    im = enhance(al, im)
-    im = enhance(al, im)
-    return im.data.sum()
+    return lit_after(input_data, 2)
 
 
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    al, im = parse_input(input_data)
-    for count in range(50):
-        im = enhance(al, im)
-    return im.data.sum()
+    return lit_after(input_data, 50)
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=20)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -1,22 +1,36 @@
 """Solves day 21, Advent of Code 2021."""
 
-from aocd.models import Puzzle
-from parse import parse
 from collections import namedtuple
+import re
+
+from aoc.memo import memo
+from aoc.stage import parse_stage
+
+STARTING_POSITIONS = re.compile(r"Player 1 starting position: (\d+)\n"
+                                r"Player 2 starting position: (\d+)")
+
 
 def parse_input(input_data: str) -> (int, int):
     """Returns the starting positions of players 1 and 2."""
 
-    return parse("Player 1 starting position: {:d}\n"
-                 "Player 2 starting position: {:d}",
-                 input_data).fixed
+    match = STARTING_POSITIONS.fullmatch(input_data)
+    if match is None:
+        raise ValueError(f"Unexpected starting positions: {input_data}")
+    return tuple(int(p) for p in match.groups())
+
+
+@parse_stage
+def parse(input_data: str) -> (int, int):
+    """Returns the starting positions; both parts accept them."""
+
+    return parse_input(input_data)
 
 
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
     MAX_SCORE = 1000
-    pos_1, pos_2 = parse_input(input_data)
+    pos_1, pos_2 = parse(input_data)
     score_1, score_2 = 0, 0
     next_face = 1
     num_rolls = 0
@@ -54,7 +68,9 @@ def part_a(input_data: str) -> int:
 GameState = namedtuple("GameState", "pos_1 pos_2 score_1 score_2")
 
 
-def dirac_dice(gs: GameState, _cache:dict={}) -> (int, int):
+# enough for every state: two positions and two scores below 21
+@memo(maxsize=10 * 10 * 21 * 21)
+def dirac_dice(gs: GameState) -> (int, int):
     """Returns the numbers of universes in which each player wins.
 
     Assumes player 1 moves next, and player 1's score is < 21."""
@@ -62,9 +78,6 @@ def dirac_dice(gs: GameState, _cache:dict={}) -> (int, int):
     if gs.score_2 >= 21:
         return (0, 1)
 
-    if gs in _cache:
-        return _cache[gs]
-
     def advance_player1(s: GameState, roll: int) -> GameState:
         """Returns a new state by applying a roll to player 1."""
         newpos = (s.pos_1 + roll - 1) % 10 + 1
@@ -88,22 +101,47 @@ def dirac_dice(gs: GameState, _cache:dict={}) -> (int, int):
     # results adjusted for correct counting and switching player label
     results = [(f*rr[1], f*rr[0]) for f, rr in zip(freqs, raw_results)]
     wins_tuple = tuple(sum(wins) for wins in zip(*results))
-    
-    _cache[gs] = wins_tuple
     return wins_tuple
 
 
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
-    pos_1, pos_2 = parse_input(input_data)
+    pos_1, pos_2 = parse(input_data)
     gs = GameState(pos_1=pos_1, pos_2=pos_2,
                    score_1=0, score_2=0)
-    wins_1, wins_2 = dirac_dice(gs)
+    with dirac_dice.scope():
+        wins_1, wins_2 = dirac_dice(gs)
     return max(wins_1, wins_2)
 
 
+# There are only 100 possible inputs (pairs of starting positions), so
+# batches solve each distinct pair once.
+
+def part_a_batch(inputs: list) -> list:
+    """Returns the solutions for part A of many inputs."""
+
+    starts = [parse(input_data) for input_data in inputs]
+    solutions = {s: part_a(s) for s in set(starts)}
+    return [solutions[s] for s in starts]
+
+
+def part_b_batch(inputs: list) -> list:
+    """Returns the solutions for part B of many inputs, from one table
+    of game states shared by all of them."""
+
+    starts = [parse(input_data) for input_data in inputs]
+    solutions = {}
+    with dirac_dice.scope():
+        for pos_1, pos_2 in set(starts):
+            gs = GameState(pos_1=pos_1, pos_2=pos_2, score_1=0, score_2=0)
+            solutions[pos_1, pos_2] = max(dirac_dice(gs))
+    return [solutions[s] for s in starts]
+
+
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=21)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
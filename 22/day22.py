@@ -1,9 +1,12 @@
 """Solves day 22, Advent of Code 2021."""
 
-from aocd.models import Puzzle
-from parse import parse
 from collections import namedtuple
 import numpy as np
+import re
+
+from aoc import stats
+from aoc.ints import read_ints
+from aoc.stage import parse_stage
 
 
 # a Cuboid specifies a set of integer coordinate points {(x,y,z)}
@@ -14,15 +17,51 @@ Cuboid = namedtuple("Cuboid", "x1 x2 y1 y2 z1 z2")
 # into a state of "on" or "off".
 RebootStep = namedtuple("RebootStep", "state cuboid")
 
+REBOOT_STEP = re.compile(r"^(\w+) x=-?\d+\.\.-?\d+,y=-?\d+\.\.-?\d+,z=-?\d+\.\.-?\d+$",
+                         re.MULTILINE)
+
+
 def parse_reboot_step(line: str) -> RebootStep:
     """Returns a reboot step."""
-    p = parse("{} x={:d}..{:d},y={:d}..{:d},z={:d}..{:d}", line)
-    return RebootStep(p[0], Cuboid(*p[1:]))
+    return parse_input_data(line)[0]
 
 
 def parse_input_data(input_data: str) -> list:
     """Returns a list of reboot steps."""
-    return [parse_reboot_step(line) for line in input_data.split('\n')]
+    states = REBOOT_STEP.findall(input_data)
+    if len(states) != input_data.count('\n') + 1:
+        raise ValueError("Expected one reboot step per line")
+    cuboids = read_ints(input_data, columns=6)
+    return [RebootStep(state, Cuboid(*c))
+            for state, c in zip(states, cuboids.tolist())]
+
+
+@parse_stage
+def parse(input_data: str) -> list:
+    """Returns the list of reboot steps; both parts accept it."""
+
+    return parse_input_data(input_data)
+
+
+# Bump when parse or its array form changes, to invalidate cached parses.
+PARSE_VERSION = 1
+
+
+def to_arrays(steps: list) -> dict:
+    """Returns the reboot steps as a (n x 6) cuboid table and their on/off
+    states, for aoc.parse_cache."""
+    for s in steps:
+        if s.state not in ("on", "off"):
+            raise ValueError(f"Unknown state: '{s.state}'")
+    return {"cuboids": np.array([s.cuboid for s in steps],
+                                dtype=np.int64).reshape(-1, 6),
+            "on": np.array([s.state == "on" for s in steps])}
+
+
+def from_arrays(arrays: dict) -> list:
+    """Returns the list of reboot steps given by to_arrays."""
+    return [RebootStep("on" if on else "off", Cuboid(*c))
+            for on, c in zip(arrays["on"].tolist(), arrays["cuboids"].tolist())]
 
 
 class InitRegion():
@@ -37,12 +76,13 @@ class InitRegion():
         
         # translate reactor-core-coord range to np.array range,
         # keeping in mind that np.array range is x1 <= x < x2
+        # (upper bounds are kept >= 0, lest they count from the end)
         x1 = max(r.cuboid.x1+50, 0)
-        x2 = min(r.cuboid.x2+51, 101)
+        x2 = max(min(r.cuboid.x2+51, 101), 0)
         y1 = max(r.cuboid.y1+50, 0)
-        y2 = min(r.cuboid.y2+51, 101)
+        y2 = max(min(r.cuboid.y2+51, 101), 0)
         z1 = max(r.cuboid.z1+50, 0)
-        z2 = min(r.cuboid.z2+51, 101)
+        z2 = max(min(r.cuboid.z2+51, 101), 0)
         if r.state == "on":
             value = 1
         elif r.state == "off":
@@ -61,7 +101,7 @@ def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
     ir = InitRegion()
-    for step in parse_input_data(input_data):
+    for step in parse(input_data):
         ir.apply_step(step)
     return ir.total_cubes_on()
 
@@ -132,12 +172,13 @@ def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
 
     active = set()
+    splits, pieces = 0, 0
     # Loop invariant:
     # active is a set of nonoverlapping cuboids which contain
     # exactly those points which are currently turned on,
     # considering all the steps processed up to that iteration.
 
-    for rbs in parse_input_data(input_data):
+    for rbs in parse(input_data):
         # Find the cuboids that overlap this reboot step's cuboid.
         overlaps = {c for c in active
                     if cuboids_overlap(c, rbs.cuboid)}
@@ -145,6 +186,8 @@ def part_b(input_data: str) -> int:
         # Partition them into pieces excluding this step's cuboid.
         overlap_differences = [cuboid_difference(o, rbs.cuboid)
                                for o in overlaps]
+        splits += len(overlaps)
+        pieces += sum(len(d) for d in overlap_differences)
 
         # Replace the overlapping cuboids with the nonoverlapping pieces.
         active -= overlaps
@@ -154,10 +197,16 @@ def part_b(input_data: str) -> int:
         if rbs.state == "on":
             active |= {rbs.cuboid}
 
+    counters = stats.current()
+    if counters is not None:
+        counters["cuboid_splits"] += splits
+        counters["cuboid_pieces"] += pieces
     return sum(cuboid_volume(c) for c in active)
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=22)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -112,3 +112,9 @@ def test_part_a():
 def test_part_b():
     """Test the solution on sample data for part B."""
     assert day22.part_b(sample_input_data_b) == sample_solution_b
+
+
+def test_init_region_ignores_outside_steps():
+    """Steps just below the initialization region change nothing."""
+    data = "on x=-60..-55,y=-60..-55,z=-60..-55\non x=0..0,y=0..0,z=0..0"
+    assert day22.part_a(data) == 1
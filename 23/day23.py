@@ -1,10 +1,12 @@
 """Solves day 23, Advent of Code 2021."""
 
 import math
-from aocd.models import Puzzle
-from parse import parse
+from parse import parse as parse_format
 from collections import namedtuple
 
+from aoc.memo import memo
+from aoc.stage import parse_stage
+
 
 """The full state is a tuple of one hall state and four room states.
 
@@ -39,7 +41,7 @@ def parse_input_data(input_data: str) -> State:
   #{}#{}#{}#{}#
   #########"""
 
-    p = parse(input_format, input_data)
+    p = parse_format(input_format, input_data)
     if p == None:
         raise ValueError(f"Couldn't parse input: {input_data}")
     return State(hall_state="...........",
@@ -48,6 +50,13 @@ def parse_input_data(input_data: str) -> State:
                               p[2]+p[6],
                               p[3]+p[7]))
 
+
+@parse_stage
+def parse(input_data: str) -> State:
+    """Returns the starting State; both parts accept it."""
+
+    return parse_input_data(input_data)
+
 def print_state(s: State):
     """Prints a human-readable representation of the state."""
     print(s.hall_state)
@@ -165,39 +174,50 @@ INPUT_GOAL_A = """#############
   #########"""
 
 
-GOAL_STATE_A = parse_input_data(INPUT_GOAL_A)
+# The state of INPUT_GOAL_A, built directly so that importing the module
+# does no parsing.
+GOAL_STATE_A = State(hall_state="...........",
+                     room_states=("AA", "BB", "CC", "DD"))
 GOAL_STATE_B = augment_room_states(GOAL_STATE_A, ("AA","BB","CC","DD"))
 
 
-def min_organize_cost(s: State, _cache = {GOAL_STATE_A: 0, GOAL_STATE_B: 0}) -> int:
+# Bounds the memory of a solve; evicted states are simply searched again.
+MEMO_BYTES = 256 << 20
+
+
+@memo(maxbytes=MEMO_BYTES, counters=("cache_hits", "states_expanded"))
+def min_organize_cost(s: State) -> int:
     """Returns the minimum movement cost to the goal state from a given state."""
-    if s in _cache:
-        return _cache[s]
-    
+    if s == GOAL_STATE_A or s == GOAL_STATE_B:
+        return 0
+
     min_cost = math.inf
     for new_state, move_cost in all_moves(s):
         trial_cost = min_organize_cost(new_state) + move_cost
         min_cost = min(min_cost, trial_cost)
 
-    _cache[s] = min_cost
     return min_cost
 
     
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    s = parse_input_data(input_data)
-    return min_organize_cost(s)
+    s = parse(input_data)
+    with min_organize_cost.scope():
+        return min_organize_cost(s)
 
 
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
-    folded_state = parse_input_data(input_data)
+    folded_state = parse(input_data)
     full_state = augment_room_states(folded_state, ("DD", "CB", "BA", "AC"))
-    return min_organize_cost(full_state)
+    with min_organize_cost.scope():
+        return min_organize_cost(full_state)
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=23)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
@@ -22,3 +22,8 @@ def test_part_a():
 def test_part_b():
     """Test the solution on sample data for part B."""
     assert day23.part_b(sample_input_data) == sample_solution_b
+
+
+def test_goal_state():
+    """The goal state built at import matches the parsed goal input."""
+    assert day23.parse_input_data(day23.INPUT_GOAL_A) == day23.GOAL_STATE_A
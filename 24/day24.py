@@ -1,7 +1,8 @@
 """Solves day 24, Advent of Code 2021."""
 
-from aocd.models import Puzzle
-import parse
+import re
+
+from aoc.stage import parse_stage
 
 """The puzzle input is highly constrained, taking the form of 18 repeated
 groups of 14 ALU instructions, as in:"""
@@ -25,6 +26,10 @@ add y {B:d}
 mul y x
 add z y"""
 
+# PATTERN as a regex, in which each {X:d} field is an integer group named X
+OPERATION = re.compile(re.sub(r"\\\{(\w):d\\\}", r"(?P<\1>-?\\d+)",
+                              re.escape(PATTERN)))
+
 
 """Call a group of 18 such instructions one 'operation'.
 
@@ -89,9 +94,10 @@ def parse_input(input_data: str) -> list:
 
     Raises an error if our specific assumptions are not met."""
 
-    results = [r.named for r in parse.findall(PATTERN, p.input_data)]
+    results = [{k: int(v) for k, v in m.groupdict().items()}
+               for m in OPERATION.finditer(input_data)]
     pattern_lines = len(PATTERN.split('\n'))
-    input_lines = len(p.input_data.split('\n'))
+    input_lines = len(input_data.split('\n'))
     
     if input_lines != pattern_lines * len(results):
         raise ValueError("The input did not match the expected pattern.")
@@ -109,6 +115,13 @@ def parse_input(input_data: str) -> list:
 
     return results
 
+
+@parse_stage
+def parse(input_data: str) -> list:
+    """Returns the list of operations; both parts accept it."""
+
+    return parse_input(input_data)
+
 def extremize_model(operations: list, maximize: bool) -> int:
     digits_list = [0] * len(operations)
     stack = []
@@ -134,17 +147,19 @@ def extremize_model(operations: list, maximize: bool) -> int:
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
 
-    ops = parse_input(input_data)
+    ops = parse(input_data)
     return extremize_model(ops, maximize=True)
 
 
 def part_b(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part B."""
-    ops = parse_input(input_data)
+    ops = parse(input_data)
     return extremize_model(ops, maximize=False)
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=24)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
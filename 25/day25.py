@@ -1,8 +1,36 @@
 """Solves day 25, Advent of Code 2021."""
 
-from aocd.models import Puzzle
-
 import numpy as np
+from collections import defaultdict
+
+from aoc import checkpoint
+from aoc.grid import read_grid, table
+from aoc.stage import parse_stage
+
+HERDS = table({".": 0, ">": 1, "v": 2})
+
+
+@parse_stage
+def parse(input_data: str) -> np.array:
+    """Returns the chart of the herds (see Cucumbers); part_a accepts it."""
+
+    chart = read_grid(input_data, HERDS)
+    chart.flags.writeable = False
+    return chart
+
+
+# Bump when parse or its array form changes, to invalidate cached parses.
+PARSE_VERSION = 2
+
+
+def to_arrays(chart: np.array) -> dict:
+    """Returns the chart as named arrays, for aoc.parse_cache."""
+    return {"chart": chart}
+
+
+def from_arrays(arrays: dict) -> np.array:
+    """Returns the chart given by to_arrays."""
+    return arrays["chart"]
 
 
 class Cucumbers():
@@ -20,48 +48,93 @@ class Cucumbers():
     an axis to check whether movement will occur in that direction.
 
     Then we use boolean-valued indexing to update the array
-    with any changes."""
+    with any changes.
+
+    The chart may also be a stack of equally sized charts (with the
+    two axes above as its last two), which then move all at once."""
     
     def __init__(self, input_data: str):
-        """Initialize the cucumbers from the input data."""
-        s = input_data.replace('.','0')
-        s = s.replace('>','1')
-        s = s.replace('v','2')
-        self.chart = np.array([[digit for digit in line]
-                               for line in s.split('\n')], dtype=int)
+        """Initialize the cucumbers from the input data (or its parse)."""
+        # the herds move in place, so they get their own copy of the chart
+        self.chart = parse(input_data).copy()
 
     def move_east(self) -> bool:
-        """Move the eastward cucumbers.  Returns True if any moved."""
-        east_step = np.roll(self.chart, shift=-1, axis=1)
+        """Move the eastward cucumbers.  Returns True if any moved
+        (for a stack, an array of whether any moved in each chart)."""
+        east_step = np.roll(self.chart, shift=-1, axis=-1)
         place_empty = (self.chart == 1) & (east_step == 0)
-        place_east_cucumber = np.roll(place_empty, shift=1, axis=1)
+        place_east_cucumber = np.roll(place_empty, shift=1, axis=-1)
         self.chart[place_empty] = 0
         self.chart[place_east_cucumber] = 1
-        return np.any(place_east_cucumber)
+        return np.any(place_east_cucumber, axis=(-2, -1))
 
     def move_south(self) -> bool:
-        """Move the southward cucumbers.  Returns True if any moved."""
-        south_step = np.roll(self.chart, shift=-1, axis=0)
+        """Move the southward cucumbers.  Returns True if any moved
+        (for a stack, an array of whether any moved in each chart)."""
+        south_step = np.roll(self.chart, shift=-1, axis=-2)
         place_empty = (self.chart == 2) & (south_step == 0)
-        place_south_cucumber = np.roll(place_empty, shift=1, axis=0)
+        place_south_cucumber = np.roll(place_empty, shift=1, axis=-2)
         self.chart[place_empty] = 0
         self.chart[place_south_cucumber] = 2
-        return np.any(place_south_cucumber)
+        return np.any(place_south_cucumber, axis=(-2, -1))
         
 
 def part_a(input_data: str) -> int:
-    """Given the puzzle input data, return the solution for part A."""
+    """Given the puzzle input data, return the solution for part A.
+
+    With checkpoints (see aoc.checkpoint), the steps resume from the
+    latest one saved for the same chart."""
     c = Cucumbers(input_data)
     moves = 1
+    sim = checkpoint.simulation("day25", c.chart)
+    if sim is not None:
+        done, arrays = sim.resume()
+        if arrays is not None:
+            c.chart = arrays["chart"]
+            moves = done + 1
     while True:
         moved_east = c.move_east()
         moved_south = c.move_south()
         if not (moved_east or moved_south):
+            if sim is not None:
+                # the last step left the chart as it was
+                sim.save(moves - 1, {"chart": c.chart})
             return moves
+        if sim is not None:
+            sim.save_if_due(moves, lambda: {"chart": c.chart})
         moves += 1
 
 
+def part_a_batch(inputs: list) -> list:
+    """Returns the solutions for part A of many inputs.
+
+    The charts of the same size are stacked and move together, each
+    leaving the stack on the first step on which none of its cucumbers
+    move."""
+
+    charts = [parse(input_data) for input_data in inputs]
+    solutions = [None] * len(charts)
+    by_shape = defaultdict(list)
+    for i, chart in enumerate(charts):
+        by_shape[chart.shape].append(i)
+
+    for indices in by_shape.values():
+        indices = np.array(indices)
+        c = Cucumbers(np.stack([charts[i] for i in indices]))
+        moves = 1
+        while len(indices):
+            moved = c.move_east() | c.move_south()
+            for i in indices[~moved]:
+                solutions[i] = moves
+            c.chart = c.chart[moved]
+            indices = indices[moved]
+            moves += 1
+    return solutions
+
+
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=25)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")
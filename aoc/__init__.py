@@ -0,0 +1 @@
+"""Shared tooling for running and measuring the Advent of Code 2021 solutions."""
@@ -0,0 +1,58 @@
+"""Solves one part of one day for many inputs at once.
+
+    answers = solve_batch(6, "b", inputs)
+
+A module can solve a batch itself with a part_a_batch (part_b_batch, ...)
+function, taking a list of inputs and returning the list of answers;
+those work on all the inputs together, e.g. as the rows of one array, or
+share what the inputs have in common.  For parts without one, the inputs
+are shared out in chunks over a pool of worker processes, or solved one
+by one for a single worker."""
+
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc import days
+
+# How many chunks of a batch to give each worker, to even out their loads.
+CHUNKS_PER_WORKER = 4
+
+
+def batch_function(module: days.DayModule, part: str):
+    """Returns the module's batch function for a part label, or None."""
+    return getattr(module.load(), f"{days.PART_FUNCTIONS[part]}_batch", None)
+
+
+def solve_chunk(module: days.DayModule, part: str, inputs: list) -> list:
+    """Solves a part for each of a list of inputs, one by one."""
+    solve = module.part_function(part)
+    return [solve(input_data) for input_data in inputs]
+
+
+def solve_batch(day: int, part: str, inputs: list, module: str = None,
+                workers: int = None) -> list:
+    """Returns the answers of one part for each of the inputs, in order,
+    from the named module or else the day's main module.
+
+    Without a batch function, the inputs are solved over a pool of
+    workers processes (by default, one per CPU), or in this process
+    if workers is 1."""
+    name = module or f"day{day:02d}"
+    m = next((m for m in days.discover() if m.name == name and m.day == day),
+             None)
+    if m is None:
+        raise ValueError(f"No solution module {name} for day {day}")
+    inputs = list(inputs)
+
+    batch = batch_function(m, part)
+    if batch is not None:
+        return batch(inputs)
+    workers = workers or os.cpu_count() or 1
+    if workers == 1 or len(inputs) <= 1:
+        return solve_chunk(m, part, inputs)
+    size = math.ceil(len(inputs) / (workers * CHUNKS_PER_WORKER))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunks = [inputs[i:i + size] for i in range(0, len(inputs), size)]
+        futures = [pool.submit(solve_chunk, m, part, chunk) for chunk in chunks]
+        return [answer for f in futures for answer in f.result()]
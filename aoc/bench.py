@@ -0,0 +1,289 @@
+"""Benchmarks the solutions on generated inputs of increasing size.
+
+Usage:
+    python -m aoc.bench run [DAY_OR_MODULE ...] [-o bench.json] [--quick]
+    python -m aoc.bench imports [DAY_OR_MODULE ...] [-o imports.json]
+    python -m aoc.bench compare BASELINE_JSON CURRENT_JSON [--threshold 0.25]
+
+For each part of each module, run times every size in BENCH_SIZES for
+that day, measures the peak traced memory, and fits the empirical
+complexity exponent k in time ~ size**k.  Variant modules (e.g.
+day15_faster) are also reported relative to the day's main module.
+
+imports imports each module in a fresh interpreter with -X importtime,
+and records how long the import took in all and its slowest imports.
+
+compare flags every benchmark whose time or peak memory at some size
+(or whose import time) has grown by more than the threshold (a
+fraction), and exits with status 1 if there are any."""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import time
+import tracemalloc
+
+from aoc import days, generators, stage
+
+# Input sizes to benchmark for each day; see aoc.generators for what
+# they count.  Days 21 and 23 have fixed-size inputs, and the day11
+# solution only handles the 10x10 puzzle grid.
+BENCH_SIZES = {
+    1: (10000, 100000, 1000000),
+    2: (10000, 100000, 1000000),
+    3: (1000, 10000, 100000),
+    4: (100, 1000, 5000),
+    5: (250, 1000, 4000),
+    6: (1000, 10000, 100000),
+    7: (1000, 10000, 100000),
+    8: (1000, 10000, 50000),
+    9: (50, 100, 200),
+    10: (1000, 10000, 50000),
+    11: (10,),
+    12: (4, 8, 12),
+    13: (1000, 10000, 100000),
+    14: (1000, 10000, 100000),
+    15: (20, 40, 80),
+    16: (100, 400, 1600),
+    17: (20, 40, 80),
+    18: (20, 40, 80),
+    19: (8, 16, 32, 64),
+    20: (50, 100, 200),
+    21: (0,),
+    22: (100, 300, 1000),
+    23: (0,),
+    24: (7, 70, 700),
+    25: (50, 100, 200),
+}
+
+# Runs shorter than this are too noisy to fit an exponent to.
+MIN_FIT_TIME = 1e-3
+
+# How many of the slowest imports to record for each module.
+SLOWEST_IMPORTS = 5
+
+
+def measure(func, data, repeat: int = 3, memory: bool = True) -> tuple:
+    """Returns the best time of repeat calls of func(data), and the peak
+    traced memory (in bytes) of one more call, or None if not measured.
+
+    Remembered parses are forgotten before each call, so that every call
+    parses and solves."""
+    best = math.inf
+    for _ in range(repeat):
+        stage.clear()
+        start = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - start)
+    peak = None
+    if memory:
+        stage.clear()
+        tracemalloc.start()
+        try:
+            func(data)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return best, peak
+
+
+def fit_exponent(sizes: list, times: list):
+    """Returns the least-squares slope of log(time) against log(size).
+
+    Sizes that are not positive, or that ran too quickly to time
+    reliably, are left out.  Returns None without two usable points."""
+    points = [(math.log(s), math.log(t)) for s, t in zip(sizes, times)
+              if s > 0 and t >= MIN_FIT_TIME]
+    if len({x for x, _ in points}) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    return (sum((x - mean_x) * (y - mean_y) for x, y in points) /
+            sum((x - mean_x)**2 for x, _ in points))
+
+
+def bench_key(module_name: str, part: str) -> str:
+    """Returns the key of a benchmark in the results."""
+    return f"{module_name}:{part}"
+
+
+def bench_part(module: days.DayModule, part: str, sizes: list,
+               repeat: int = 3, memory: bool = True) -> dict:
+    """Benchmarks one part of one module at each size."""
+    func = module.part_function(part)
+    times, peaks = [], []
+    for size in sizes:
+        data = generators.generate_text(module.day, size)
+        t, peak = measure(func, data, repeat, memory)
+        times.append(t)
+        peaks.append(peak)
+    return {"module": module.name, "day": module.day, "part": part,
+            "sizes": list(sizes), "times": times, "peaks": peaks,
+            "exponent": fit_exponent(sizes, times)}
+
+
+def relative_speeds(benchmarks: dict) -> dict:
+    """Returns how much faster each variant module is than the main one.
+
+    The speedup is the main module's time over the variant's time,
+    at the largest size."""
+    relative = {}
+    for key, b in benchmarks.items():
+        main_name = f"day{b['day']:02d}"
+        main = benchmarks.get(bench_key(main_name, b["part"]))
+        if b["module"] == main_name or main is None:
+            continue
+        relative[key] = {"reference": bench_key(main_name, b["part"]),
+                         "size": b["sizes"][-1],
+                         "speedup": main["times"][-1] / b["times"][-1]}
+    return relative
+
+
+def run(modules: list, quick: bool = False, repeat: int = 3,
+        memory: bool = True, log=None) -> dict:
+    """Benchmarks every part of the given modules."""
+    benchmarks = {}
+    for m in modules:
+        sizes = BENCH_SIZES[m.day][:2] if quick else BENCH_SIZES[m.day]
+        for part in m.parts():
+            b = bench_part(m, part, sizes, repeat, memory)
+            benchmarks[bench_key(m.name, part)] = b
+            if log is not None:
+                log(format_benchmark(b))
+    return {"benchmarks": benchmarks, "relative": relative_speeds(benchmarks)}
+
+
+def import_times(module: days.DayModule) -> dict:
+    """Imports a module in a fresh interpreter and returns how long that
+    took, in seconds: in all, and for each of the slowest imports it made
+    (by the time spent in the imported module itself)."""
+    command = [sys.executable, "-X", "importtime", "-c", f"import {module.name}"]
+    path = [str(days.REPO_ROOT), str(module.path.parent)]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(path)}
+    result = subprocess.run(command, env=env, capture_output=True, text=True,
+                            check=True)
+    # lines look like "import time:  self [us] | cumulative | imported package",
+    # with a module's own line after the (more indented) lines of the
+    # imports it made
+    total, imports, nested = None, [], []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_time, cumulative, name = line[len("import time:"):].split("|")
+        if name.startswith("  "):
+            nested.append((name.strip(), int(self_time) / 1e6))
+            continue
+        if name.strip() == module.name:
+            total = int(cumulative) / 1e6
+            imports = nested
+        nested = []
+    imports.sort(key=lambda i: i[1], reverse=True)
+    return {"module": module.name, "day": module.day, "total": total,
+            "slowest": imports[:SLOWEST_IMPORTS]}
+
+
+def format_import_times(t: dict) -> str:
+    """Returns a one-line summary of a module's import times."""
+    slowest = ", ".join(f"{name} {s * 1000:.1f}ms" for name, s in t["slowest"])
+    return f"{t['module']:<14} {t['total'] * 1000:7.1f}ms  ({slowest})"
+
+
+def format_benchmark(b: dict) -> str:
+    """Returns a one-line summary of a benchmark."""
+    exponent = "-" if b["exponent"] is None else f"{b['exponent']:.2f}"
+    timings = "  ".join(f"{s}: {t:.4f}s" for s, t in zip(b["sizes"], b["times"]))
+    return f"{bench_key(b['module'], b['part']):<16} k={exponent:<5}  {timings}"
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.25) -> list:
+    """Returns descriptions of the regressions from baseline to current.
+
+    A regression is a time or peak memory, at a size benchmarked in both,
+    that has grown by more than the threshold fraction."""
+    regressions = []
+    for key, new in current.get("benchmarks", {}).items():
+        old = baseline.get("benchmarks", {}).get(key)
+        if old is None:
+            continue
+        old_at = {s: (t, p) for s, t, p in zip(old["sizes"], old["times"], old["peaks"])}
+        for size, t, peak in zip(new["sizes"], new["times"], new["peaks"]):
+            if size not in old_at:
+                continue
+            old_t, old_peak = old_at[size]
+            if t > old_t * (1 + threshold) and t >= MIN_FIT_TIME:
+                regressions.append(f"{key} size {size}: time {old_t:.4f}s -> {t:.4f}s")
+            if (peak is not None and old_peak is not None and
+                    peak > old_peak * (1 + threshold)):
+                regressions.append(f"{key} size {size}: peak memory "
+                                   f"{old_peak} -> {peak} bytes")
+    for name, new in current.get("imports", {}).items():
+        old = baseline.get("imports", {}).get(name)
+        if (old is not None and new["total"] > old["total"] * (1 + threshold)
+                and new["total"] >= MIN_FIT_TIME):
+            regressions.append(f"{name}: import time {old['total']:.4f}s -> "
+                               f"{new['total']:.4f}s")
+    return regressions
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.bench",
+        description="Benchmark Advent of Code 2021 solutions on generated inputs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("selectors", nargs="*", metavar="DAY_OR_MODULE")
+    run_parser.add_argument("-o", "--output", help="write the results here")
+    run_parser.add_argument("--quick", action="store_true",
+                            help="only benchmark the two smallest sizes")
+    run_parser.add_argument("--repeat", type=int, default=3)
+    run_parser.add_argument("--no-memory", action="store_true",
+                            help="skip measuring peak memory")
+
+    imports_parser = commands.add_parser("imports", help="time the imports")
+    imports_parser.add_argument("selectors", nargs="*", metavar="DAY_OR_MODULE")
+    imports_parser.add_argument("-o", "--output", help="write the results here")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.25,
+                                help="allowed growth, as a fraction")
+    args = parser.parse_args(argv)
+
+    if args.command == "run":
+        results = run(days.select(args.selectors), quick=args.quick,
+                      repeat=args.repeat, memory=not args.no_memory,
+                      log=print)
+        for key, r in results["relative"].items():
+            print(f"{key:<16} {r['speedup']:.2f}x the speed of {r['reference']}"
+                  f" at size {r['size']}")
+        if args.output is not None:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+    elif args.command == "imports":
+        results = {"imports": {}}
+        for m in days.select(args.selectors):
+            t = import_times(m)
+            results["imports"][m.name] = t
+            print(format_import_times(t))
+        if args.output is not None:
+            with open(args.output, "w") as f:
+                json.dump(results, f, indent=2)
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        for r in regressions:
+            print(r)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
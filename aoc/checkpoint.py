@@ -0,0 +1,149 @@
+"""Checkpoints of long-running simulations, so that they can resume.
+
+The simulations that step a state many times (day 11's octopuses, day
+14's polymer, day 20's image and day 25's herds) save their state now
+and then, as named numpy arrays with the number of steps taken, into the
+checkpoints of the current context, which are None unless someone has
+asked for them:
+
+    with checkpoint.saving("checkpoints"):
+        day20.part_b(input_data)
+
+A simulation started again on the same input resumes from its latest
+checkpoint instead of from step 0, and one run for more steps (e.g. day
+20's image enhanced 100 times, after 50) carries on from where the
+shorter run stopped.  In a solution:
+
+    sim = checkpoint.simulation("day20", algorithm, image.data)
+    step, arrays = sim.resume(steps) if sim is not None else (0, None)
+    ...
+        if sim is not None:
+            sim.save_if_due(step, state)   # state() returns the arrays
+
+A simulation's checkpoints are kept in ROOT/NAME/KEY/, KEY being a hash
+of its initial state, as STEP.npz files, of which only the latest KEEP
+are kept.  Each is written to a temporary file and then renamed, so that
+a run stopped while saving leaves the previous checkpoint intact.
+
+aoc.run saves checkpoints when given --checkpoints DIR, or when the
+AOC_CHECKPOINTS environment variable names a directory.
+
+numpy and hashlib are only imported once checkpoints are in use, so that
+importing a day that can be checkpointed stays cheap."""
+
+import contextlib
+import contextvars
+import os
+import time
+from pathlib import Path
+
+# How often a simulation saves its state, in seconds.
+INTERVAL = 60.0
+
+# How many of a simulation's checkpoints to keep.
+KEEP = 2
+
+_checkpoints = contextvars.ContextVar("aoc_checkpoints", default=None)
+
+
+def state_key(*parts) -> str:
+    """Returns a hash of a simulation's initial state: arrays, str or bytes."""
+    import hashlib
+    import numpy as np
+
+    h = hashlib.sha256()
+    for part in parts:
+        if isinstance(part, str):
+            part = part.encode()
+        if isinstance(part, np.ndarray):
+            h.update(f"{part.dtype.str}{part.shape}".encode())
+            part = memoryview(np.ascontiguousarray(part)).cast("B")
+        h.update(len(part).to_bytes(8, "little"))
+        h.update(part)
+    return h.hexdigest()
+
+
+class Checkpoints:
+    """A directory of the checkpoints of simulations."""
+
+    def __init__(self, root, interval: float = INTERVAL):
+        self.root = Path(root)
+        self.interval = interval
+
+
+class Simulation:
+    """The checkpoints of one simulation of one initial state."""
+
+    def __init__(self, path: Path, interval: float = INTERVAL):
+        self.path = Path(path)
+        self.interval = interval
+        self.last_saved = time.monotonic()
+
+    def steps(self) -> list:
+        """Returns the steps at which there are checkpoints, in order."""
+        if not self.path.is_dir():
+            return []
+        return sorted(int(p.stem) for p in self.path.glob("*.npz")
+                      if p.stem.isdigit())
+
+    def resume(self, max_step: int = None) -> tuple:
+        """Returns the step and arrays of the latest checkpoint at or before
+        max_step (by default, the latest of all), or (0, None) if none."""
+        import numpy as np
+
+        steps = [s for s in self.steps() if max_step is None or s <= max_step]
+        if not steps:
+            return 0, None
+        with np.load(self.path / f"{steps[-1]}.npz") as npz:
+            return steps[-1], dict(npz)
+
+    def save(self, step: int, arrays: dict):
+        """Saves the state after step steps, and drops the oldest checkpoints."""
+        import tempfile
+        import numpy as np
+
+        self.path.mkdir(parents=True, exist_ok=True)
+        fd, work = tempfile.mkstemp(dir=self.path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                np.savez(f, **arrays)
+            os.replace(work, self.path / f"{step}.npz")
+        finally:
+            if os.path.exists(work):
+                os.unlink(work)
+        self.last_saved = time.monotonic()
+        for old in self.steps()[:-KEEP]:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(self.path / f"{old}.npz")
+
+    def save_if_due(self, step: int, state):
+        """Saves the state after step steps, if the interval has passed
+        since the last save.  state() returns its arrays."""
+        if time.monotonic() - self.last_saved >= self.interval:
+            self.save(step, state())
+
+
+def simulation(name: str, *initial) -> Simulation:
+    """Returns the checkpoints of a simulation of some initial state (see
+    state_key) in the current context, or None if none are being saved."""
+    checkpoints = _checkpoints.get()
+    if checkpoints is None:
+        return None
+    return Simulation(checkpoints.root / name / state_key(*initial),
+                      checkpoints.interval)
+
+
+@contextlib.contextmanager
+def saving(root, interval: float = INTERVAL):
+    """Saves and resumes the simulations run within the block, in root."""
+    checkpoints = Checkpoints(root, interval)
+    token = _checkpoints.set(checkpoints)
+    try:
+        yield checkpoints
+    finally:
+        _checkpoints.reset(token)
+
+
+def default_root():
+    """Returns the directory named by AOC_CHECKPOINTS, or None if not set."""
+    return os.environ.get("AOC_CHECKPOINTS") or None
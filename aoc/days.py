@@ -0,0 +1,95 @@
+"""Discovers and loads the dayNN solution modules.
+
+Each day's solutions live in NN/dayNN.py, sometimes alongside variants
+such as NN/day15_faster.py or NN/day17sim.py.  A solution module provides
+part_a and part_b (or part_ab, when both answers come from one solve)."""
+
+import importlib.util
+import re
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+YEAR = 2021
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+MODULE_NAME = re.compile(r"day(\d\d)\w*")
+
+PART_FUNCTIONS = {"a": "part_a", "b": "part_b", "ab": "part_ab"}
+
+
+@dataclass(frozen=True)
+class DayModule:
+    """A solution module, e.g. day15 or its variant day15_faster."""
+    name: str
+    day: int
+    path: Path
+
+    def load(self):
+        """Imports the module (once per process) and returns it."""
+        module = sys.modules.get(self.name)
+        if module is not None and Path(module.__file__).resolve() == self.path:
+            return module
+        spec = importlib.util.spec_from_file_location(self.name, self.path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[self.name] = module
+        try:
+            spec.loader.exec_module(module)
+        except BaseException:
+            del sys.modules[self.name]
+            raise
+        return module
+
+    def parts(self) -> list:
+        """Returns the part labels ('a', 'b' or 'ab') the module can solve."""
+        module = self.load()
+        return [part for part, func in PART_FUNCTIONS.items()
+                if callable(getattr(module, func, None))]
+
+    def part_function(self, part: str):
+        """Returns the module's solution function for a part label."""
+        return getattr(self.load(), PART_FUNCTIONS[part])
+
+    def parse_function(self):
+        """Returns the module's own parse stage, or None if it has none.
+
+        Only a parse function defined in the module itself counts, so that
+        e.g. an imported parse.parse is not mistaken for a parse stage."""
+        module = self.load()
+        func = getattr(module, "parse", None)
+        if callable(func) and getattr(func, "__module__", None) == module.__name__:
+            return func
+        return None
+
+
+def discover(root: Path = REPO_ROOT) -> list:
+    """Returns all solution modules under root, ordered by day and name."""
+    modules = []
+    for path in root.glob("[0-9][0-9]/day*.py"):
+        match = MODULE_NAME.fullmatch(path.stem)
+        if match and match.group(1) == path.parent.name:
+            modules.append(DayModule(name=path.stem,
+                                     day=int(match.group(1)),
+                                     path=path.resolve()))
+    return sorted(modules, key=lambda m: (m.day, m.name))
+
+
+def select(selectors: list, root: Path = REPO_ROOT) -> list:
+    """Returns the solution modules matching the selectors.
+
+    A selector is either a day number ('15' selects day15 and day15_faster)
+    or a module name ('day15_faster').  No selectors selects everything."""
+    modules = discover(root)
+    if not selectors:
+        return modules
+    selected = []
+    for sel in selectors:
+        if sel.isdigit():
+            matches = [m for m in modules if m.day == int(sel)]
+        else:
+            matches = [m for m in modules if m.name == sel]
+        if not matches:
+            raise ValueError(f"No solution module matches '{sel}'")
+        selected.extend(m for m in matches if m not in selected)
+    return selected
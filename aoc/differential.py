@@ -0,0 +1,144 @@
+"""Checks alternative implementations of a day against their references.
+
+Usage:
+    python -m aoc.differential [DAY_OR_MODULE ...] [--quick] [--seeds N]
+                               [-o differential.json]
+
+An implementation registers for checking by naming the module whose
+answers it must agree with, e.g. in day15_faster.py:
+
+    REFERENCE_IMPLEMENTATION = "day15"
+
+For every part that both solve, each such pair is run on generated inputs
+of every size in aoc.bench.BENCH_SIZES for the day, with several seeds
+at each size.  Every input on which their answers differ (or on which
+either raises) is reported as a mismatch, and the reference's time over
+the implementation's time at each size is recorded as its speedup.
+Exits with status 1 if there are any mismatches."""
+
+import argparse
+import json
+import sys
+import time
+
+from aoc import bench, days, generators, stage
+
+# How many inputs to generate at each size.
+SEEDS = 3
+
+
+def reference(module: days.DayModule) -> days.DayModule:
+    """Returns the module's registered reference implementation, or None.
+    Raises ValueError if it names a module that does not exist."""
+    name = getattr(module.load(), "REFERENCE_IMPLEMENTATION", None)
+    if name is None:
+        return None
+    for m in days.discover():
+        if m.name == name and m.day == module.day:
+            return m
+    raise ValueError(f"{module.name}: no reference implementation {name}")
+
+
+def pairs(modules: list) -> list:
+    """Returns the (implementation, reference) pairs among the modules: those
+    with a registered reference, and those that are some module's reference."""
+    found = []
+    for m in days.discover():
+        ref = reference(m)
+        if ref is not None and (m in modules or ref in modules):
+            found.append((m, ref))
+    return found
+
+
+def timed_answer(func, data) -> tuple:
+    """Returns func(data), or a description of what it raised, and how long
+    it took.  Remembered parses are forgotten first."""
+    stage.clear()
+    start = time.perf_counter()
+    try:
+        answer = func(data)
+    except Exception as e:
+        answer = f"{type(e).__name__}: {e}"
+    return answer, time.perf_counter() - start
+
+
+def check_pair(module: days.DayModule, ref: days.DayModule, part: str,
+               sizes: list, seeds: int = SEEDS) -> dict:
+    """Runs one part of an implementation and of its reference on the same
+    generated inputs, and returns their mismatches and relative speed."""
+    func, ref_func = module.part_function(part), ref.part_function(part)
+    times, ref_times, mismatches = [], [], []
+    for size in sizes:
+        total = ref_total = 0.0
+        for seed in range(seeds):
+            data = generators.generate_text(module.day, size, seed=seed)
+            answer, t = timed_answer(func, data)
+            ref_answer, ref_t = timed_answer(ref_func, data)
+            total += t
+            ref_total += ref_t
+            if answer != ref_answer:
+                mismatches.append({"size": size, "seed": seed, "answer": answer,
+                                   "reference_answer": ref_answer})
+        times.append(total)
+        ref_times.append(ref_total)
+    return {"module": module.name, "reference": ref.name, "day": module.day,
+            "part": part, "sizes": list(sizes), "seeds": seeds,
+            "times": times, "reference_times": ref_times,
+            "speedups": [r / t for r, t in zip(ref_times, times)],
+            "mismatches": mismatches}
+
+
+def run(modules: list, quick: bool = False, seeds: int = SEEDS,
+        log=None) -> list:
+    """Checks every part of every pair among the modules."""
+    checks = []
+    for m, ref in pairs(modules):
+        sizes = bench.BENCH_SIZES[m.day]
+        sizes = sizes[:2] if quick else sizes
+        for part in m.parts():
+            if part not in ref.parts():
+                continue
+            check = check_pair(m, ref, part, sizes, seeds)
+            checks.append(check)
+            if log is not None:
+                log(format_check(check))
+    return checks
+
+
+def format_check(check: dict) -> str:
+    """Returns a one-line summary of a check."""
+    status = f"{len(check['mismatches'])} MISMATCHES" if check["mismatches"] else "ok"
+    speedups = "  ".join(f"{s}: {x:.2f}x"
+                         for s, x in zip(check["sizes"], check["speedups"]))
+    return (f"{bench.bench_key(check['module'], check['part']):<16} "
+            f"vs {check['reference']:<12} {status:<14} {speedups}")
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.differential",
+        description="Check alternative Advent of Code 2021 solutions "
+                    "against their reference implementations.")
+    parser.add_argument("selectors", nargs="*", metavar="DAY_OR_MODULE")
+    parser.add_argument("--quick", action="store_true",
+                        help="only check the two smallest sizes")
+    parser.add_argument("--seeds", type=int, default=SEEDS,
+                        help="inputs to generate at each size")
+    parser.add_argument("-o", "--output", help="write the results here")
+    args = parser.parse_args(argv)
+
+    checks = run(days.select(args.selectors), quick=args.quick,
+                 seeds=args.seeds, log=print)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump({"checks": checks}, f, indent=2)
+    for check in checks:
+        for m in check["mismatches"]:
+            print(f"{check['module']}:{check['part']} size {m['size']} seed "
+                  f"{m['seed']}: {m['answer']!r} != {m['reference_answer']!r}")
+    if any(check["mismatches"] for check in checks):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
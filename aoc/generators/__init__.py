@@ -0,0 +1,66 @@
+"""Seeded generators of synthetic puzzle inputs, one module per day.
+
+Each module aoc.generators.dayNN provides
+
+    generate(size: int, rng: random.Random, **options) -> Iterator[str]
+
+which yields the input text in chunks, so that inputs far larger than
+memory can be written out.  What size counts (readings, boards, scanners,
+grid rows, ...) is described in each module's docstring.  Like the real
+puzzle inputs, generated inputs have no trailing newline.
+
+Usage:
+    python -m aoc.generators DAY SIZE [--seed N] [-o FILE] [-p KEY=VALUE ...]"""
+
+import importlib
+import random
+
+# Lines are joined into chunks of about this many characters.
+CHUNK_SIZE = 1 << 16
+
+
+def generator(day: int):
+    """Returns the generator module for a day."""
+    return importlib.import_module(f"aoc.generators.day{day:02d}")
+
+
+def generate(day: int, size: int, seed: int = 0, **options):
+    """Yields the chunks of a generated input for a day."""
+    return generator(day).generate(size, random.Random(seed), **options)
+
+
+def generate_text(day: int, size: int, seed: int = 0, **options) -> str:
+    """Returns a whole generated input for a day as one string."""
+    return "".join(generate(day, size, seed, **options))
+
+
+def write(day: int, size: int, file, seed: int = 0, **options):
+    """Writes a generated input for a day to a text file object."""
+    for chunk in generate(day, size, seed, **options):
+        file.write(chunk)
+
+
+def chunks(items, sep: str = "\n"):
+    """Joins an iterable of strings with sep, yielding chunks of the result."""
+    pending = []
+    pending_size = 0
+    first = True
+    for item in items:
+        if not first:
+            pending.append(sep)
+        first = False
+        pending.append(item)
+        pending_size += len(item) + 1
+        if pending_size >= CHUNK_SIZE:
+            yield "".join(pending)
+            pending = []
+            pending_size = 0
+    if pending:
+        yield "".join(pending)
+
+
+def grid_lines(rows: int, cols: int, rng: random.Random,
+               symbols: str, weights: list = None):
+    """Yields the rows of a random grid of symbols."""
+    for _ in range(rows):
+        yield "".join(rng.choices(symbols, weights=weights, k=cols))
@@ -0,0 +1,37 @@
+"""Command line interface to the input generators; see aoc.generators."""
+
+import argparse
+import sys
+
+from aoc import generators
+
+
+def option(text: str) -> tuple:
+    """Parses a KEY=VALUE generator option, with an int value."""
+    key, _, value = text.partition("=")
+    return key, int(value)
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.generators",
+        description="Generate a synthetic Advent of Code 2021 puzzle input.")
+    parser.add_argument("day", type=int)
+    parser.add_argument("size", type=int)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    parser.add_argument("-p", "--option", type=option, action="append",
+                        default=[], metavar="KEY=VALUE",
+                        help="generator-specific option, e.g. -p width=20")
+    args = parser.parse_args(argv)
+
+    options = dict(args.option)
+    if args.output is None:
+        generators.write(args.day, args.size, sys.stdout, args.seed, **options)
+    else:
+        with open(args.output, "w") as f:
+            generators.write(args.day, args.size, f, args.seed, **options)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,15 @@
+"""Generates day 01 inputs: size sonar depth readings."""
+
+from aoc.generators import chunks
+
+
+def generate(size: int, rng, start: int = 150):
+    """Yields a random walk of depth readings, mostly increasing."""
+
+    def depths():
+        depth = start
+        for _ in range(size):
+            depth = max(0, depth + rng.randint(-12, 20))
+            yield str(depth)
+
+    return chunks(depths())
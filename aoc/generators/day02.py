@@ -0,0 +1,15 @@
+"""Generates day 02 inputs: size submarine commands."""
+
+from aoc.generators import chunks
+
+HEADINGS = ("forward", "down", "up")
+
+
+def generate(size: int, rng):
+    """Yields commands, with down somewhat more likely than up."""
+
+    def commands():
+        for heading in rng.choices(HEADINGS, weights=(4, 3, 2), k=size):
+            yield f"{heading} {rng.randint(1, 9)}"
+
+    return chunks(commands())
@@ -0,0 +1,37 @@
+"""Generates day 03 inputs: size diagnostic numbers in binary.
+
+The width option sets the number of bits; by default it is just wide
+enough to hold size distinct numbers, and at least 12."""
+
+from aoc.generators import chunks
+
+
+def generate(size: int, rng, width: int = None):
+    """Yields binary numbers that give unique life support ratings.
+
+    Part B filters the numbers bit by bit until one is left, which fails
+    if two or more remaining numbers all share the next bit.  So the
+    numbers are generated as the leaves of a random binary trie in which
+    every group of two or more numbers sharing a prefix is split by the
+    following bit."""
+
+    if width is None:
+        width = max(12, (size - 1).bit_length())
+    if size > 2**width:
+        raise ValueError(f"Cannot make {size} distinct {width}-bit numbers")
+
+    def numbers(prefix: int, depth: int, n: int):
+        """Yields n numbers starting with the depth bits of prefix."""
+        if n == 1:
+            rest = width - depth
+            yield (prefix << rest) | rng.getrandbits(rest)
+            return
+        capacity = 2**(width - depth - 1)
+        k = round(n * rng.uniform(0.3, 0.7))
+        k = max(1, n - capacity, min(k, n - 1, capacity))
+        yield from numbers(2 * prefix, depth + 1, k)
+        yield from numbers(2 * prefix + 1, depth + 1, n - k)
+
+    if size == 0:
+        return iter(())
+    return chunks(format(x, f"0{width}b") for x in numbers(0, 0, size))
@@ -0,0 +1,22 @@
+"""Generates day 04 inputs: size bingo boards.
+
+Every number in range(numbers) is drawn, so every board wins eventually."""
+
+from aoc.generators import chunks
+
+
+def generate(size: int, rng, numbers: int = 100):
+    """Yields the draws followed by the boards."""
+
+    draws = list(range(numbers))
+    rng.shuffle(draws)
+    yield ",".join(map(str, draws))
+
+    def board():
+        values = rng.sample(range(numbers), 25)
+        return "\n".join(" ".join(f"{v:2d}" for v in values[r*5:(r+1)*5])
+                         for r in range(5))
+
+    if size > 0:
+        yield "\n\n"
+        yield from chunks((board() for _ in range(size)), sep="\n\n")
@@ -0,0 +1,24 @@
+"""Generates day 05 inputs: size vent line segments.
+
+Segments are horizontal, vertical or diagonal at 45 degrees, and lie
+within a field x, y < field."""
+
+from aoc.generators import chunks
+
+
+def generate(size: int, rng, field: int = 1000):
+    """Yields line segments."""
+
+    def segments():
+        for _ in range(size):
+            x1, y1 = rng.randrange(field), rng.randrange(field)
+            dx, dy = rng.choice([(1, 0), (-1, 0), (0, 1), (0, -1),
+                                 (1, 1), (1, -1), (-1, 1), (-1, -1)])
+            # longest length keeping the other end inside the field
+            limits = [field - 1 - x1 if dx > 0 else x1,
+                      field - 1 - y1 if dy > 0 else y1]
+            max_length = min(lim for lim, d in zip(limits, (dx, dy)) if d)
+            length = rng.randint(0, max_length)
+            yield f"{x1},{y1} -> {x1 + dx*length},{y1 + dy*length}"
+
+    return chunks(segments())
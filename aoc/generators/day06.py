@@ -0,0 +1,8 @@
+"""Generates day 06 inputs: size lanternfish timers."""
+
+from aoc.generators import chunks
+
+
+def generate(size: int, rng):
+    """Yields comma-separated timers between 1 and 5."""
+    return chunks((str(rng.randint(1, 5)) for _ in range(size)), sep=",")
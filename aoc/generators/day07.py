@@ -0,0 +1,13 @@
+"""Generates day 07 inputs: size crab positions below max_position."""
+
+from aoc.generators import chunks
+
+
+def generate(size: int, rng, max_position: int = 2000):
+    """Yields comma-separated positions, clustered towards low values."""
+
+    def positions():
+        for _ in range(size):
+            yield str(min(max_position - 1, int(rng.expovariate(4 / max_position))))
+
+    return chunks(positions(), sep=",")
@@ -0,0 +1,24 @@
+"""Generates day 08 inputs: size seven-segment display notes."""
+
+from aoc.generators import chunks
+
+DIGIT_SEGMENTS = ("abcefg", "cf", "acdeg", "acdfg", "bcdf",
+                  "abdfg", "abdefg", "acf", "abcdefg", "abcdfg")
+
+
+def generate(size: int, rng):
+    """Yields one line per display, each with its own wire scrambling."""
+
+    def scrambled(digit: int, wiring: dict) -> str:
+        wires = [wiring[s] for s in DIGIT_SEGMENTS[digit]]
+        rng.shuffle(wires)
+        return "".join(wires)
+
+    def notes():
+        for _ in range(size):
+            wiring = dict(zip("abcdefg", rng.sample("abcdefg", 7)))
+            patterns = [scrambled(d, wiring) for d in rng.sample(range(10), 10)]
+            outputs = [scrambled(rng.randrange(10), wiring) for _ in range(4)]
+            yield " ".join(patterns) + " | " + " ".join(outputs)
+
+    return chunks(notes())
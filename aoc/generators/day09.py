@@ -0,0 +1,11 @@
+"""Generates day 09 inputs: a heightmap of size rows and width columns.
+
+About a third of the heights are 9, which splits the map into basins."""
+
+from aoc.generators import chunks, grid_lines
+
+
+def generate(size: int, rng, width: int = None):
+    """Yields the rows of a heightmap."""
+    return chunks(grid_lines(size, width or size, rng, "0123456789",
+                             weights=[7] * 9 + [33]))
@@ -0,0 +1,44 @@
+"""Generates day 10 inputs: size lines of navigation subsystem chunks.
+
+Each line is either corrupted or incomplete, and there is always an odd
+number of incomplete lines, so that part B has a middle score."""
+
+from aoc.generators import chunks
+
+PAIRS = {"(": ")", "[": "]", "{": "}", "<": ">"}
+
+
+def generate(size: int, rng, length: int = 100):
+    """Yields lines of about the given length."""
+
+    def line(corrupt: bool) -> str:
+        chars = []
+        expected = []
+        for _ in range(rng.randint(length // 2, length)):
+            if expected and rng.random() < 0.45:
+                chars.append(expected.pop())
+            else:
+                opening = rng.choice("([{<")
+                chars.append(opening)
+                expected.append(PAIRS[opening])
+        if not expected:
+            chars.append("(")
+            expected.append(")")
+        if corrupt:
+            # the line ends at its first illegal character
+            chars.append(rng.choice([c for c in PAIRS.values()
+                                     if c != expected[-1]]))
+        return "".join(chars)
+
+    def lines():
+        incomplete = 0
+        for i in range(size):
+            if i == size - 1:
+                # make the number of incomplete lines odd
+                corrupt = incomplete % 2 == 1
+            else:
+                corrupt = rng.random() < 0.5
+            incomplete += not corrupt
+            yield line(corrupt)
+
+    return chunks(lines())
@@ -0,0 +1,50 @@
+"""Generates day 11 inputs: an octopus grid of size rows and width columns.
+
+About half of all random grids never flash simultaneously, and part B
+would never finish on them.  So by default grids are simulated for up to
+synchronize_within steps, and only a grid that synchronizes is used.
+Pass synchronize_within=0 to skip the check (and stream huge grids).
+
+Note that the day11 solution only handles the 10x10 grid of the puzzle."""
+
+import numpy as np
+
+from aoc.generators import chunks, grid_lines
+
+
+def synchronizes(energy: np.array, steps: int) -> bool:
+    """Returns True if all octopuses flash together within the given steps."""
+    energy = energy.copy()
+    for _ in range(steps):
+        energy += 1
+        flashed = np.zeros(energy.shape, dtype=bool)
+        while True:
+            flashing = (energy > 9) & ~flashed
+            if not flashing.any():
+                break
+            flashed |= flashing
+            padded = np.pad(flashing, 1).astype(int)
+            rows, cols = energy.shape
+            energy += sum(padded[1+di:1+di+rows, 1+dj:1+dj+cols]
+                          for di in (-1, 0, 1) for dj in (-1, 0, 1)
+                          if di or dj)
+        energy[flashed] = 0
+        if flashed.all():
+            return True
+    return False
+
+
+def generate(size: int, rng, width: int = None,
+             synchronize_within: int = 1000, attempts: int = 1000):
+    """Yields the rows of an energy level grid."""
+
+    width = width or size
+    if not synchronize_within:
+        return chunks(grid_lines(size, width, rng, "0123456789"))
+    for _ in range(attempts):
+        lines = list(grid_lines(size, width, rng, "0123456789"))
+        energy = np.array([[int(c) for c in line] for line in lines])
+        if synchronizes(energy, synchronize_within):
+            return chunks(lines)
+    raise ValueError(f"No synchronizing {size}x{width} grid found "
+                     f"in {attempts} attempts")
@@ -0,0 +1,42 @@
+"""Generates day 12 inputs: a cave system with size small caves.
+
+There is one big cave for every three small ones.  Big caves are never
+connected to each other, which would allow infinitely many paths."""
+
+from aoc.generators import chunks
+
+
+def cave_name(i: int) -> str:
+    """Returns a distinct two-or-more letter lowercase name for index i."""
+    name = ""
+    while True:
+        name = chr(ord("a") + i % 26) + name
+        i //= 26
+        if i == 0 and len(name) >= 2:
+            return name
+
+
+def generate(size: int, rng):
+    """Yields the cave connections."""
+
+    small = [cave_name(i) for i in range(size)]
+    big = [cave_name(i).upper() for i in range(max(1, size // 3))]
+
+    def connections():
+        linked = set()
+
+        def link(a: str, b: str):
+            if a != b and (a, b) not in linked and (b, a) not in linked:
+                linked.add((a, b))
+                return f"{a}-{b}"
+            return None
+
+        candidates = [link("start", c) for c in rng.sample(small + big, min(3, size))]
+        candidates += [link(c, "end") for c in rng.sample(small + big, min(3, size))]
+        for cave in big:
+            candidates += [link(cave, c) for c in rng.sample(small, min(3, size))]
+        for cave in small:
+            candidates.append(link(cave, rng.choice(small)))
+        yield from (c for c in candidates if c is not None)
+
+    return chunks(connections())
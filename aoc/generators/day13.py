@@ -0,0 +1,39 @@
+"""Generates day 13 inputs: size dots on transparent paper, and the folds.
+
+The dots are placed on a folded sheet of final_width x final_height and
+then unfolded, each fold reflecting a dot or not at random.  So every fold
+is along the middle of the paper, and no dot lies on a fold line."""
+
+from aoc.generators import chunks
+
+
+def generate(size: int, rng, folds: int = 12,
+             final_width: int = 40, final_height: int = 6):
+    """Yields the dots, then the fold instructions."""
+
+    # unfold the paper, remembering the fold lines
+    width, height = final_width, final_height
+    unfolds = []
+    for _ in range(folds):
+        if rng.random() < 0.5:
+            unfolds.append(("x", width))
+            width = 2 * width + 1
+        else:
+            unfolds.append(("y", height))
+            height = 2 * height + 1
+
+    def dots():
+        for _ in range(size):
+            x, y = rng.randrange(final_width), rng.randrange(final_height)
+            for axis, line in unfolds:
+                if rng.random() < 0.5:
+                    if axis == "x":
+                        x = 2 * line - x
+                    else:
+                        y = 2 * line - y
+            yield f"{x},{y}"
+
+    yield from chunks(dots())
+    yield "\n\n"
+    yield "\n".join(f"fold along {axis}={line}"
+                    for axis, line in reversed(unfolds))
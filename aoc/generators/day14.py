@@ -0,0 +1,17 @@
+"""Generates day 14 inputs: a polymer template of size elements.
+
+There is an insertion rule for every pair of the first elements letters."""
+
+import string
+
+from aoc.generators import chunks
+
+
+def generate(size: int, rng, elements: int = 10):
+    """Yields the template followed by the insertion rules."""
+
+    letters = string.ascii_uppercase[:elements]
+    yield from chunks((rng.choice(letters) for _ in range(size)), sep="")
+    yield "\n\n"
+    yield "\n".join(f"{a}{b} -> {rng.choice(letters)}"
+                    for a in letters for b in letters)
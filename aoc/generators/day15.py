@@ -0,0 +1,8 @@
+"""Generates day 15 inputs: a risk map of size rows and width columns."""
+
+from aoc.generators import chunks, grid_lines
+
+
+def generate(size: int, rng, width: int = None):
+    """Yields the rows of a risk level map."""
+    return chunks(grid_lines(size, width or size, rng, "123456789"))
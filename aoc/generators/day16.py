@@ -0,0 +1,51 @@
+"""Generates day 16 inputs: a BITS transmission of about size packets.
+
+Operator packets always use length type ID 1 (a count of subpackets),
+because a count is known before the subpackets are generated, which lets
+the transmission be streamed."""
+
+from aoc.generators import CHUNK_SIZE
+
+OPERATORS = (0, 1, 2, 3, 5, 6, 7)
+
+COMPARISONS = (5, 6, 7)
+
+
+def generate(size: int, rng, max_depth: int = 12, max_subpackets: int = 5):
+    """Yields the transmission as hexadecimal text."""
+
+    remaining = size
+
+    def bits(value: int, width: int) -> str:
+        return format(value, f"0{width}b")
+
+    def packet(depth: int):
+        """Yields the bits of a packet (and its subpackets) as strings."""
+        nonlocal remaining
+        remaining -= 1
+        version = rng.randrange(8)
+        if remaining <= 0 or depth >= max_depth or rng.random() < 0.3:
+            groups = [rng.randrange(16) for _ in range(rng.randint(1, 4))]
+            yield bits(version, 3) + bits(4, 3)
+            yield "".join(("1" if i < len(groups) - 1 else "0") + bits(g, 4)
+                          for i, g in enumerate(groups))
+            return
+        type_id = rng.choice(OPERATORS)
+        if type_id in COMPARISONS:
+            count = 2
+        else:
+            count = rng.randint(1, max(1, min(max_subpackets, remaining)))
+        yield bits(version, 3) + bits(type_id, 3) + "1" + bits(count, 11)
+        for _ in range(count):
+            yield from packet(depth + 1)
+
+    pending = ""
+    for piece in packet(0):
+        pending += piece
+        if len(pending) >= CHUNK_SIZE:
+            n = len(pending) - len(pending) % 4
+            yield format(int(pending[:n], 2), f"0{n // 4}X")
+            pending = pending[n:]
+    if pending:
+        pending += "0" * (-len(pending) % 4)
+        yield format(int(pending, 2), f"0{len(pending) // 4}X")
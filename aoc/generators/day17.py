@@ -0,0 +1,14 @@
+"""Generates day 17 inputs: a target area at a distance of about size.
+
+The target is ahead of and below the launcher, as in the puzzle."""
+
+
+def generate(size: int, rng):
+    """Yields the target area description."""
+    size = max(size, 2)
+    x1 = rng.randint(size, 2 * size)
+    x2 = x1 + rng.randint(size // 5 + 1, size // 2 + 1)
+    y1 = -rng.randint(size, 2 * size)
+    y2 = y1 + rng.randint(size // 5 + 1, size // 2 + 1)
+    y2 = min(y2, -1)
+    yield f"target area: x={x1}..{x2}, y={y1}..{y2}"
@@ -0,0 +1,20 @@
+"""Generates day 18 inputs: size snailfish numbers.
+
+The numbers are already reduced: pairs are nested at most four deep and
+regular numbers are at most 9."""
+
+from aoc.generators import chunks
+
+
+def generate(size: int, rng):
+    """Yields one snailfish number per line."""
+
+    def element(depth: int) -> str:
+        if depth == 4 or rng.random() < 0.3:
+            return str(rng.randrange(10))
+        return pair(depth)
+
+    def pair(depth: int) -> str:
+        return f"[{element(depth + 1)},{element(depth + 1)}]"
+
+    return chunks(pair(0) for _ in range(size))
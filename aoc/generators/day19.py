@@ -0,0 +1,82 @@
+"""Generates day 19 inputs: size scanner reports.
+
+The scanners form a chain along the x axis, each spaced 1100 to 1250
+from the previous one, so that only neighbouring scanners overlap.  Each
+neighbouring pair shares the given number of beacons (the puzzle
+guarantees at least 12), and each report is rotated into one of the 24
+orientations of its scanner."""
+
+import itertools
+
+from aoc.generators import chunks
+
+RANGE = 1000
+
+
+def rotations() -> list:
+    """Returns the 24 rotation matrices, as tuples of rows."""
+    matrices = []
+    for perm in itertools.permutations(range(3)):
+        for signs in itertools.product((1, -1), repeat=3):
+            m = tuple(tuple(signs[r] if c == perm[r] else 0 for c in range(3))
+                      for r in range(3))
+            det = (m[0][0] * (m[1][1] * m[2][2] - m[1][2] * m[2][1])
+                   - m[0][1] * (m[1][0] * m[2][2] - m[1][2] * m[2][0])
+                   + m[0][2] * (m[1][0] * m[2][1] - m[1][1] * m[2][0]))
+            if det == 1:
+                matrices.append(m)
+    return matrices
+
+
+def generate(size: int, rng, shared: int = 12, extra: int = 2):
+    """Yields the scanner reports."""
+
+    orientations = rotations()
+
+    def next_position(p: tuple) -> tuple:
+        return (p[0] + rng.randint(1100, 1250),
+                p[1] + rng.randint(-150, 150),
+                p[2] + rng.randint(-150, 150))
+
+    def beacons_between(lows: tuple, highs: tuple, n: int) -> list:
+        return [tuple(rng.randint(lo, hi) for lo, hi in zip(lows, highs))
+                for _ in range(n)]
+
+    def shared_beacons(p: tuple, q: tuple) -> list:
+        """Beacons seen by the neighbouring scanners at p and q."""
+        lows = tuple(max(a, b) - RANGE for a, b in zip(p, q))
+        highs = tuple(min(a, b) + RANGE for a, b in zip(p, q))
+        return beacons_between(lows, highs, shared)
+
+    def own_beacons(prev: tuple, p: tuple, nxt: tuple) -> list:
+        """Beacons seen by the scanner at p and neither neighbour."""
+        lows = [c - RANGE for c in p]
+        highs = [c + RANGE for c in p]
+        if prev is not None:
+            lows[0] = prev[0] + RANGE + 1
+        if nxt is not None:
+            highs[0] = nxt[0] - RANGE - 1
+        return beacons_between(lows, highs, extra)
+
+    def report(k: int, p: tuple, beacons: list) -> str:
+        rot = orientations[0] if k == 0 else rng.choice(orientations)
+        rng.shuffle(beacons)
+        lines = [f"--- scanner {k} ---"]
+        for b in beacons:
+            rel = [b[i] - p[i] for i in range(3)]
+            lines.append(",".join(str(sum(r * x for r, x in zip(row, rel)))
+                                  for row in rot))
+        return "\n".join(lines)
+
+    def reports():
+        prev = None
+        p = (0, 0, 0)
+        behind = []
+        for k in range(size):
+            nxt = next_position(p) if k < size - 1 else None
+            ahead = shared_beacons(p, nxt) if nxt is not None else []
+            beacons = behind + own_beacons(prev, p, nxt) + ahead
+            yield report(k, p, beacons)
+            prev, p, behind = p, nxt, ahead
+
+    return chunks(reports(), sep="\n\n")
@@ -0,0 +1,17 @@
+"""Generates day 20 inputs: an image of size rows and width columns.
+
+If the algorithm lights every pixel of a dark neighbourhood, it darkens
+every pixel of a light one, so that the number of lit pixels stays finite
+after an even number of enhancements."""
+
+from aoc.generators import chunks, grid_lines
+
+
+def generate(size: int, rng, width: int = None):
+    """Yields the image enhancement algorithm and the input image."""
+    algorithm = [rng.choice("#.") for _ in range(512)]
+    if algorithm[0] == "#":
+        algorithm[511] = "."
+    yield "".join(algorithm)
+    yield "\n\n"
+    yield from chunks(grid_lines(size, width or size, rng, "#."))
@@ -0,0 +1,9 @@
+"""Generates day 21 inputs: the two starting positions.
+
+The input has a fixed size, so size is ignored."""
+
+
+def generate(size: int, rng):
+    """Yields the starting positions of players 1 and 2."""
+    yield (f"Player 1 starting position: {rng.randint(1, 10)}\n"
+           f"Player 2 starting position: {rng.randint(1, 10)}")
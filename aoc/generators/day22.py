@@ -0,0 +1,29 @@
+"""Generates day 22 inputs: size reboot steps.
+
+As in the puzzle, the first steps (up to init_steps of them) lie within
+the -50..50 initialization region, and the rest are large cuboids
+anywhere within -extent..extent."""
+
+from aoc.generators import chunks
+
+
+def generate(size: int, rng, init_steps: int = 20, extent: int = 100000):
+    """Yields the reboot steps."""
+
+    def axis_range(limit: int, length: tuple) -> str:
+        a = rng.randint(-limit, limit - length[0])
+        b = min(limit, a + rng.randint(*length))
+        return f"{a}..{b}"
+
+    def steps():
+        for i in range(size):
+            state = "on" if i == 0 or rng.random() < 0.7 else "off"
+            if i < init_steps:
+                limit, length = 50, (10, 50)
+            else:
+                limit, length = extent, (extent // 20, extent // 4)
+            ranges = ",".join(f"{axis}={axis_range(limit, length)}"
+                              for axis in "xyz")
+            yield f"{state} {ranges}"
+
+    return chunks(steps())
@@ -0,0 +1,15 @@
+"""Generates day 23 inputs: a shuffled burrow of amphipods.
+
+The input has a fixed size, so size is ignored.  A few arrangements
+can deadlock once the rooms are unfolded for part B, in which case the
+day23 solution reports a minimum cost of inf."""
+
+
+def generate(size: int, rng):
+    """Yields the burrow diagram."""
+    a = rng.sample("AABBCCDD", 8)
+    yield ("#############\n"
+           "#...........#\n"
+           f"###{a[0]}#{a[1]}#{a[2]}#{a[3]}###\n"
+           f"  #{a[4]}#{a[5]}#{a[6]}#{a[7]}#\n"
+           "  #########")
@@ -0,0 +1,49 @@
+"""Generates day 24 inputs: a MONAD program checking 2 * size digits.
+
+The program has the structure the day24 solution relies on: repeated
+groups of instructions (see day24.PATTERN), half of which push a digit
+onto a base-26 stack and half of which pop it, with the pushes and pops
+nested like brackets.  The parameters are chosen so that valid model
+numbers exist.  The puzzle's model numbers have 14 digits (size 7)."""
+
+from aoc.generators import chunks
+
+GROUP = """inp w
+mul x 0
+add x z
+mod x 26
+div z {I}
+add x {A}
+eql x w
+eql x 0
+mul y 0
+add y 25
+mul y x
+add y 1
+mul z y
+mul y 0
+add y w
+add y {B}
+mul y x
+add z y"""
+
+
+def generate(size: int, rng):
+    """Yields the instruction groups."""
+
+    def groups():
+        stack = []
+        pushes = 0
+        for _ in range(2 * size):
+            if pushes < size and (not stack or rng.random() < 0.5):
+                pushes += 1
+                b = rng.randint(1, 16)
+                stack.append(b)
+                yield GROUP.format(I=1, A=rng.randint(10, 16), B=b)
+            else:
+                pushed_b = stack.pop()
+                difference = rng.randint(-8, 8)
+                yield GROUP.format(I=26, A=difference - pushed_b,
+                                   B=rng.randint(1, 16))
+
+    return chunks(groups())
@@ -0,0 +1,25 @@
+"""Generates day 25 inputs: a sea cucumber chart of size rows and width columns.
+
+One full row of east-facing and one full column of south-facing cucumbers
+can never move, and no cucumber can pass them.  So every cucumber can
+only move a limited number of times, and the herds always stop."""
+
+from aoc.generators import chunks
+
+
+def generate(size: int, rng, width: int = None):
+    """Yields the rows of the chart."""
+
+    rows, cols = size, width or size
+    wall_row, wall_col = rng.randrange(rows), rng.randrange(cols)
+
+    def lines():
+        for r in range(rows):
+            if r == wall_row:
+                cells = [">"] * cols
+            else:
+                cells = rng.choices(".>v", weights=(45, 30, 25), k=cols)
+            cells[wall_col] = "v"
+            yield "".join(cells)
+
+    return chunks(lines())
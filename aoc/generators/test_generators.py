@@ -0,0 +1,61 @@
+"""Tests for the synthetic input generators."""
+
+from aoc import days, generators
+
+# Small sizes, so that every solution runs quickly on the generated input.
+SMALL_SIZES = {1: 50, 2: 50, 3: 50, 4: 5, 5: 30, 6: 10, 7: 20, 8: 10,
+               9: 10, 10: 9, 11: 10, 12: 6, 13: 40, 14: 20, 15: 12, 16: 30,
+               17: 10, 18: 6, 19: 5, 20: 10, 21: 0, 22: 30, 23: 0, 24: 7,
+               25: 10}
+
+# The day23 search takes seconds even on the puzzle-sized input.
+SLOW_DAYS = {23}
+
+
+def test_deterministic():
+    """The same seed gives the same input; another seed gives another."""
+    for day, size in SMALL_SIZES.items():
+        first = generators.generate_text(day, size, seed=3)
+        assert first == generators.generate_text(day, size, seed=3)
+        assert not first.endswith("\n")
+        if day != 21:
+            assert first != generators.generate_text(day, size, seed=4)
+
+
+def test_streaming():
+    """Large inputs come out in many chunks rather than one string."""
+    pieces = list(generators.generate(1, 100000))
+    assert len(pieces) > 1
+    assert max(map(len, pieces)) < 2 * generators.CHUNK_SIZE
+    assert "".join(pieces).count("\n") == 100000 - 1
+
+
+def test_solutions_accept_generated_inputs():
+    """Every solution solves the generated inputs without error."""
+    for m in days.discover():
+        if m.day in SLOW_DAYS:
+            continue
+        for seed in range(3):
+            data = generators.generate_text(m.day, SMALL_SIZES[m.day], seed=seed)
+            for part in m.parts():
+                assert m.part_function(part)(data) is not None
+
+
+def test_day03_ratings_are_unique():
+    """Every generated day03 input has unique life support ratings."""
+    day03 = days.select(["day03"])[0].load()
+    for size in [1, 2, 3, 17, 1000]:
+        data = generators.generate_text(3, size, seed=size)
+        assert len(set(data.split())) == size
+        day03.part_b(data)
+
+
+def test_day16_packet_count():
+    """A day16 transmission holds roughly the requested number of packets."""
+    day16 = days.select(["day16"])[0].load()
+    data = generators.generate_text(16, 40, seed=1)
+
+    def count(p) -> int:
+        return 1 + sum(count(sp) for sp in p.subpackets)
+
+    assert 40 <= count(day16.Packet(day16.parse_input(data))) < 60
@@ -0,0 +1,82 @@
+"""Loads character grids straight into compact uint8 arrays.
+
+read_grid() views the raw bytes of a grid through numpy, without making
+a Python object per character, and translates them with a 256-entry
+table, a block of rows at a time.  It accepts a str, bytes-like data or
+a memory-mapped file:
+
+    >>> read_grid("123\\n456")
+    array([[1, 2, 3],
+           [4, 5, 6]], dtype=uint8)
+    >>> read_grid(b"#.\\n.#", table({".": 0, "#": 1}))
+    array([[1, 0],
+           [0, 1]], dtype=uint8)
+
+Note that arithmetic on uint8 values stays in uint8 and wraps around
+past 255, so convert values (e.g. with int() or .tolist()) before
+summing them."""
+
+import numpy as np
+
+# The translation of a byte that is not part of the grid's alphabet.
+INVALID = 255
+
+# How many bytes of the grid to translate at a time.
+BLOCK_SIZE = 1 << 20
+
+LINE_BREAK = ord("\n")
+
+
+def table(symbols: dict) -> np.ndarray:
+    """Returns a translation table mapping each symbol to its value."""
+    t = np.full(256, INVALID, dtype=np.uint8)
+    for symbol, value in symbols.items():
+        t[ord(symbol)] = value
+    return t
+
+
+DIGITS = table({str(d): d for d in range(10)})
+
+
+def first_line_break(buffer: np.ndarray) -> int:
+    """Returns the index of the first line break, or the buffer's length."""
+    for start in range(0, len(buffer), BLOCK_SIZE):
+        hits = np.flatnonzero(buffer[start:start + BLOCK_SIZE] == LINE_BREAK)
+        if len(hits):
+            return start + int(hits[0])
+    return len(buffer)
+
+
+def read_grid(data, translation: np.ndarray = DIGITS) -> np.ndarray:
+    """Returns a rectangular grid of symbols, one row per line, translated
+    into a (rows x cols) uint8 array.
+
+    Trailing line breaks are ignored.  Raises ValueError if the lines are
+    not all the same length or hold a symbol outside the table."""
+
+    if isinstance(data, str):
+        data = data.encode()
+    buffer = np.frombuffer(data, dtype=np.uint8)
+    end = len(buffer)
+    while end and buffer[end - 1] in (ord("\n"), ord("\r")):
+        end -= 1
+    buffer = buffer[:end]
+
+    cols = first_line_break(buffer)
+    stride = cols + 1
+    rows = (len(buffer) + 1) // stride
+    if (len(buffer) != rows * stride - 1 or
+            np.any(buffer[cols::stride] != LINE_BREAK)):
+        raise ValueError("Grid lines are not all the same length")
+
+    # view the rows without their line breaks, and translate them
+    view = np.lib.stride_tricks.as_strided(buffer, shape=(rows, cols),
+                                           strides=(stride, 1), writeable=False)
+    grid = np.empty((rows, cols), dtype=np.uint8)
+    block_rows = max(1, BLOCK_SIZE // max(cols, 1))
+    for r in range(0, rows, block_rows):
+        block = translation[view[r:r + block_rows]]
+        if np.any(block == INVALID):
+            raise ValueError("Grid holds an unknown symbol")
+        grid[r:r + block_rows] = block
+    return grid
@@ -0,0 +1,237 @@
+"""Puzzle input providers.
+
+A provider's get(day) returns a PuzzleInput, a handle that reads nothing
+until its contents are asked for: as text, as bytes, as a binary stream
+or as a read-only memory map.  Providers:
+
+    AocdProvider:       fetches inputs with advent-of-code-data (network,
+                        token and aocd's own cache).
+    DirectoryProvider:  a directory stand-in for aocd, holding the inputs
+                        as YEAR/NN.txt files.
+    InputStore:         a local content-addressed store, keyed by
+                        (year, day, input hash), for hosts with no network.
+    MemoryProvider:     inputs held in memory, e.g. for tests.
+
+default_provider() picks the store or directory named by the
+AOC_INPUT_STORE or AOC_INPUT_DIR environment variables, or else aocd.
+
+Usage:
+    python -m aoc.inputs add STORE DAY FILE
+    python -m aoc.inputs fetch STORE [DAY ...]
+    python -m aoc.inputs list STORE [DAY ...]"""
+
+import argparse
+import hashlib
+import io
+import mmap
+import os
+import tempfile
+from pathlib import Path
+
+from aoc import days
+
+
+def normalize(data: bytes) -> bytes:
+    """Strips trailing line breaks, which aocd's input data never has."""
+    return data.rstrip(b"\r\n")
+
+
+def digest_of(data: bytes) -> str:
+    """Returns the content hash that identifies an input."""
+    return hashlib.sha256(data).hexdigest()
+
+
+class PuzzleInput:
+    """A handle to one puzzle input, either a file or data in memory.
+
+    Nothing is read until the contents are asked for, and a file is only
+    read into memory by text() and bytes(); open() streams it and mmap()
+    maps it."""
+
+    def __init__(self, year: int, day: int, path: Path = None,
+                 data: bytes = None, digest: str = None):
+        self.year = year
+        self.day = day
+        self.path = path
+        self._data = data
+        self._digest = digest
+
+    def __repr__(self) -> str:
+        source = self.path if self.path is not None else "memory"
+        return f"PuzzleInput({self.year}, {self.day}, {source})"
+
+    def bytes(self) -> bytes:
+        """Returns the whole input as bytes, without trailing line breaks."""
+        if self._data is not None:
+            return self._data
+        data = normalize(self.path.read_bytes())
+        if self._digest is None:
+            self._digest = digest_of(data)
+        return data
+
+    def text(self) -> str:
+        """Returns the whole input as a str, as the solutions expect it."""
+        return self.bytes().decode()
+
+    def open(self):
+        """Returns a binary stream of the input."""
+        if self._data is not None:
+            return io.BytesIO(self._data)
+        return open(self.path, "rb")
+
+    def mmap(self):
+        """Returns a read-only memory map (or, for data in memory, a
+        read-only memoryview) of the input."""
+        if self._data is not None:
+            return memoryview(self._data)
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return memoryview(b"")
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def digest(self) -> str:
+        """The content hash of the (normalized) input."""
+        if self._digest is None:
+            self._digest = digest_of(self.bytes())
+        return self._digest
+
+
+class AocdProvider:
+    """Provides inputs through advent-of-code-data."""
+
+    def __init__(self, year: int = days.YEAR):
+        self.year = year
+
+    def get(self, day: int) -> PuzzleInput:
+        from aocd.models import Puzzle
+        data = Puzzle(year=self.year, day=day).input_data.encode()
+        return PuzzleInput(self.year, day, data=data)
+
+
+class DirectoryProvider:
+    """Provides inputs from files ROOT/YEAR/NN.txt."""
+
+    def __init__(self, root, year: int = days.YEAR):
+        self.root = Path(root)
+        self.year = year
+
+    def path(self, day: int) -> Path:
+        return self.root / str(self.year) / f"{day:02d}.txt"
+
+    def get(self, day: int) -> PuzzleInput:
+        path = self.path(day)
+        if not path.exists():
+            raise FileNotFoundError(f"No input for {self.year} day {day}: {path}")
+        return PuzzleInput(self.year, day, path=path)
+
+
+class InputStore:
+    """A content-addressed store of puzzle inputs.
+
+    Each input is kept once, as ROOT/objects/HASH.  The inputs known for
+    a day are listed, oldest first, in ROOT/index/YEAR/NN, one hash per
+    line; get() returns the newest unless asked for a particular one."""
+
+    def __init__(self, root, year: int = days.YEAR):
+        self.root = Path(root)
+        self.year = year
+
+    def object_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest
+
+    def index_path(self, day: int) -> Path:
+        return self.root / "index" / str(self.year) / f"{day:02d}"
+
+    def digests(self, day: int) -> list:
+        """Returns the hashes of the inputs stored for a day, oldest first."""
+        try:
+            return self.index_path(day).read_text().split()
+        except FileNotFoundError:
+            return []
+
+    def add(self, day: int, data: bytes) -> str:
+        """Stores an input for a day, returning its hash."""
+        data = normalize(data)
+        digest = digest_of(data)
+        path = self.object_path(digest)
+        if not path.exists():
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # write then rename, so that readers never see a partial object
+            with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as f:
+                f.write(data)
+            os.replace(f.name, path)
+        known = self.digests(day)
+        if digest in known:
+            known.remove(digest)
+        index = self.index_path(day)
+        index.parent.mkdir(parents=True, exist_ok=True)
+        index.write_text("".join(d + "\n" for d in known + [digest]))
+        return digest
+
+    def get(self, day: int, digest: str = None) -> PuzzleInput:
+        if digest is None:
+            known = self.digests(day)
+            if not known:
+                raise FileNotFoundError(f"No stored input for {self.year} day {day}")
+            digest = known[-1]
+        path = self.object_path(digest)
+        if not path.exists():
+            raise FileNotFoundError(f"No stored input with hash {digest}")
+        return PuzzleInput(self.year, day, path=path, digest=digest)
+
+
+class MemoryProvider:
+    """Provides inputs held in memory, given as a dict of day: str."""
+
+    def __init__(self, inputs: dict, year: int = days.YEAR):
+        self.inputs = inputs
+        self.year = year
+
+    def get(self, day: int) -> PuzzleInput:
+        if day not in self.inputs:
+            raise KeyError(f"No input for {self.year} day {day}")
+        return PuzzleInput(self.year, day, data=self.inputs[day].encode())
+
+
+def default_provider():
+    """Returns the provider chosen by the environment (see module doc)."""
+    if os.environ.get("AOC_INPUT_STORE"):
+        return InputStore(os.environ["AOC_INPUT_STORE"])
+    if os.environ.get("AOC_INPUT_DIR"):
+        return DirectoryProvider(os.environ["AOC_INPUT_DIR"])
+    return AocdProvider()
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.inputs",
+        description="Manage a local store of Advent of Code 2021 inputs.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    add_parser = commands.add_parser("add", help="store an input file")
+    add_parser.add_argument("store")
+    add_parser.add_argument("day", type=int)
+    add_parser.add_argument("file")
+    fetch_parser = commands.add_parser("fetch", help="store inputs from aocd")
+    fetch_parser.add_argument("store")
+    fetch_parser.add_argument("days", nargs="*", type=int)
+    list_parser = commands.add_parser("list", help="list stored inputs")
+    list_parser.add_argument("store")
+    list_parser.add_argument("days", nargs="*", type=int)
+    args = parser.parse_args(argv)
+
+    store = InputStore(args.store)
+    if args.command == "add":
+        print(store.add(args.day, Path(args.file).read_bytes()))
+    elif args.command == "fetch":
+        aocd = AocdProvider()
+        for day in args.days or range(1, 26):
+            print(f"{day:02d} {store.add(day, aocd.get(day).bytes())}")
+    else:
+        for day in args.days or range(1, 26):
+            for digest in store.digests(day):
+                print(f"{day:02d} {digest}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,49 @@
+"""Extracts all the integers in an input at once, as a numpy array.
+
+read_ints() replaces every byte that cannot be part of an integer with
+a space, in one bytes.translate pass, and lets numpy scan the result,
+so no Python object is made per number:
+
+    >>> read_ints("0,9 -> 5,9\\n8,0 -> 0,8")
+    array([0, 9, 5, 9, 8, 0, 0, 8])
+    >>> read_ints("target area: x=20..30, y=-10..-5", columns=2)
+    array([[ 20,  30],
+           [-10,  -5]])"""
+
+import re
+import warnings
+
+import numpy as np
+
+INTEGER = re.compile(rb"-?\d+")
+
+_NOT_INTEGER = bytes(range(256)).translate(None, b"-0123456789")
+_SPACES = bytes.maketrans(_NOT_INTEGER, b" " * len(_NOT_INTEGER))
+
+
+def read_ints(data, columns: int = None, dtype=np.int64) -> np.ndarray:
+    """Returns the integers in a str or bytes-like input, in order, as an
+    int64 (or dtype) array, reshaped into rows of the given number of columns.
+
+    A minus sign counts only when directly followed by a digit.
+    Raises ValueError if the integers do not fill whole rows."""
+
+    if isinstance(data, str):
+        data = data.encode()
+    spaced = (bytes(data).translate(_SPACES) + b" ").replace(b"- ", b"  ")
+    if not spaced.strip():
+        values = np.empty(0, dtype=dtype)
+    else:
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            try:
+                values = np.fromstring(spaced, dtype=dtype, sep=" ")
+            except (DeprecationWarning, ValueError):
+                # numpy stops at a minus sign that is not a sign, as in
+                # "1-2", so scan such inputs with the regex instead
+                values = np.array(INTEGER.findall(bytes(data)), dtype=dtype)
+    if columns is None:
+        return values
+    if len(values) % columns:
+        raise ValueError(f"{len(values)} integers do not fill rows of {columns}")
+    return values.reshape(-1, columns)
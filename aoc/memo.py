@@ -0,0 +1,137 @@
+"""Bounded memo tables for recursive solutions.
+
+Decorated with memo(), a function remembers its results by argument, in
+a table that is
+
+  - bounded, by a number of entries (maxsize) and/or an approximate
+    number of bytes (maxbytes), evicting the least recently used entry;
+  - inspectable, with info() giving its hits, misses and evictions;
+  - scoped: within "with f.scope():" calls use a fresh table, which is
+    dropped when the block ends, so that a solve leaves nothing behind:
+
+    >>> @memo(maxsize=100)
+    ... def fib(n):
+    ...     return n if n < 2 else fib(n - 1) + fib(n - 2)
+    >>> with fib.scope():
+    ...     fib(30)
+    832040
+    >>> fib.info()
+    MemoInfo(hits=28, misses=31, evictions=0, size=0, nbytes=0)
+
+Hits and misses are also counted into aoc.stats, when it is collecting."""
+
+import contextlib
+import functools
+import sys
+import weakref
+from collections import OrderedDict, namedtuple
+
+from aoc import stats
+
+MemoInfo = namedtuple("MemoInfo", "hits misses evictions size nbytes")
+
+# Roughly what a table entry costs besides its key and value.
+ENTRY_OVERHEAD = 100
+
+_memos = weakref.WeakSet()
+
+_MISSING = object()
+
+
+def footprint(obj) -> int:
+    """Returns the approximate size in bytes of a key or value, counting
+    the items of tuples (including namedtuples) as well."""
+    size = sys.getsizeof(obj)
+    if isinstance(obj, tuple):
+        size += sum(footprint(item) for item in obj)
+    return size
+
+
+class Memo:
+    """A function memoized in a bounded LRU table; see memo()."""
+
+    def __init__(self, func, maxsize: int = None, maxbytes: int = None,
+                 counters: tuple = ("memo_hits", "memo_misses")):
+        functools.update_wrapper(self, func)
+        self.func = func
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.hit_counter, self.miss_counter = counters
+        self.hits = self.misses = self.evictions = 0
+        self._table = OrderedDict()
+        self._nbytes = 0
+        _memos.add(self)
+
+    def __call__(self, *args):
+        counters = stats.current()
+        table = self._table
+        result = table.get(args, _MISSING)
+        if result is not _MISSING:
+            table.move_to_end(args)
+            self.hits += 1
+            if counters is not None:
+                counters[self.hit_counter] += 1
+            return result
+        self.misses += 1
+        if counters is not None:
+            counters[self.miss_counter] += 1
+
+        result = self.func(*args)
+        # a scope may have ended, or the table been cleared, meanwhile
+        if table is self._table:
+            self._add(args, result)
+        return result
+
+    def _add(self, key, value):
+        """Adds an entry, then evicts entries until within budget."""
+        table = self._table
+        if self.maxbytes is not None:
+            self._nbytes += footprint(key) + footprint(value) + ENTRY_OVERHEAD
+        table[key] = value
+        while table and ((self.maxsize is not None and len(table) > self.maxsize) or
+                         (self.maxbytes is not None and self._nbytes > self.maxbytes)):
+            old_key, old_value = table.popitem(last=False)
+            if self.maxbytes is not None:
+                self._nbytes -= (footprint(old_key) + footprint(old_value) +
+                                 ENTRY_OVERHEAD)
+            self.evictions += 1
+
+    def info(self) -> MemoInfo:
+        """Returns the statistics of the memo and the size of its table.
+
+        nbytes is only tracked (and otherwise 0) when maxbytes is set."""
+        return MemoInfo(self.hits, self.misses, self.evictions,
+                        len(self._table), self._nbytes)
+
+    def clear(self):
+        """Empties the table and resets the statistics."""
+        self._table = OrderedDict()
+        self._nbytes = 0
+        self.hits = self.misses = self.evictions = 0
+
+    @contextlib.contextmanager
+    def scope(self):
+        """Calls made within the block use a fresh table, dropped at its end."""
+        saved = self._table, self._nbytes
+        self._table, self._nbytes = OrderedDict(), 0
+        try:
+            yield self
+        finally:
+            self._table, self._nbytes = saved
+
+
+def memo(maxsize: int = None, maxbytes: int = None,
+         counters: tuple = ("memo_hits", "memo_misses")):
+    """Decorates a function of hashable positional arguments with a memo
+    table of at most maxsize entries and about maxbytes bytes (either
+    may be None, for no bound).  counters names the aoc.stats counters
+    of its hits and misses."""
+    def decorate(func):
+        return Memo(func, maxsize, maxbytes, counters)
+    return decorate
+
+
+def clear():
+    """Empties the table of every memo, e.g. between inputs in a worker."""
+    for m in _memos:
+        m.clear()
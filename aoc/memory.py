@@ -0,0 +1,233 @@
+"""Profiles the memory used by the solutions, and reports it.
+
+Usage:
+    python -m aoc.memory report RESULTS_JSON
+    python -m aoc.memory compare BASELINE_JSON CURRENT_JSON [--threshold 0.25]
+
+"python -m aoc.run --memory" profiles each part's parse and solve with
+profile(), and stores in its record's memory:
+    traced_peak:  the peak of the memory traced by tracemalloc, in bytes,
+                  which includes numpy arrays;
+    rss_peak:     the high-water mark of the worker's resident set, in
+                  bytes (null where the resource module is missing);
+    sites:        the TOP_SITES lines that held the most memory, taken
+                  from a snapshot of the traces near the peak; memory
+                  allocated by a library (e.g. numpy) is put down to the
+                  innermost line of the repository that called it;
+    sites_at:     the traced memory when that snapshot was taken.
+Each part runs in a fresh worker process, so that rss_peak is its own.
+Tracing slows the solutions down, so the timings of such a run are
+not comparable with those of a normal run.
+
+report prints the memory of each part in a stable, line-by-line form
+meant for diffing between versions; compare flags the parts whose
+traced or resident peak has grown by more than the threshold, and exits
+with status 1 if there are any."""
+
+import argparse
+import contextlib
+import json
+import os
+import sys
+import threading
+import tracemalloc
+from collections import Counter
+
+from aoc import days
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# How many allocation sites to report per part.
+TOP_SITES = 10
+
+# How many frames of each allocation's traceback to keep.
+TRACE_FRAMES = 32
+
+# How often the traced memory is checked for a new peak, in seconds.
+SAMPLE_INTERVAL = 0.001
+
+# How much the traced memory must grow past the last snapshot to take a new one.
+SNAPSHOT_GROWTH = 1.1
+
+MIB = 1 << 20
+
+
+def rss_peak():
+    """Returns the resident set high-water mark of this process, in bytes."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kibibytes, macOS bytes
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def repo_path(path: str) -> str:
+    """Returns a path relative to the repository root, with / separators,
+    or None if it is outside the repository."""
+    try:
+        relative = os.path.relpath(path, days.REPO_ROOT)
+    except ValueError:
+        return None
+    if relative.startswith(os.pardir):
+        return None
+    return relative.replace(os.sep, "/")
+
+
+def site_name(traceback: tracemalloc.Traceback) -> str:
+    """Returns "file:line" for the innermost frame of a traceback in the
+    repository (or else its innermost frame), with the file relative to
+    the repository root, so that reports compare across checkouts."""
+    for frame in reversed(traceback):
+        path = repo_path(frame.filename)
+        if path is not None:
+            return f"{path}:{frame.lineno}"
+    frame = traceback[-1]
+    return f"{frame.filename}:{frame.lineno}"
+
+
+def top_sites(snapshot: tracemalloc.Snapshot) -> list:
+    """Returns the TOP_SITES sites that hold the most memory in a snapshot."""
+    sizes, counts = Counter(), Counter()
+    for trace in snapshot.traces:
+        site = site_name(trace.traceback)
+        sizes[site] += trace.size
+        counts[site] += 1
+    return [{"site": site, "size": size, "count": counts[site]}
+            for site, size in sizes.most_common(TOP_SITES)]
+
+
+class PeakSnapshots(threading.Thread):
+    """Watches the traced memory, snapshotting the traces whenever it
+    reaches a new high (by SNAPSHOT_GROWTH), until stopped."""
+
+    def __init__(self):
+        super().__init__(daemon=True)
+        self.snapshot = None
+        self.snapshot_size = 0
+        self.stopping = threading.Event()
+
+    def run(self):
+        while not self.stopping.wait(SAMPLE_INTERVAL):
+            self.check()
+
+    def check(self):
+        size = tracemalloc.get_traced_memory()[0]
+        if size > self.snapshot_size * SNAPSHOT_GROWTH:
+            self.snapshot = tracemalloc.take_snapshot()
+            self.snapshot_size = size
+
+    def stop(self):
+        self.stopping.set()
+        self.join()
+
+
+@contextlib.contextmanager
+def profile():
+    """Traces the memory allocated within the block; the dict it yields
+    is filled in with traced_peak, rss_peak, sites and sites_at at its end.
+
+    The tracing that was already running, if any, is stopped."""
+    report = {}
+    tracemalloc.stop()
+    tracemalloc.start(TRACE_FRAMES)
+    watcher = PeakSnapshots()
+    watcher.start()
+    try:
+        yield report
+    finally:
+        watcher.check()
+        watcher.stop()
+        report["traced_peak"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        report["rss_peak"] = rss_peak()
+        report["sites_at"] = watcher.snapshot_size
+        report["sites"] = []
+        if watcher.snapshot is not None:
+            # leave out the watcher's own allocations
+            snapshot = watcher.snapshot.filter_traces(
+                [tracemalloc.Filter(False, threading.__file__, all_frames=True),
+                 tracemalloc.Filter(False, __file__, all_frames=True)])
+            report["sites"] = top_sites(snapshot)
+
+
+def format_report(results: dict) -> list:
+    """Returns the lines of a memory report for the records of a run."""
+
+    def mib(n):
+        return "-" if n is None else f"{n / MIB:.1f} MiB"
+
+    lines = []
+    for record in sorted(results["results"],
+                         key=lambda r: (r["module"], r["part"] or "")):
+        memory = record.get("memory")
+        if memory is None:
+            continue
+        lines.append(f"{record['module']} {record['part']}"
+                     f"  traced {mib(memory['traced_peak'])}"
+                     f"  rss {mib(memory['rss_peak'])}")
+        for site in memory["sites"]:
+            lines.append(f"    {mib(site['size']):>12}  {site['site']}")
+    return lines
+
+
+def compare(baseline: dict, current: dict, threshold: float = 0.25) -> list:
+    """Returns descriptions of the memory regressions from baseline to
+    current: parts whose traced or resident peak has grown by more than
+    the threshold fraction."""
+
+    def by_part(results):
+        return {(r["module"], r["part"]): r["memory"] for r in results["results"]
+                if r.get("memory") is not None}
+
+    old_memory = by_part(baseline)
+    regressions = []
+    for (module, part), new in sorted(by_part(current).items()):
+        old = old_memory.get((module, part))
+        if old is None:
+            continue
+        for measure in ["traced_peak", "rss_peak"]:
+            if (new[measure] is not None and old[measure] is not None and
+                    new[measure] > old[measure] * (1 + threshold)):
+                regressions.append(f"{module}:{part} {measure} "
+                                   f"{old[measure]} -> {new[measure]} bytes")
+    return regressions
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.memory",
+        description="Report the memory profiles recorded by aoc.run --memory.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    report_parser = commands.add_parser("report", help="print a diffable report")
+    report_parser.add_argument("results")
+
+    compare_parser = commands.add_parser("compare", help="flag regressions")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.25,
+                                help="allowed growth, as a fraction")
+    args = parser.parse_args(argv)
+
+    if args.command == "report":
+        with open(args.results) as f:
+            results = json.load(f)
+        for line in format_report(results):
+            print(line)
+    else:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        with open(args.current) as f:
+            current = json.load(f)
+        regressions = compare(baseline, current, args.threshold)
+        for r in regressions:
+            print(r)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,61 @@
+"""Runs solution jobs in parallel over a process pool.
+
+A job is one part of one module.  Jobs share no state (the memo tables in
+day21 and day23 are per process), so they can be spread over a
+ProcessPoolExecutor.  A full run is bounded by its slowest jobs, so jobs
+are submitted longest-first, using the timings recorded by a previous run.
+Jobs without a previous timing are assumed to be long and go first."""
+
+import math
+from concurrent.futures import ProcessPoolExecutor
+
+from aoc import run
+
+
+def job_key(module_name: str, part: str) -> tuple:
+    """Returns the key that identifies a job across runs."""
+    return (module_name, part)
+
+
+def past_durations(results: dict) -> dict:
+    """Returns the total duration of each job recorded in a results document."""
+    durations = {}
+    for r in results.get("results", []):
+        if r["error"] is not None:
+            continue
+        durations[job_key(r["module"], r["part"])] = sum(
+            t for t in r["timings"].values() if t is not None)
+    return durations
+
+
+def schedule(job_list: list, durations: dict) -> list:
+    """Returns the jobs ordered longest-first by their past durations."""
+    def expected(job):
+        module, part = job
+        return durations.get(job_key(module.name, part), math.inf)
+    return sorted(job_list, key=expected, reverse=True)
+
+
+def run_parallel(modules: list, workers: int = None, durations: dict = None,
+                 inputs=None, parse_cache=None, stats=False,
+                 memory=False, checkpoints=None, profile=None) -> list:
+    """Runs every part of the given modules over a pool of worker processes.
+
+    The records are returned in the same order as run.run() would give,
+    regardless of the order in which the jobs were scheduled.
+    The inputs provider and parse cache are sent to the workers, which
+    each read their own input, so they must be picklable (all those in
+    aoc.inputs and aoc.parse_cache are).  With memory, every job gets
+    a fresh worker process, so that its memory profile is its own."""
+    job_list = run.jobs(modules)
+    order = {job_key(m.name, part): i for i, (m, part) in enumerate(job_list)}
+    records = [None] * len(job_list)
+    with ProcessPoolExecutor(max_workers=workers,
+                             max_tasks_per_child=1 if memory else None) as pool:
+        futures = [(job, pool.submit(run.run_job, *job,
+                                           inputs, parse_cache, stats, memory,
+                                           checkpoints, profile))
+                   for job in schedule(job_list, durations or {})]
+        for (module, part), future in futures:
+            records[order[job_key(module.name, part)]] = future.result()
+    return records
@@ -0,0 +1,90 @@
+"""An on-disk cache of parsed inputs, as memory-mapped numpy arrays.
+
+A solution module can have its parsed inputs cached by providing
+
+    to_arrays(parsed) -> dict    the parsed value as named numpy arrays,
+    from_arrays(arrays) -> ...   the parsed value rebuilt from such arrays,
+
+and, whenever its parse or codec changes, a new PARSE_VERSION (default 1).
+A parsed input is stored as ROOT/MODULE/vVERSION/INPUT_HASH/NAME.npy, and
+later runs map those files read-only instead of parsing the input again.
+
+The cache is used by aoc.run when given --parse-cache DIR, or when the
+AOC_PARSE_CACHE environment variable names a directory."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+from aoc import days
+
+
+def supports(module) -> bool:
+    """Returns True if a solution module can have its parses cached."""
+    return (callable(getattr(module, "to_arrays", None)) and
+            callable(getattr(module, "from_arrays", None)))
+
+
+class ParseCache:
+    """A directory of parsed inputs."""
+
+    def __init__(self, root):
+        self.root = Path(root)
+
+    def path(self, module, digest: str) -> Path:
+        """Returns the directory holding a module's parse of an input."""
+        version = getattr(module, "PARSE_VERSION", 1)
+        return self.root / module.__name__ / f"v{version}" / digest
+
+    def load(self, module, digest: str):
+        """Returns the cached parse of an input, or None if not cached."""
+        path = self.path(module, digest)
+        if not path.is_dir():
+            return None
+        arrays = {p.stem: np.load(p, mmap_mode="r") for p in path.glob("*.npy")}
+        return module.from_arrays(arrays)
+
+    def store(self, module, digest: str, parsed):
+        """Caches the parse of an input."""
+        path = self.path(module, digest)
+        if path.is_dir():
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # fill a temporary directory, then rename it, so that readers
+        # never see a partial entry
+        work = Path(tempfile.mkdtemp(dir=path.parent))
+        try:
+            for name, array in module.to_arrays(parsed).items():
+                np.save(work / f"{name}.npy", np.ascontiguousarray(array))
+            os.rename(work, path)
+        except OSError:
+            if not path.is_dir():
+                raise
+        finally:
+            shutil.rmtree(work, ignore_errors=True)
+
+    def parse(self, day_module: days.DayModule, puzzle_input):
+        """Returns the parse of a PuzzleInput, from the cache if possible.
+
+        Returns a pair of the parsed value and whether it came from the
+        cache.  The input is only read if it is not cached, and is then
+        parsed and added to the cache."""
+        module = day_module.load()
+        parse = day_module.parse_function()
+        if not supports(module):
+            return parse(puzzle_input.text()), False
+        parsed = self.load(module, puzzle_input.digest)
+        if parsed is not None:
+            return parsed, True
+        parsed = parse(puzzle_input.text())
+        self.store(module, puzzle_input.digest, parsed)
+        return parsed, False
+
+
+def default_cache():
+    """Returns the cache named by AOC_PARSE_CACHE, or None if not set."""
+    root = os.environ.get("AOC_PARSE_CACHE")
+    return ParseCache(root) if root else None
@@ -0,0 +1,139 @@
+"""Profiles the solutions, for flame graphs and hot-function summaries.
+
+"python -m aoc.run --profile DIR" solves each part under profile(),
+which runs both
+
+  - cProfile, whose statistics are saved as DIR/NAME.pstats (for pstats,
+    snakeviz, ...) and summarized in the record's profile as its
+    TOP_FUNCTIONS functions with the most time of their own;
+  - a sampler of the Python stack every SAMPLE_INTERVAL seconds of CPU
+    time, whose stacks are saved as DIR/NAME.collapsed, one
+    "frame;frame;frame count" line each, as flamegraph.pl, speedscope
+    and inferno take them.
+
+NAME is the module, part and input hash, e.g. day18-b-3f2a9c1e0b7d.
+Stack sampling needs SIGPROF, so it only happens in the main thread,
+on platforms that have it; cProfile runs regardless."""
+
+import contextlib
+import cProfile
+import os
+import pstats
+import signal
+import sys
+import threading
+from collections import Counter
+from pathlib import Path
+
+from aoc import memory
+
+# How often the stack is sampled, in seconds of CPU time.
+SAMPLE_INTERVAL = 0.001
+
+# How many of the hottest functions to summarize.
+TOP_FUNCTIONS = 10
+
+# How many characters of the input hash to put in file names.
+HASH_LENGTH = 12
+
+
+def source_name(filename: str) -> str:
+    """Returns a file name relative to the repository, where it is in it,
+    or else just its base name."""
+    return memory.repo_path(filename) or os.path.basename(filename)
+
+
+def frame_name(code) -> str:
+    """Returns the name of a code object's frame in a collapsed stack."""
+    name = getattr(code, "co_qualname", code.co_name)
+    return f"{name} ({source_name(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Counts the Python stacks seen on SIGPROF, up to (and not including)
+    the frame that started the sampler."""
+
+    def __init__(self, interval: float = SAMPLE_INTERVAL):
+        self.interval = interval
+        self.stacks = Counter()
+        self.root = None
+        self.previous_handler = None
+
+    @staticmethod
+    def available() -> bool:
+        return (hasattr(signal, "setitimer") and hasattr(signal, "SIGPROF") and
+                threading.current_thread() is threading.main_thread())
+
+    def start(self, root):
+        """Starts sampling the stacks that run within the frame root."""
+        self.root = root
+        self.previous_handler = signal.signal(signal.SIGPROF, self.sample)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+
+    def stop(self):
+        signal.setitimer(signal.ITIMER_PROF, 0)
+        signal.signal(signal.SIGPROF, self.previous_handler)
+
+    def sample(self, signum, frame):
+        names = []
+        while frame is not None and frame is not self.root:
+            names.append(frame_name(frame.f_code))
+            frame = frame.f_back
+        if names:
+            self.stacks[";".join(reversed(names))] += 1
+
+    def collapsed(self) -> list:
+        """Returns the lines of the collapsed stacks, in order."""
+        return [f"{stack} {count}" for stack, count in sorted(self.stacks.items())]
+
+
+def hot_functions(stats: pstats.Stats, n: int = TOP_FUNCTIONS) -> list:
+    """Returns the n functions with the most time of their own."""
+    rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+    return [{"function": f"{source_name(filename)}:{line}({name})",
+             "calls": calls, "tottime": tottime, "cumtime": cumtime}
+            for (filename, line, name), (_, calls, tottime, cumtime, _)
+            in rows[:n]]
+
+
+def profile_name(module_name: str, part: str, digest: str) -> str:
+    """Returns the base name of a part's profile files."""
+    return f"{module_name}-{part}-{digest[:HASH_LENGTH]}"
+
+
+@contextlib.contextmanager
+def profile(directory, name: str):
+    """Profiles the block, saving directory/name.pstats and .collapsed;
+    the dict it yields is filled in with their paths and the hottest
+    functions at its end."""
+    report = {}
+    profiler = cProfile.Profile()
+    sampler = StackSampler()
+    sampling = sampler.available()
+    if sampling:
+        # the caller's frame, above this generator's and __enter__'s
+        sampler.start(sys._getframe(2))
+    profiler.enable()
+    try:
+        yield report
+    finally:
+        profiler.disable()
+        if sampling:
+            sampler.stop()
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        stats = pstats.Stats(profiler)
+        report["pstats"] = str(directory / f"{name}.pstats")
+        stats.dump_stats(report["pstats"])
+        report["collapsed"] = None
+        if sampling:
+            report["collapsed"] = str(directory / f"{name}.collapsed")
+            with open(report["collapsed"], "w") as f:
+                f.writelines(line + "\n" for line in sampler.collapsed())
+        report["hot"] = hot_functions(stats)
+
+
+def format_hot(report: dict, n: int = 5) -> list:
+    """Returns the lines of a short summary of a profile's hottest functions."""
+    return [f"    {h['tottime']:8.4f}s {h['calls']:>9}  {h['function']}"
+            for h in report["hot"][:n]]
@@ -0,0 +1,280 @@
+"""Runs the solutions, timing each phase, and reports the results as JSON.
+
+Usage:
+    python -m aoc.run [DAY_OR_MODULE ...] [-o results.json]
+                      [-j [WORKERS]] [--timings previous.json]
+                      [--inputs DIR | --store DIR] [--parse-cache DIR]
+                      [--checkpoints DIR] [--stats] [--memory]
+                      [--profile DIR]
+
+Each part of each selected module is timed in three phases:
+    load:   reading the puzzle input,
+    parse:  the module's parse stage (null if the module has none),
+            or loading its result from the parse cache,
+    solve:  the part function itself.
+
+With -j, the parts run in parallel over a pool of worker processes,
+longest first according to the timings of a previous run (--timings).
+
+Inputs come from a directory of YEAR/NN.txt files (--inputs), a local
+input store (--store; see aoc.inputs), or else the provider chosen by
+aoc.inputs.default_provider().  With --parse-cache (or AOC_PARSE_CACHE),
+parsed inputs are kept on disk and reused; see aoc.parse_cache.
+With --checkpoints (or AOC_CHECKPOINTS), the long simulations save their
+state now and then, and resume from it when run again; see aoc.checkpoint.
+
+With --stats, each record also holds the work counters (heap operations,
+memo hits, ...) that the solutions count while parsing and solving; see
+aoc.stats.  Without it, the counters are not collected and cost nothing.
+
+With --memory, each record also holds the memory profile of the part's
+parse and solve (traced and resident peaks, top allocation sites), and
+each part runs in a fresh worker process; see aoc.memory.
+
+With --profile DIR, each part's parse and solve also run under cProfile
+and a stack sampler, which save a .pstats file and a collapsed stack
+file (for flame graphs) in DIR, and each record's profile lists its
+hottest functions; see aoc.profiling."""
+
+import argparse
+import contextlib
+import json
+import numbers
+import sys
+import time
+
+from aoc import days, inputs as input_providers, parse_cache as parse_caches
+from aoc import checkpoint, memory as memory_profiles, profiling
+from aoc import stats as work_stats
+
+
+def jsonable(answer):
+    """Converts an answer into a value that JSON can represent."""
+    if isinstance(answer, numbers.Integral):
+        return int(answer)
+    if isinstance(answer, tuple):
+        return [jsonable(a) for a in answer]
+    return str(answer)
+
+
+def new_record(module: days.DayModule, part: str) -> dict:
+    """Returns an empty result record for one part of one module."""
+    return {"module": module.name, "day": module.day, "part": part,
+            "input": None, "parse_cache": None, "answer": None, "error": None,
+            "timings": {"load": None, "parse": None, "solve": None},
+            "stats": None, "memory": None, "profile": None}
+
+
+def run_part(module: days.DayModule, part: str, inputs=None,
+             parse_cache=None, stats=False, memory=False,
+             checkpoints=None, profile=None) -> dict:
+    """Solves one part of one module and returns its result record.
+
+    The input is read from the inputs provider (by default, the one from
+    aoc.inputs.default_provider()) and identified in the record by its hash.
+    Given a ParseCache, the parse is taken from it where possible, and the
+    record's parse_cache notes whether it was a "hit" or a "miss"; on a
+    miss, reading the input is timed as part of the parse phase.
+    With stats, the record's stats holds the work counted while parsing
+    and solving, and with memory, the record's memory holds their
+    memory profile.  Given a checkpoints directory, the simulations save
+    their state there, and resume from it (see aoc.checkpoint).  Given a
+    profile directory, the parse and solve are profiled into it, and the
+    record's profile holds the profile's files and hottest functions.
+    Exceptions are recorded in the record rather than raised, so that one
+    failing solution does not stop the rest of a run."""
+    record = new_record(module, part)
+    timings = record["timings"]
+    collecting = work_stats.collect() if stats else contextlib.nullcontext()
+    memory_profiling = (memory_profiles.profile() if memory
+                        else contextlib.nullcontext())
+    saving = (checkpoint.saving(checkpoints) if checkpoints is not None
+              else contextlib.nullcontext())
+    try:
+        if inputs is None:
+            inputs = input_providers.default_provider()
+        parse = module.parse_function()
+        cached = (parse_cache is not None and parse is not None and
+                  parse_caches.supports(module.load()))
+
+        start = time.perf_counter()
+        puzzle_input = inputs.get(module.day)
+        if not cached:
+            input_data = puzzle_input.text()
+        record["input"] = puzzle_input.digest
+        timings["load"] = time.perf_counter() - start
+        cpu_profiling = contextlib.nullcontext()
+        if profile is not None:
+            cpu_profiling = profiling.profile(profile, profiling.profile_name(
+                module.name, part, puzzle_input.digest))
+
+        with collecting as counters, memory_profiling as memory_profile, \
+                cpu_profiling as cpu_profile, saving:
+            if stats:
+                record["stats"] = counters
+            if memory:
+                record["memory"] = memory_profile
+            if profile is not None:
+                record["profile"] = cpu_profile
+            if parse is not None:
+                start = time.perf_counter()
+                if cached:
+                    input_data, hit = parse_cache.parse(module, puzzle_input)
+                    record["parse_cache"] = "hit" if hit else "miss"
+                else:
+                    input_data = parse(input_data)
+                timings["parse"] = time.perf_counter() - start
+
+            solve = module.part_function(part)
+            start = time.perf_counter()
+            answer = solve(input_data)
+            timings["solve"] = time.perf_counter() - start
+            record["answer"] = jsonable(answer)
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    if record["stats"] is not None:
+        record["stats"] = dict(sorted(record["stats"].items()))
+    return record
+
+
+def jobs(modules: list) -> list:
+    """Returns the (module, part) pairs to run, in order.
+
+    A module that fails to import yields a single (module, None) job."""
+    pairs = []
+    for m in modules:
+        try:
+            pairs.extend((m, part) for part in m.parts())
+        except Exception:
+            pairs.append((m, None))
+    return pairs
+
+
+def run_job(module: days.DayModule, part: str, inputs=None,
+            parse_cache=None, stats=False, memory=False,
+            checkpoints=None, profile=None) -> dict:
+    """Runs one job from jobs(), recording import failures as errors."""
+    if part is None:
+        record = new_record(module, part)
+        try:
+            module.load()
+        except Exception as e:
+            record["error"] = f"{type(e).__name__}: {e}"
+        return record
+    return run_part(module, part, inputs, parse_cache, stats, memory,
+                    checkpoints, profile)
+
+
+def run(modules: list, inputs=None, parse_cache=None, stats=False,
+        memory=False, checkpoints=None, profile=None) -> list:
+    """Runs every part of the given modules, returning the result records."""
+    return [run_job(m, part, inputs, parse_cache, stats, memory, checkpoints,
+                    profile)
+            for m, part in jobs(modules)]
+
+
+def format_record(record: dict) -> str:
+    """Returns a one-line, human-readable summary of a result record."""
+
+    def seconds(t):
+        return "-" if t is None else f"{t:.4f}s"
+
+    t = record["timings"]
+    outcome = (f"error: {record['error']}" if record["error"] is not None
+               else f"{record['answer']}")
+    if "\n" in outcome:
+        outcome = "(multiline)"
+    return (f"{record['module']:<14} {record['part'] or '-':<2}"
+            f"  load {seconds(t['load']):>9}"
+            f"  parse {seconds(t['parse']):>9}"
+            f"  solve {seconds(t['solve']):>9}"
+            f"  {outcome}")
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.run",
+        description="Run Advent of Code 2021 solutions with per-phase timing.")
+    parser.add_argument("selectors", nargs="*", metavar="DAY_OR_MODULE",
+                        help="day numbers (e.g. 15) or module names "
+                             "(e.g. day15_faster); default: all")
+    parser.add_argument("-o", "--output",
+                        help="write the JSON results here instead of stdout")
+    parser.add_argument("-j", "--jobs", nargs="?", type=int, const=0,
+                        metavar="WORKERS",
+                        help="run parts in parallel over a process pool "
+                             "(default pool size: number of CPUs)")
+    parser.add_argument("--timings", metavar="RESULTS_JSON",
+                        help="results of a previous run, used to schedule "
+                             "the longest parallel jobs first")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--inputs", metavar="DIR",
+                        help="read the inputs from DIR/YEAR/NN.txt files")
+    source.add_argument("--store", metavar="DIR",
+                        help="read the inputs from a local input store")
+    parser.add_argument("--parse-cache", metavar="DIR",
+                        help="keep parsed inputs in DIR and reuse them")
+    parser.add_argument("--checkpoints", metavar="DIR",
+                        default=checkpoint.default_root(),
+                        help="save the state of long simulations in DIR, "
+                             "and resume them from it")
+    parser.add_argument("--stats", action="store_true",
+                        help="record the work counters of each part")
+    parser.add_argument("--memory", action="store_true",
+                        help="record the memory profile of each part, "
+                             "running each in a fresh process")
+    parser.add_argument("--profile", metavar="DIR",
+                        help="profile each part, saving .pstats and "
+                             "collapsed stack files in DIR")
+    args = parser.parse_args(argv)
+
+    if args.inputs is not None:
+        inputs = input_providers.DirectoryProvider(args.inputs)
+    elif args.store is not None:
+        inputs = input_providers.InputStore(args.store)
+    else:
+        inputs = input_providers.default_provider()
+    if args.parse_cache is not None:
+        parse_cache = parse_caches.ParseCache(args.parse_cache)
+    else:
+        parse_cache = parse_caches.default_cache()
+    modules = days.select(args.selectors)
+    start = time.perf_counter()
+    if args.jobs is None and not args.memory:
+        records = run(modules, inputs, parse_cache, args.stats,
+                      checkpoints=args.checkpoints, profile=args.profile)
+    else:
+        from aoc import parallel
+        durations = {}
+        if args.timings is not None:
+            with open(args.timings) as f:
+                durations = parallel.past_durations(json.load(f))
+        workers = 1 if args.jobs is None else args.jobs or None
+        records = parallel.run_parallel(modules, workers=workers,
+                                        durations=durations, inputs=inputs,
+                                        parse_cache=parse_cache,
+                                        stats=args.stats,
+                                        memory=args.memory,
+                                        checkpoints=args.checkpoints,
+                                        profile=args.profile)
+    wall_time = time.perf_counter() - start
+    results = {"year": days.YEAR, "wall_time": wall_time, "results": records}
+
+    if args.output is None:
+        json.dump(results, sys.stdout, indent=2)
+        print()
+        summary = sys.stderr  # kept off stdout, where the results go
+    else:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        summary = sys.stdout
+    for record in records:
+        if args.output is not None or record["profile"] is not None:
+            print(format_record(record), file=summary)
+        if record["profile"] is not None:
+            for line in profiling.format_hot(record["profile"]):
+                print(line, file=summary)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,186 @@
+"""An asyncio front end to warm solver workers.
+
+    async with Scheduler(size=4, timeouts={23: 30}) as scheduler:
+        record = await scheduler.solve(15, "a", input_data, client="alice")
+
+solve() returns the run record of the job (see aoc.run), as from
+aoc.workers, but the Scheduler also
+
+  - runs at most one job per worker at a time, queuing the rest;
+  - serves the queues of the clients in turn, one job at a time, so
+    that a client with many jobs does not hold up one with a few;
+  - gives each day its own timeout (e.g. longer for day 23's search),
+    counted from when the job starts;
+  - kills the worker of a job whose solve() was cancelled, e.g. by
+    asyncio.wait_for or a client going away, and drops queued jobs that
+    were cancelled before they started.
+
+A killed or worn out worker is replaced, as in aoc.workers.WorkerPool."""
+
+import asyncio
+import multiprocessing
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+
+from aoc import days, run, workers
+
+
+@dataclass
+class Job:
+    """A queued solve and the future of its record."""
+    module: days.DayModule
+    part: str
+    input_data: str
+    timeout: float
+    future: asyncio.Future
+    task: asyncio.Task = field(default=None)
+
+
+class Scheduler:
+    """Schedules solves fairly over a fixed number of warm workers."""
+
+    def __init__(self, size: int = None, timeouts: dict = None,
+                 default_timeout: float = workers.DEFAULT_TIMEOUT,
+                 max_requests: int = workers.MAX_REQUESTS,
+                 max_rss: int = workers.MAX_RSS, context=None):
+        self.size = size or multiprocessing.cpu_count()
+        self.timeouts = timeouts or {}
+        self.default_timeout = default_timeout
+        self.max_requests = max_requests
+        self.max_rss = max_rss
+        self.context = context
+        self.modules = {m.name: m for m in days.discover()}
+        self.queues = OrderedDict()
+        self.idle = []
+        self.running = set()
+        self.workers_started = 0
+
+    async def start(self):
+        """Starts the workers."""
+        if self.context is None:
+            self.context = workers.default_context()
+        self.idle = [self.new_worker() for _ in range(self.size)]
+
+    async def close(self):
+        """Cancels the queued and running jobs, and stops the workers."""
+        for jobs in self.queues.values():
+            for job in jobs:
+                job.future.cancel()
+        self.queues.clear()
+        for task in list(self.running):
+            task.cancel()
+        if self.running:
+            await asyncio.wait(self.running)
+        for worker in self.idle:
+            await asyncio.to_thread(worker.close)
+        self.idle = []
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    def new_worker(self) -> workers.Worker:
+        """Starts a worker to add to (or return to) the idle workers."""
+        self.workers_started += 1
+        return workers.Worker(self.context)
+
+    def module(self, day: int, name: str = None) -> days.DayModule:
+        """Returns the solution module to use for a day: the named one, or
+        else the day's main module.  Raises ValueError if there is none."""
+        name = name or f"day{day:02d}"
+        module = self.modules.get(name)
+        if module is None or module.day != day:
+            raise ValueError(f"No solution module {name} for day {day}")
+        return module
+
+    async def solve(self, day: int, part: str, input_data: str,
+                    client: str = None, module: str = None,
+                    timeout: float = None) -> dict:
+        """Solves one part for one input in a worker, once it is the
+        client's turn, and returns its record.  The timeout defaults to
+        the day's.  Raises ValueError for an unknown module."""
+        m = self.module(day, module)
+        if timeout is None:
+            timeout = self.timeouts.get(day, self.default_timeout)
+        job = Job(m, part, input_data, timeout,
+                  asyncio.get_running_loop().create_future())
+        self.queues.setdefault(client, deque()).append(job)
+        self.dispatch()
+        return await job.future
+
+    def next_job(self) -> Job:
+        """Takes the next job from the queue of the next client in turn,
+        skipping jobs cancelled while queued.  Returns None if none is left."""
+        while self.queues:
+            client, jobs = next(iter(self.queues.items()))
+            job = jobs.popleft()
+            if jobs:
+                self.queues.move_to_end(client)
+            else:
+                del self.queues[client]
+            if not job.future.done():
+                return job
+        return None
+
+    def dispatch(self):
+        """Starts queued jobs on the idle workers."""
+        while self.idle:
+            job = self.next_job()
+            if job is None:
+                return
+            job.task = asyncio.create_task(self.run_job(self.idle.pop(), job))
+            self.running.add(job.task)
+            job.task.add_done_callback(self.running.discard)
+            job.future.add_done_callback(
+                lambda future, task=job.task: future.cancelled() and task.cancel())
+
+    async def readable(self, worker: workers.Worker):
+        """Waits until the worker has sent something."""
+        loop = asyncio.get_running_loop()
+        ready = loop.create_future()
+        fd = worker.conn.fileno()
+        loop.add_reader(fd, lambda: ready.done() or ready.set_result(None))
+        try:
+            await ready
+        finally:
+            loop.remove_reader(fd)
+
+    async def run_job(self, worker: workers.Worker, job: Job):
+        """Runs a job on a worker, which goes back to the idle workers (or
+        is replaced by a new one) at the end."""
+        try:
+            try:
+                if not worker.ready:
+                    await asyncio.wait_for(self.readable(worker),
+                                           workers.STARTUP_TIMEOUT)
+                    worker.wait_ready()
+                worker.send((job.module.name, job.part, job.input_data))
+                await asyncio.wait_for(self.readable(worker), job.timeout)
+                record = worker.receive(0)
+            except asyncio.CancelledError:
+                # the caller has gone, so stop its solve
+                worker.kill()
+                worker = self.new_worker()
+                return
+            except asyncio.TimeoutError:
+                worker.kill()
+                worker = self.new_worker()
+                record = run.new_record(job.module, job.part)
+                record["error"] = f"TimeoutError: no answer within {job.timeout}s"
+            except (EOFError, OSError) as e:
+                worker.kill()
+                worker = self.new_worker()
+                record = run.new_record(job.module, job.part)
+                record["error"] = f"WorkerError: worker died ({type(e).__name__})"
+            else:
+                if worker.worn_out(self.max_requests, self.max_rss):
+                    await asyncio.to_thread(worker.close)
+                    worker = self.new_worker()
+            if not job.future.done():
+                job.future.set_result(record)
+        finally:
+            self.idle.append(worker)
+            self.dispatch()
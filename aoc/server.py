@@ -0,0 +1,110 @@
+"""Serves solve requests over a Unix domain socket, from warm workers.
+
+Usage:
+    python -m aoc.server SOCKET [-w WORKERS] [--timeout SECONDS]
+                                [--max-requests N] [--max-rss MIB]
+
+The server keeps a pool of worker processes that have already imported
+every solution (see aoc.workers), so that a request costs only its
+solve.  Clients send one JSON request per line, and get one JSON
+response per line back, on as many connections as they like:
+
+    request:   {"day": 15, "part": "a", "input": "1163751742\\n...",
+                "module": "day15_faster", "timeout": 5}
+    response:  the run record of the job (see aoc.run): its answer or
+               error, the input's hash and the load, parse and solve timings.
+
+module (default: the day's main module) and timeout (default: the
+server's --timeout) are optional.  request() sends one request."""
+
+import argparse
+import json
+import os
+import signal
+import socket
+import socketserver
+
+from aoc import workers
+
+
+class RequestHandler(socketserver.StreamRequestHandler):
+    """Answers each line of a connection with the record of its job."""
+
+    def handle(self):
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                record = self.server.pool.solve(
+                    int(request["day"]), request["part"], request["input"],
+                    module=request.get("module"), timeout=request.get("timeout"))
+            except (ValueError, KeyError, TypeError) as e:
+                record = {"error": f"BadRequest: {type(e).__name__}: {e}"}
+            self.wfile.write(json.dumps(record).encode() + b"\n")
+            self.wfile.flush()
+
+
+class SolveServer(socketserver.ThreadingUnixStreamServer):
+    """A Unix socket server whose connections share a pool of workers."""
+
+    daemon_threads = True
+
+    def __init__(self, path: str, pool: workers.WorkerPool):
+        if os.path.exists(path):
+            os.unlink(path)  # left behind by a server that did not exit cleanly
+        super().__init__(path, RequestHandler)
+        self.pool = pool
+
+    def server_close(self):
+        super().server_close()
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+
+def request(path: str, day: int, part: str, input_data: str,
+            module: str = None, timeout: float = None) -> dict:
+    """Sends one solve request to the server at path, returning its record."""
+    message = {"day": day, "part": part, "input": input_data}
+    if module is not None:
+        message["module"] = module
+    if timeout is not None:
+        message["timeout"] = timeout
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as s:
+        s.connect(path)
+        with s.makefile("rwb") as f:
+            f.write(json.dumps(message).encode() + b"\n")
+            f.flush()
+            return json.loads(f.readline())
+
+
+def main(argv: list = None):
+    parser = argparse.ArgumentParser(
+        prog="python -m aoc.server",
+        description="Serve Advent of Code 2021 solve requests over a Unix socket.")
+    parser.add_argument("socket", help="path of the Unix socket to listen on")
+    parser.add_argument("-w", "--workers", type=int,
+                        help="number of worker processes (default: number of CPUs)")
+    parser.add_argument("--timeout", type=float, default=workers.DEFAULT_TIMEOUT,
+                        help="default time limit of a request, in seconds")
+    parser.add_argument("--max-requests", type=int, default=workers.MAX_REQUESTS,
+                        help="requests a worker serves before it is replaced")
+    parser.add_argument("--max-rss", type=int, default=workers.MAX_RSS >> 20,
+                        metavar="MIB",
+                        help="resident set size past which a worker is replaced")
+    args = parser.parse_args(argv)
+
+    def stop(signum, frame):
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, stop)
+
+    with workers.WorkerPool(args.workers, args.timeout, args.max_requests,
+                            args.max_rss << 20) as pool:
+        with SolveServer(args.socket, pool) as server:
+            print(f"Serving on {args.socket}")
+            try:
+                server.serve_forever()
+            except KeyboardInterrupt:
+                pass
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,168 @@
+"""Grids in shared memory, for worker processes to read without copies.
+
+A grid passed to a worker process as an argument is pickled, and so
+copied, for every task.  A SharedGrid instead holds its array in one
+shared memory segment, and workers attach to it by its handle, which
+is just its name, shape and dtype:
+
+    with SharedGrid.copy_of(heights) as grid:
+        results = map_bands(low_points, grid, halo=1)
+
+    def low_points(band_view, band):   # in a worker
+        ...
+
+A worker sees either the whole grid (attach) or a band of its rows
+with halo extra rows on each side (attach_band), e.g. for a stencil
+that looks at its neighbours.  Views are read-only unless asked for,
+as for an output grid that each worker fills in its own band of; a
+view that outlives its with block keeps the grid's memory mapped.
+
+The process that creates a grid owns its segment, and removes it on
+close(), when the grid is garbage collected, or (through the resource
+tracker of multiprocessing) if the owner dies.  Workers only attach, so
+a worker that crashes leaves nothing behind.  Workers should be started
+by multiprocessing from the owner, so that they share its resource
+tracker; a process with a tracker of its own would remove the segment
+when it exits (before Python 3.13, which can attach without tracking)."""
+
+import contextlib
+import math
+import os
+import sys
+import weakref
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+
+import numpy as np
+
+# What a worker needs to attach to a grid.
+Handle = namedtuple("Handle", "name shape dtype")
+
+
+class Segment(shared_memory.SharedMemory):
+    """A shared memory segment whose mapping outlives it while arrays
+    still view it, rather than raising BufferError on close."""
+
+    def close(self):
+        try:
+            super().close()
+        except BufferError:
+            pass  # unmapped once the last view is freed
+
+
+def open_segment(name: str) -> Segment:
+    """Attaches to an existing segment, without taking ownership of it."""
+    if sys.version_info >= (3, 13):
+        return Segment(name, track=False)
+    # registers the segment with the resource tracker shared with the
+    # owner, which already has it
+    return Segment(name)
+
+
+def as_array(buffer, shape: tuple, dtype) -> np.ndarray:
+    """Returns an array over a segment's buffer.  The array holds on to
+    the buffer, so that the mapping cannot be closed under it."""
+    return np.frombuffer(buffer, dtype, math.prod(shape)).reshape(shape)
+
+
+def remove(segment: Segment):
+    """Removes an owned segment, and closes it."""
+    try:
+        segment.unlink()
+    except FileNotFoundError:
+        pass
+    segment.close()
+
+
+class SharedGrid:
+    """An array in a shared memory segment owned by this process."""
+
+    def __init__(self, shape: tuple, dtype=np.uint8):
+        dtype = np.dtype(dtype)
+        size = max(1, math.prod(shape) * dtype.itemsize)
+        self.segment = Segment(create=True, size=size)
+        self.array = as_array(self.segment.buf, tuple(shape), dtype)
+        self.handle = Handle(self.segment.name, tuple(shape), dtype.str)
+        self._finalizer = weakref.finalize(self, remove, self.segment)
+
+    @classmethod
+    def copy_of(cls, array: np.ndarray) -> "SharedGrid":
+        """Returns a new shared grid holding a copy of the array."""
+        grid = cls(array.shape, array.dtype)
+        grid.array[...] = array
+        return grid
+
+    def close(self):
+        """Removes the segment.  Arrays that still view it stay valid until
+        they are freed, but no new views can be attached."""
+        self.array = None
+        self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+@dataclass(frozen=True)
+class Band:
+    """Rows start:stop of a grid, seen with the rows halo_start:halo_stop
+    around them."""
+    start: int
+    stop: int
+    halo_start: int
+    halo_stop: int
+
+    def interior(self, view: np.ndarray) -> np.ndarray:
+        """Returns the band's own rows of a view of its rows with the halo."""
+        return view[self.start - self.halo_start:self.stop - self.halo_start]
+
+
+def bands(rows: int, parts: int, halo: int = 0) -> list:
+    """Splits rows into at most parts bands of nearly equal height, each
+    with up to halo more rows on either side (fewer at the grid's edges)."""
+    parts = max(1, min(parts, rows))
+    bounds = [rows * i // parts for i in range(parts + 1)]
+    return [Band(start, stop, max(0, start - halo), min(rows, stop + halo))
+            for start, stop in zip(bounds, bounds[1:])]
+
+
+@contextlib.contextmanager
+def attach(handle: Handle, writable: bool = False, rows: slice = slice(None)):
+    """Yields a view of a shared grid (or of a slice of its rows), without
+    copying it."""
+    segment = open_segment(handle.name)
+    buffer = segment.buf if writable else segment.buf.toreadonly()
+    try:
+        yield as_array(buffer, handle.shape, handle.dtype)[rows]
+    finally:
+        segment.close()
+
+
+def attach_band(handle: Handle, band: Band, writable: bool = False):
+    """Yields a view of a band of a shared grid's rows, with its halo."""
+    return attach(handle, writable, slice(band.halo_start, band.halo_stop))
+
+
+def solve_band(func, handle: Handle, band: Band):
+    """Calls func on a view of one band of a shared grid (in a worker)."""
+    with attach_band(handle, band) as view:
+        return func(view, band)
+
+
+def map_bands(func, grid: SharedGrid, halo: int = 0, parts: int = None,
+              workers: int = None) -> list:
+    """Returns func(view, band) for each band of the grid's rows, in order,
+    each called in a worker process on a read-only view of its band.
+
+    func must be a module-level function, so that it can be sent to the
+    workers.  The grid is split into parts bands (by default, four per
+    worker), as in bands()."""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        parts = parts or 4 * (workers or os.cpu_count() or 1)
+        futures = [pool.submit(solve_band, func, grid.handle, band)
+                   for band in bands(grid.handle.shape[0], parts, halo)]
+        return [f.result() for f in futures]
@@ -0,0 +1,50 @@
+"""The parse stage shared by the parts of a day.
+
+A solution module's parse(input_data) turns the puzzle input into the
+representation its parts work on.  Decorated with parse_stage, it
+
+  - returns an already parsed value unchanged, so that each part can
+    begin with parse(input_data) and accept either the puzzle input or
+    the result of parse;
+  - remembers its results by input content, so that an input is parsed
+    only once per process however many parts are solved.
+
+Parsed values are shared between the parts, so they must not be mutated."""
+
+import functools
+import weakref
+from collections import OrderedDict
+
+# How many parsed inputs each parse stage keeps.
+MEMO_SIZE = 2
+
+_stages = weakref.WeakSet()
+
+
+def parse_stage(func):
+    """Decorates a parse function with pass-through and memoization."""
+    memo = OrderedDict()
+
+    @functools.wraps(func)
+    def parse(input_data):
+        if not isinstance(input_data, str):
+            return input_data
+        # str hashes and compares by content, so equal inputs share an entry
+        if input_data in memo:
+            memo.move_to_end(input_data)
+            return memo[input_data]
+        parsed = func(input_data)
+        memo[input_data] = parsed
+        if len(memo) > MEMO_SIZE:
+            memo.popitem(last=False)
+        return parsed
+
+    parse.cache_clear = memo.clear
+    _stages.add(parse)
+    return parse
+
+
+def clear():
+    """Forgets the parsed inputs of every parse stage, e.g. before timing."""
+    for parse in _stages:
+        parse.cache_clear()
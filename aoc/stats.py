@@ -0,0 +1,39 @@
+"""Opt-in counters of the work done by the solutions.
+
+Solutions count their real units of work (heap operations, states
+expanded, memo hits, ...) into the counters of the current context,
+which are None unless someone is collecting them:
+
+    counters = stats.current()
+    ...
+    if counters is not None:
+        counters["heap_pops"] += pops
+
+so that, when disabled, counting costs a None check per solve (or, in
+recursive functions, per call).  Collect the counts of some code with
+
+    with stats.collect() as counters:
+        part_a(input_data)
+    print(dict(counters))"""
+
+import contextlib
+import contextvars
+from collections import Counter
+
+_counters = contextvars.ContextVar("aoc_stats_counters", default=None)
+
+
+def current():
+    """Returns the Counter being collected in this context, or None."""
+    return _counters.get()
+
+
+@contextlib.contextmanager
+def collect():
+    """Collects the counts made within the block into a new Counter."""
+    counters = Counter()
+    token = _counters.set(counters)
+    try:
+        yield counters
+    finally:
+        _counters.reset(token)
@@ -0,0 +1,47 @@
+"""Tests for solving batches of inputs."""
+
+import pytest
+
+from aoc import batch, days, generators
+
+
+def part_answers(day: int, part: str, inputs: list) -> list:
+    """Returns the answers of the part's function, one input at a time."""
+    module = days.select([f"day{day:02d}"])[0]
+    return [module.part_function(part)(input_data) for input_data in inputs]
+
+
+@pytest.mark.parametrize("day, size, part", [
+    (6, 50, "a"), (6, 50, "b"), (7, 50, "a"), (7, 50, "b"),
+    (8, 20, "a"), (8, 20, "b"), (25, 10, "a"),
+])
+def test_batch_matches_parts(day, size, part):
+    """Batch functions give the answers the parts give one by one."""
+    inputs = [generators.generate_text(day, size, seed=seed) for seed in range(5)]
+    assert batch.batch_function(days.select([f"day{day:02d}"])[0], part)
+    assert batch.solve_batch(day, part, inputs) == part_answers(day, part, inputs)
+
+
+def test_batch_day21():
+    """Day 21's batches answer repeated inputs alike."""
+    inputs = ["Player 1 starting position: 4\nPlayer 2 starting position: 8",
+              "Player 1 starting position: 1\nPlayer 2 starting position: 3",
+              "Player 1 starting position: 4\nPlayer 2 starting position: 8"]
+    assert batch.solve_batch(21, "a", inputs) == part_answers(21, "a", inputs)
+    answers = batch.solve_batch(21, "b", inputs)
+    assert answers[0] == answers[2] == 444356092776315
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_without_batch_function(workers):
+    """Days without a batch function are solved input by input."""
+    inputs = [generators.generate_text(1, 100, seed=seed) for seed in range(7)]
+    assert batch.batch_function(days.select(["day01"])[0], "a") is None
+    assert (batch.solve_batch(1, "a", inputs, workers=workers) ==
+            part_answers(1, "a", inputs))
+
+
+def test_batch_unknown_module():
+    """A module that is not the given day's is an error."""
+    with pytest.raises(ValueError):
+        batch.solve_batch(6, "a", [], module="day07")
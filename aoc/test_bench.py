@@ -0,0 +1,74 @@
+"""Tests for the benchmark harness."""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+from aoc import bench, days
+
+
+def test_fit_exponent():
+    """The fitted exponent recovers a power law, ignoring tiny times."""
+    sizes = [10, 100, 1000, 10000]
+    times = [1e-6, 0.01, 1.0, 100.0]
+    assert bench.fit_exponent(sizes, times) == pytest.approx(2.0)
+    assert bench.fit_exponent([10], [1.0]) is None
+    assert bench.fit_exponent([0], [1.0]) is None
+
+
+def test_run_and_relative_speeds():
+    """Benchmarks record a time and peak memory for every size."""
+    results = bench.run(days.select(["15"]), quick=True, repeat=1)
+    b = results["benchmarks"]["day15_faster:b"]
+    assert b["sizes"] == list(bench.BENCH_SIZES[15][:2])
+    assert all(t > 0 for t in b["times"])
+    assert all(p > 0 for p in b["peaks"])
+    assert results["relative"]["day15_faster:a"]["reference"] == "day15:a"
+
+
+def test_compare():
+    """Regressions beyond the threshold are flagged, others are not."""
+    def results(t, peak):
+        return {"benchmarks": {"day01:a": {"sizes": [10, 20],
+                                           "times": [0.5, t],
+                                           "peaks": [1000, peak]}}}
+
+    baseline = results(1.0, 1000)
+    assert bench.compare(baseline, results(1.1, 1100), threshold=0.25) == []
+    regressions = bench.compare(baseline, results(2.0, 2000), threshold=0.25)
+    assert len(regressions) == 2
+    assert regressions[0].startswith("day01:a size 20: time")
+
+
+def test_import_times():
+    """Importing a day pays for neither aocd nor, in day01, numpy."""
+    t = bench.import_times(days.select(["day01"])[0])
+    assert t["total"] > 0
+    names = [name for name, _ in t["slowest"]]
+    assert not any(n.startswith(("aocd", "numpy")) for n in names)
+
+
+@pytest.mark.parametrize("name, unloaded", [
+    ("day01", ["aocd", "numpy", "concurrent.futures.process"]),
+    ("day02", ["aocd", "concurrent.futures.process"]),
+    ("day14", ["aocd", "numpy", "hashlib"]),
+])
+def test_import_loads_nothing_heavy(name, unloaded):
+    """Importing a day leaves what only some of its functions need unloaded."""
+    module = days.select([name])[0]
+    path = [str(days.REPO_ROOT), str(module.path.parent)]
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(path)}
+    code = f"import sys, {name}; print(' '.join(sorted(sys.modules)))"
+    result = subprocess.run([sys.executable, "-c", code], env=env,
+                            capture_output=True, text=True, check=True)
+    loaded = result.stdout.split()
+    assert [m for m in unloaded if m in loaded] == []
+
+
+def test_compare_import_times():
+    """Import times that grow beyond the threshold are flagged."""
+    baseline = {"imports": {"day01": {"total": 0.01}}}
+    assert bench.compare(baseline, {"imports": {"day01": {"total": 0.011}}}) == []
+    assert len(bench.compare(baseline, {"imports": {"day01": {"total": 0.3}}})) == 1
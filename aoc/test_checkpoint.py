@@ -0,0 +1,79 @@
+"""Tests for the checkpoints of long-running simulations."""
+
+import numpy as np
+
+from aoc import checkpoint, days, generators
+
+
+def load(name):
+    return days.select([name])[0].load()
+
+
+def test_save_and_resume(tmp_path):
+    """The latest checkpoint within a step limit is resumed from."""
+    sim = checkpoint.Simulation(tmp_path / "sim")
+    assert sim.resume() == (0, None)
+    for step in [3, 7, 12]:
+        sim.save(step, {"x": np.arange(step)})
+    assert sim.steps() == [7, 12]
+    step, arrays = sim.resume(10)
+    assert step == 7 and arrays["x"].tolist() == list(range(7))
+    assert sim.resume()[0] == 12
+    assert sim.resume(5) == (0, None)
+    assert not list(sim.path.glob("*.tmp"))
+
+
+def test_state_key():
+    """Keys tell initial states apart, including their shapes."""
+    a = np.zeros((2, 3), dtype=np.uint8)
+    assert checkpoint.state_key(a) == checkpoint.state_key(a.copy())
+    assert checkpoint.state_key(a) != checkpoint.state_key(a.reshape(3, 2))
+    assert checkpoint.state_key("ab", "c") != checkpoint.state_key("a", "bc")
+
+
+def test_simulation_needs_saving(tmp_path):
+    """Without saving, simulations have no checkpoints."""
+    assert checkpoint.simulation("day20", "x") is None
+    with checkpoint.saving(tmp_path):
+        assert checkpoint.simulation("day20", "x").path.parent == tmp_path / "day20"
+
+
+def test_extend_day20(tmp_path, monkeypatch):
+    """Enhancing 100 times after 50 carries on from the 50th enhancement."""
+    day20 = load("day20")
+    input_data = generators.generate_text(20, 20, seed=1)
+    expected = day20.lit_after(input_data, 100)
+    calls = []
+    enhance = day20.enhance
+    monkeypatch.setattr(day20, "enhance", lambda *args: calls.append(1) or enhance(*args))
+    with checkpoint.saving(tmp_path):
+        day20.part_b(input_data)
+        assert len(calls) == 50
+        assert day20.lit_after(input_data, 100) == expected
+    assert len(calls) == 100
+
+
+def test_extend_day14(tmp_path):
+    """Part B's 40 steps carry on from part A's 10, past 64-bit counts."""
+    day14 = load("day14")
+    input_data = generators.generate_text(14, 50, seed=2)
+    expected = [day14.part_a(input_data), day14.part_b(input_data),
+                day14.quantity_difference_after(input_data, 80)]
+    with checkpoint.saving(tmp_path):
+        assert [day14.part_a(input_data), day14.part_b(input_data),
+                day14.quantity_difference_after(input_data, 80)] == expected
+
+
+def test_resume_until_done(tmp_path):
+    """Day 11 and 25 resume mid-run, or from the end, to the same answer."""
+    for name, part, size in [("day11", "part_b", 10), ("day25", "part_a", 30)]:
+        solve = getattr(load(name), part)
+        input_data = generators.generate_text(int(name[3:]), size, seed=3)
+        expected = solve(input_data)
+        with checkpoint.saving(tmp_path, interval=0):
+            assert solve(input_data) == expected
+            assert solve(input_data) == expected
+            path = next(p for p in (tmp_path / name).iterdir())
+            latest = max(path.glob("*.npz"), key=lambda p: int(p.stem))
+            latest.unlink()
+            assert solve(input_data) == expected
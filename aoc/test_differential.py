@@ -0,0 +1,39 @@
+"""Tests for the differential checks of alternative implementations."""
+
+from aoc import days, differential
+
+
+def test_registered_pairs():
+    """Each alternative implementation names the module it is checked against."""
+    found = {(m.name, ref.name) for m, ref in differential.pairs(days.discover())}
+    assert {("day15_faster", "day15"), ("day17", "day17sim"),
+            ("day18", "day18string")} <= found
+    assert differential.pairs(days.select(["day01"])) == []
+
+
+def test_pairs_agree():
+    """The registered pairs give the same answers on generated inputs."""
+    checks = differential.run(days.select(["15", "17"]), quick=True, seeds=2)
+    assert {(c["module"], c["part"]) for c in checks} == {
+        ("day15_faster", "a"), ("day15_faster", "b"), ("day17", "a"), ("day17", "b")}
+    for c in checks:
+        assert c["mismatches"] == []
+        assert len(c["speedups"]) == 2
+
+
+def test_mismatch_reported():
+    """Differing answers, and exceptions, are reported as mismatches."""
+    m, ref = days.select(["day15_faster"])[0], days.select(["day15"])[0]
+    check = differential.check_pair(m, ref, "a", [3], seeds=1)
+    assert check["mismatches"] == []
+
+    def broken(input_data):
+        raise ValueError("bad")
+
+    class Broken(days.DayModule):
+        def part_function(self, part):
+            return broken
+
+    check = differential.check_pair(Broken(m.name, m.day, m.path), ref, "a",
+                                    [3], seeds=1)
+    assert check["mismatches"][0]["answer"] == "ValueError: bad"
@@ -0,0 +1,36 @@
+"""Tests for the uint8 grid loader."""
+
+import mmap
+
+import numpy as np
+import pytest
+
+from aoc import grid
+
+
+def test_read_grid_sources(tmp_path):
+    """A str, bytes and a memory-mapped file give the same grid."""
+    text = "0123\n4567\n8901\n"
+    path = tmp_path / "grid.txt"
+    path.write_text(text)
+    expected = np.array([[0, 1, 2, 3], [4, 5, 6, 7], [8, 9, 0, 1]])
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+        for data in [text, text.encode(), m]:
+            g = grid.read_grid(data)
+            assert g.dtype == np.uint8
+            assert g.tolist() == expected.tolist()
+
+
+def test_read_grid_in_blocks(monkeypatch):
+    """Grids larger than a block are translated block by block."""
+    monkeypatch.setattr(grid, "BLOCK_SIZE", 8)
+    rows = ["".join(str((i + j) % 10) for j in range(5)) for i in range(7)]
+    assert grid.read_grid("\n".join(rows)).tolist() == [
+        [int(c) for c in row] for row in rows]
+
+
+@pytest.mark.parametrize("data", ["12\n3", "123\n45\n678", "1a\n23", "12\r\n34"])
+def test_read_grid_errors(data):
+    """Ragged lines and unknown symbols are rejected."""
+    with pytest.raises(ValueError):
+        grid.read_grid(data)
@@ -0,0 +1,47 @@
+"""Tests for the puzzle input providers."""
+
+import pickle
+
+import pytest
+
+from aoc import days, inputs, run
+
+
+def test_store_round_trip(tmp_path):
+    """Stored inputs are keyed by content and read back unchanged."""
+    store = inputs.InputStore(tmp_path)
+    first = store.add(1, b"199\n200\n208\n")
+    second = store.add(1, b"1\n2\n3")
+    assert store.add(1, b"199\n200\n208") == first
+    assert store.digests(1) == [second, first]
+    assert store.get(1).text() == "199\n200\n208"
+    assert store.get(1, second).bytes() == b"1\n2\n3"
+    assert store.get(1, second).digest == inputs.digest_of(b"1\n2\n3")
+    assert store.digests(2) == []
+    with pytest.raises(FileNotFoundError):
+        store.get(2)
+
+
+def test_lazy_access(tmp_path):
+    """File inputs can be streamed or memory-mapped as well as read."""
+    (tmp_path / "2021").mkdir()
+    (tmp_path / "2021" / "06.txt").write_text("3,4,3,1,2\n")
+    puzzle_input = inputs.DirectoryProvider(tmp_path).get(6)
+    assert puzzle_input.text() == "3,4,3,1,2"
+    with puzzle_input.open() as f:
+        assert f.read(3) == b"3,4"
+    data = puzzle_input.mmap()
+    assert data[:9] == b"3,4,3,1,2"
+    data.close()
+    with pytest.raises(FileNotFoundError):
+        inputs.DirectoryProvider(tmp_path).get(7)
+
+
+def test_run_from_store(tmp_path):
+    """The runner reads inputs from a store, also in worker processes."""
+    store = inputs.InputStore(tmp_path)
+    digest = store.add(6, b"3,4,3,1,2\n")
+    store = pickle.loads(pickle.dumps(store))
+    records = run.run(days.select(["day06"]), inputs=store)
+    assert [r["answer"] for r in records] == [5934, 26984457539]
+    assert all(r["input"] == digest for r in records)
@@ -0,0 +1,29 @@
+"""Tests for the integer extractor."""
+
+import numpy as np
+import pytest
+
+from aoc.ints import read_ints
+
+
+def test_minus_signs():
+    """Only a minus directly before a digit makes a number negative."""
+    assert read_ints("0,9 -> 5,9").tolist() == [0, 9, 5, 9]
+    assert read_ints("x=-5..10,y=-3..-1").tolist() == [-5, 10, -3, -1]
+    assert read_ints("1-2 --3").tolist() == [1, -2, -3]
+    assert read_ints("start-end -").tolist() == []
+
+
+def test_columns():
+    """Integers are reshaped into whole rows, or rejected."""
+    assert read_ints(b"1,2\n3,4\n5,6", columns=2).tolist() == [[1, 2], [3, 4], [5, 6]]
+    assert read_ints("", columns=3).shape == (0, 3)
+    with pytest.raises(ValueError):
+        read_ints("1,2,3", columns=2)
+
+
+def test_dtype():
+    """The integers can be read into a narrower type."""
+    assert read_ints("1\n-2\n3", dtype=np.int32).dtype == np.int32
+    assert read_ints("1-2", dtype=np.int32).tolist() == [1, -2]
+    assert read_ints("", dtype=np.int32).dtype == np.int32
@@ -0,0 +1,46 @@
+"""Tests for the bounded memo tables."""
+
+from aoc import days, memo, stats
+
+
+def test_lru_eviction():
+    """The least recently used entry is evicted beyond maxsize."""
+    calls = []
+
+    @memo.memo(maxsize=2)
+    def square(n):
+        calls.append(n)
+        return n * n
+
+    for n in [1, 2, 1, 3, 1, 2]:
+        square(n)
+    # 2 was evicted by 3, as 1 had been used since
+    assert calls == [1, 2, 3, 2]
+    assert square.info() == memo.MemoInfo(hits=2, misses=4, evictions=2,
+                                          size=2, nbytes=0)
+
+
+def test_byte_budget():
+    """The table stays within its byte budget."""
+
+    @memo.memo(maxbytes=10_000)
+    def label(n):
+        return "x" * 100 + str(n)
+
+    for n in range(1000):
+        label(n)
+    info = label.info()
+    assert 0 < info.nbytes <= 10_000
+    assert info.evictions == 1000 - info.size
+
+
+def test_scope_leaves_nothing_behind():
+    """A solve in a scope counts into stats and leaves the table empty."""
+    day21 = days.select(["21"])[0].load()
+    sample = "Player 1 starting position: 4\nPlayer 2 starting position: 8"
+    with stats.collect() as counters:
+        assert day21.part_b(sample) == 444356092776315
+    assert counters["memo_hits"] > 0 and counters["memo_misses"] > 0
+    assert day21.dirac_dice.info().size == 0
+    memo.clear()
+    assert day21.dirac_dice.info().hits == 0
@@ -0,0 +1,48 @@
+"""Tests for the memory profiles."""
+
+import inspect
+
+import numpy as np
+
+from aoc import days, inputs, memory, parallel
+
+SAMPLE_01 = "199\n200\n208\n210\n200\n207\n240\n269\n260\n263"
+
+
+def test_profile_finds_the_peak_site():
+    """The peak and its largest allocation site are reported."""
+    with memory.profile() as report:
+        big = np.ones(8 << 20, dtype=np.uint8)
+        line = inspect.currentframe().f_lineno - 1
+    assert report["traced_peak"] >= 8 << 20
+    top = report["sites"][0]
+    # the site is the line of this test, not of numpy's ones()
+    assert top["site"] == f"aoc/test_memory.py:{line}"
+    assert top["size"] >= 8 << 20
+
+
+def test_run_in_fresh_processes():
+    """Each part's profile is recorded, from its own worker process."""
+    sample = inputs.MemoryProvider({1: SAMPLE_01})
+    records = parallel.run_parallel(days.select(["1"]), workers=1,
+                                    inputs=sample, memory=True)
+    assert [r["answer"] for r in records] == [7, 5]
+    for r in records:
+        assert r["memory"]["traced_peak"] > 0
+        assert r["memory"]["rss_peak"] > 0
+
+
+def test_report_and_compare():
+    """Reports list each profiled part; growth beyond the threshold is flagged."""
+    def results(peak):
+        profile = {"traced_peak": peak, "rss_peak": None, "sites_at": peak,
+                   "sites": [{"site": "01/day01.py:10", "size": peak, "count": 1}]}
+        return {"results": [{"module": "day01", "part": "a", "memory": profile},
+                            {"module": "day01", "part": "b", "memory": None}]}
+
+    assert memory.format_report(results(3 << 20)) == [
+        "day01 a  traced 3.0 MiB  rss -",
+        "         3.0 MiB  01/day01.py:10"]
+    assert memory.compare(results(1000), results(1100)) == []
+    assert memory.compare(results(1000), results(2000)) == [
+        "day01:a traced_peak 1000 -> 2000 bytes"]
@@ -0,0 +1,51 @@
+"""Tests for the on-disk parse cache."""
+
+import numpy as np
+
+from aoc import days, generators, inputs, parse_cache, run
+from aoc.generators.test_generators import SMALL_SIZES
+
+
+def test_cached_parses_give_the_same_answers(tmp_path):
+    """Every module's cached parse solves like the parse it was made from."""
+    cache = parse_cache.ParseCache(tmp_path)
+    for m in days.discover():
+        module = m.load()
+        if not parse_cache.supports(module):
+            continue
+        data = generators.generate_text(m.day, SMALL_SIZES[m.day], seed=6)
+        digest = inputs.digest_of(data.encode())
+        cache.store(module, digest, m.parse_function()(data))
+        cached = cache.load(module, digest)
+        for part in m.parts():
+            solve = m.part_function(part)
+            assert solve(cached) == solve(data), (m.name, part)
+
+
+def test_arrays_are_memory_mapped(tmp_path):
+    """Cached arrays are mapped read-only rather than read."""
+    day15 = days.select(["day15"])[0]
+    cache = parse_cache.ParseCache(tmp_path)
+    cache.store(day15.load(), "abc", day15.parse_function()("123\n456"))
+    risk = cache.load(day15.load(), "abc")
+    assert isinstance(risk, np.memmap)
+    assert not risk.flags.writeable
+    assert risk.tolist() == [[1, 2, 3], [4, 5, 6]]
+    assert cache.load(day15.load(), "abd") is None
+
+
+def test_run_with_parse_cache(tmp_path):
+    """The runner parses on the first run and loads from the cache after."""
+    store = inputs.InputStore(tmp_path / "inputs")
+    store.add(15, b"1163751742\n1381373672\n2136511328\n3694931569\n"
+                  b"7463417111\n1319128137\n1359912421\n3125421639\n"
+                  b"1293138521\n2311944581")
+    cache = parse_cache.ParseCache(tmp_path / "parsed")
+    modules = days.select(["day15", "day01"])
+    first = run.run(modules, inputs=store, parse_cache=cache)
+    assert [r["parse_cache"] for r in first if r["module"] == "day15"] == ["miss", "hit"]
+    assert [r["error"] for r in first if r["module"] == "day01"] == [
+        "FileNotFoundError: No stored input for 2021 day 1"] * 2
+    second = run.run(modules[:1], inputs=store, parse_cache=cache)
+    assert [r["parse_cache"] for r in second] == ["hit", "hit"]
+    assert [r["answer"] for r in second] == [40, 315]
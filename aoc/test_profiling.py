@@ -0,0 +1,41 @@
+"""Tests for profiling the solutions."""
+
+import pstats
+
+from aoc import days, inputs, profiling, run
+
+
+def busy(n: int) -> int:
+    total = 0
+    for i in range(n):
+        total += i * i
+    return total
+
+
+def test_profile(tmp_path):
+    """A profile saves pstats and collapsed stacks, and finds the hot spot."""
+    with profiling.profile(tmp_path, "busy") as report:
+        busy(500000)
+    assert pstats.Stats(report["pstats"]).total_calls > 0
+    assert report["hot"][0]["function"].endswith("(busy)")
+    assert report["hot"][0]["function"].startswith("aoc/test_profiling.py:")
+    with open(report["collapsed"]) as f:
+        lines = f.read().splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+        # the stacks start within the profiled block
+        assert stack.startswith("busy (aoc/test_profiling.py:")
+
+
+def test_run_profile(tmp_path):
+    """Runs with a profile directory name the files by part and input hash."""
+    provider = inputs.MemoryProvider({17: "target area: x=20..30, y=-10..-5"})
+    record = run.run_part(days.select(["day17sim"])[0], "b", provider,
+                          profile=tmp_path)
+    assert record["error"] is None
+    name = profiling.profile_name("day17sim", "b", provider.get(17).digest)
+    assert record["profile"]["pstats"] == str(tmp_path / f"{name}.pstats")
+    assert any("day17sim.py" in h["function"] for h in record["profile"]["hot"])
+    assert profiling.format_hot(record["profile"])
@@ -0,0 +1,94 @@
+"""Tests for the multi-day runner."""
+
+import json
+
+from aoc import days, inputs, parallel, run
+
+# Serves sample data instead of puzzle data.
+sample_inputs = inputs.MemoryProvider({
+    1: "199\n200\n208\n210\n200\n207\n240\n269\n260\n263",
+    17: "target area: x=20..30, y=-10..-5",
+})
+
+
+def test_discover_finds_variants():
+    """Variant modules are discovered alongside the main ones."""
+    names = [m.name for m in days.discover()]
+    assert names[0] == "day01"
+    for name in ["day15", "day15_faster", "day17sim", "day18string", "day25"]:
+        assert name in names
+
+
+def test_select():
+    """Selectors pick whole days or single modules."""
+    assert [m.name for m in days.select(["17"])] == ["day17", "day17sim"]
+    assert [m.name for m in days.select(["day17sim"])] == ["day17sim"]
+
+
+def test_parts():
+    """Parts are found from the module's part functions."""
+    modules = {m.name: m for m in days.discover()}
+    assert modules["day01"].parts() == ["a", "b"]
+    assert modules["day19"].parts() == ["ab"]
+    assert modules["day25"].parts() == ["a"]
+
+
+def test_run_records():
+    """Running yields JSON-ready records with timings for each phase."""
+    records = run.run(days.select(["1", "day17sim"]), inputs=sample_inputs)
+    answers = [(r["module"], r["part"], r["answer"]) for r in records]
+    assert answers == [("day01", "a", 7), ("day01", "b", 5),
+                       ("day17sim", "a", 45), ("day17sim", "b", 112)]
+    for r in records:
+        assert r["error"] is None
+        assert r["input"] == sample_inputs.get(r["day"]).digest
+        assert r["timings"]["load"] >= 0
+        assert r["timings"]["solve"] >= 0
+    json.dumps(records)
+
+
+def test_run_records_errors():
+    """A failing part is recorded as an error rather than raised."""
+    record = run.run_part(days.select(["day01"])[0], "a",
+                          inputs=inputs.MemoryProvider({1: ""}))
+    assert record["answer"] is None
+    assert record["error"].startswith("ValueError")
+
+
+def test_run_checkpoints(tmp_path):
+    """With a checkpoints directory, the simulations save their state there."""
+    data = ("..#.#..#####.#.#.#.###.##.....###.##.#..###.####..#####..#....#..#..##..##"
+            "#..######.###...####..#..#####..##..#.#####...##.#.#..#.##..#.#......#.###"
+            ".######.###.####...#.##.##..#..#..#####.....#.#....###..#.##......#.....#."
+            ".#..#..##..#...##.######.####.####.#.#...#.......#..#.#.#...####.##.#....."
+            ".#..#...##.#.##..#...##.#.##..###.#......#.#.......#.#.#.####.###.##...#.."
+            "...####.#..#..#.##.#....##..#.####....##...##..#...#......#.#.......#....."
+            "..##..####..#...#.#.#...##..#.#..###..#####........#..####......#..#\n\n"
+            "#..#.\n#....\n##..#\n..#..\n..###")
+    records = run.run(days.select(["20"]), inputs=inputs.MemoryProvider({20: data}),
+                      checkpoints=tmp_path)
+    assert [r["answer"] for r in records] == [35, 3351]
+    assert sorted(p.name for p in (tmp_path / "day20").glob("*/*.npz")) == [
+        "2.npz", "50.npz"]
+
+
+def test_schedule_longest_first():
+    """Jobs are scheduled longest-first, with unknown durations first."""
+    modules = days.select(["1", "17"])
+    job_list = run.jobs(modules)
+    durations = {("day01", "a"): 1.0, ("day01", "b"): 3.0,
+                 ("day17", "a"): 2.0, ("day17", "b"): 0.5,
+                 ("day17sim", "a"): 0.1}
+    order = [(m.name, part)
+             for m, part in parallel.schedule(job_list, durations)]
+    assert order == [("day17sim", "b"), ("day01", "b"), ("day17", "a"),
+                     ("day01", "a"), ("day17", "b"), ("day17sim", "a")]
+
+
+def test_run_parallel():
+    """Parallel runs give the same answers, in the same order, as serial runs."""
+    modules = days.select(["1", "day17sim"])
+    serial = run.run(modules, inputs=sample_inputs)
+    records = parallel.run_parallel(modules, workers=2, inputs=sample_inputs)
+    assert ([(r["module"], r["part"], r["answer"]) for r in records] ==
+            [(r["module"], r["part"], r["answer"]) for r in serial])
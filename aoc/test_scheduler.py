@@ -0,0 +1,52 @@
+"""Tests for the asyncio scheduler."""
+
+import asyncio
+
+from aoc import generators, scheduler
+
+SAMPLE_01 = "199\n200\n208\n210\n200\n207\n240\n269\n260\n263"
+
+
+def test_solve_timeout_and_cancel():
+    """Jobs are solved, timed out per day, and killed when cancelled."""
+
+    async def main():
+        slow = generators.generate_text(23, 0)
+        async with scheduler.Scheduler(size=1, timeouts={23: 0.1}) as s:
+            record = await s.solve(1, "a", SAMPLE_01)
+            assert record["answer"] == 7
+
+            record = await s.solve(23, "b", slow)
+            assert record["error"].startswith("TimeoutError")
+            assert s.workers_started == 2
+
+            # a cancelled job frees its worker at once, for the next job
+            with_timeout = asyncio.wait_for(s.solve(23, "b", slow, timeout=60), 0.5)
+            try:
+                await with_timeout
+            except asyncio.TimeoutError:
+                pass
+            record = await asyncio.wait_for(s.solve(1, "b", SAMPLE_01), 10)
+            assert record["answer"] == 5
+            assert s.workers_started == 3
+
+    asyncio.run(main())
+
+
+def test_clients_take_turns():
+    """A client's jobs do not hold up those of another client."""
+
+    async def main():
+        async with scheduler.Scheduler(size=1) as s:
+            finished = []
+
+            async def solve(client, part):
+                await s.solve(1, part, SAMPLE_01, client=client)
+                finished.append(client)
+
+            await asyncio.gather(*[solve("busy", "a") for _ in range(4)],
+                                 solve("quiet", "b"))
+            # busy's first job started at once; then busy and quiet alternate
+            assert finished.index("quiet") == 2
+
+    asyncio.run(main())
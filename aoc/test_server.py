@@ -0,0 +1,43 @@
+"""Tests for the worker pool and the solve server."""
+
+import threading
+
+import pytest
+
+from aoc import generators, server, workers
+
+SAMPLE_01 = "199\n200\n208\n210\n200\n207\n240\n269\n260\n263"
+
+
+@pytest.fixture(scope="module")
+def pool():
+    with workers.WorkerPool(size=1, max_requests=2) as p:
+        yield p
+
+
+def test_requests_over_socket(pool, tmp_path):
+    """Requests are answered with their run records, on one server."""
+    path = str(tmp_path / "aoc.sock")
+    with server.SolveServer(path, pool) as s:
+        thread = threading.Thread(target=s.serve_forever, daemon=True)
+        thread.start()
+        try:
+            record = server.request(path, 1, "b", SAMPLE_01)
+            assert record["answer"] == 5
+            assert record["timings"]["solve"] is not None
+            record = server.request(path, 1, "a", SAMPLE_01, module="nope")
+            assert record["error"].startswith("BadRequest")
+        finally:
+            s.shutdown()
+
+
+def test_timeouts_and_recycling(pool):
+    """Slow jobs are killed, and workers are replaced after max_requests."""
+    started = pool.workers_started
+    slow = generators.generate_text(23, 0)
+    record = pool.solve(23, "b", slow, timeout=0.1)
+    assert record["error"].startswith("TimeoutError")
+    assert pool.workers_started == started + 1
+    for _ in range(2):
+        assert pool.solve(1, "a", SAMPLE_01)["answer"] == 7
+    assert pool.workers_started == started + 2
@@ -0,0 +1,76 @@
+"""Tests for grids in shared memory."""
+
+import functools
+import os
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+import pytest
+
+from aoc import shm
+
+
+def neighbour_sums(out_handle, view, band):
+    """Writes the sum of each cell's four neighbours into the output grid."""
+    padded = np.pad(view.astype(np.int64), 1)
+    sums = (padded[:-2, 1:-1] + padded[2:, 1:-1] +
+            padded[1:-1, :-2] + padded[1:-1, 2:])
+    with shm.attach_band(out_handle, band, writable=True) as out:
+        band.interior(out)[...] = band.interior(sums)
+    return band.stop - band.start
+
+
+def crash(view, band):
+    os._exit(1)
+
+
+def test_bands():
+    """Bands cover the rows in order, with halos clipped at the edges."""
+    bs = shm.bands(10, 3, halo=2)
+    assert [(b.start, b.stop) for b in bs] == [(0, 3), (3, 6), (6, 10)]
+    assert [(b.halo_start, b.halo_stop) for b in bs] == [(0, 5), (1, 8), (4, 10)]
+    assert len(shm.bands(2, 8)) == 2
+    view = np.arange(10)[1:8]
+    assert bs[1].interior(view).tolist() == [3, 4, 5]
+
+
+def test_attach():
+    """Attached views share the owner's memory, read-only unless asked."""
+    with shm.SharedGrid.copy_of(np.arange(12).reshape(3, 4)) as grid:
+        with shm.attach(grid.handle) as view:
+            assert view.tolist() == grid.array.tolist()
+            with pytest.raises(ValueError):
+                view[0, 0] = 5
+        with shm.attach_band(grid.handle, shm.Band(1, 2, 1, 3), writable=True) as view:
+            view[0, 0] = 99
+        assert grid.array[1, 0] == 99
+        name = grid.handle.name
+    with pytest.raises(FileNotFoundError):
+        with shm.attach(grid.handle):
+            pass
+    assert not os.path.exists(f"/dev/shm/{name}")
+
+
+def test_map_bands():
+    """A stencil over bands with a halo matches the whole-grid result."""
+    rng = np.random.default_rng(0)
+    heights = rng.integers(0, 10, size=(101, 37), dtype=np.uint8)
+    with shm.SharedGrid.copy_of(heights) as grid, \
+            shm.SharedGrid(heights.shape, np.int64) as out:
+        rows = shm.map_bands(functools.partial(neighbour_sums, out.handle),
+                             grid, halo=1, parts=7, workers=2)
+        assert sum(rows) == 101
+        padded = np.pad(heights.astype(np.int64), 1)
+        expected = (padded[:-2, 1:-1] + padded[2:, 1:-1] +
+                    padded[1:-1, :-2] + padded[1:-1, 2:])
+        assert np.array_equal(out.array, expected)
+
+
+def test_worker_crash():
+    """A crashing worker leaves the grid usable, and it is still removed."""
+    with shm.SharedGrid.copy_of(np.ones((4, 4), dtype=np.uint8)) as grid:
+        with pytest.raises(BrokenProcessPool):
+            shm.map_bands(crash, grid, workers=1)
+        assert grid.array.sum() == 16
+        name = grid.handle.name
+    assert not os.path.exists(f"/dev/shm/{name}")
@@ -0,0 +1,38 @@
+"""Tests for the shared parse stage."""
+
+from aoc import days, generators, stage
+from aoc.generators.test_generators import SMALL_SIZES, SLOW_DAYS
+
+
+def test_parse_stage_memoizes_by_content():
+    """Equal inputs are parsed once; parsed values pass straight through."""
+    calls = []
+
+    @stage.parse_stage
+    def parse(input_data: str) -> list:
+        calls.append(input_data)
+        return input_data.split(",")
+
+    parsed = parse("1,2,3")
+    assert parse("".join(["1,2", ",3"])) is parsed
+    assert parse(parsed) is parsed
+    assert calls == ["1,2,3"]
+    stage.clear()
+    assert parse("1,2,3") == parsed
+    assert len(calls) == 2
+
+
+def test_parts_accept_parsed_input():
+    """Every part gives the same answer for the input and for its parse,
+    and leaves the parse fit for reuse."""
+    for m in days.discover():
+        if m.day in SLOW_DAYS:
+            continue
+        data = generators.generate_text(m.day, SMALL_SIZES[m.day], seed=5)
+        parsed = m.parse_function()(data)
+        for part in m.parts():
+            solve = m.part_function(part)
+            answer = solve(parsed)
+            assert solve(parsed) == answer, (m.name, part)
+            stage.clear()
+            assert solve(data) == answer, (m.name, part)
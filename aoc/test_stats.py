@@ -0,0 +1,35 @@
+"""Tests for the work counters."""
+
+from aoc import days, inputs, run, stats
+
+SAMPLE_15 = """1163751742
+1381373672
+2136511328
+3694931569
+7463417111
+1319128137
+1359912421
+3125421639
+1293138521
+2311944581"""
+
+
+def test_collect_only_when_asked():
+    """Counts are collected inside collect() and nowhere else."""
+    day15 = days.select(["15"])[0].load()
+    assert stats.current() is None
+    with stats.collect() as counters:
+        assert day15.part_a(SAMPLE_15) == 40
+    assert stats.current() is None
+    assert counters["heap_pushes"] == counters["heap_pops"] > 0
+    assert counters["nodes_visited"] == 100
+
+
+def test_run_records_stats():
+    """The runner records the counters of each part with --stats only."""
+    module = days.select(["day15_faster"])[0]
+    sample = inputs.MemoryProvider({15: SAMPLE_15})
+    record = run.run_part(module, "a", sample, stats=True)
+    assert record["answer"] == 40
+    assert record["stats"]["heap_pushes"] > 0
+    assert run.run_part(module, "a", sample)["stats"] is None
@@ -0,0 +1,205 @@
+"""A pool of warm solver processes, with timeouts and recycling.
+
+Each worker process imports every solution module once, when it starts,
+and then solves jobs sent to it over a pipe, so that a job pays neither
+the interpreter's start-up nor the imports.  The pool
+
+  - gives each job a timeout, killing (and replacing) a worker that
+    has not answered in time, as a solve cannot be interrupted safely;
+  - recycles a worker after MAX_REQUESTS jobs, or once its resident set
+    has grown past MAX_RSS bytes, so that memory held by one job (e.g. a
+    large parse) is given back rather than kept for the life of the pool;
+  - replaces a worker that has died, e.g. killed for lack of memory.
+
+Workers are started from a fork server that has already imported the
+runner and numpy, where the platform has one."""
+
+import multiprocessing
+import queue
+import threading
+
+from aoc import days, inputs, memory, run
+
+# How long a job may take by default, in seconds.
+DEFAULT_TIMEOUT = 60.0
+
+# How many jobs a worker solves before it is replaced.
+MAX_REQUESTS = 1000
+
+# How large a worker's resident set may grow before it is replaced, in bytes.
+MAX_RSS = 1 << 30
+
+# How long a new worker may take to import the solutions, in seconds.
+STARTUP_TIMEOUT = 60.0
+
+
+def serve(conn):
+    """The worker process: loads the solutions, then solves each job
+    (module name, part, input data) it receives, sending back its record
+    and the worker's resident set high-water mark, until it receives None."""
+    modules = {m.name: m for m in days.discover()}
+    for m in modules.values():
+        try:
+            m.load()
+        except Exception:
+            pass  # reported by each job that needs the module
+    conn.send("ready")
+    while True:
+        try:
+            job = conn.recv()
+        except EOFError:
+            return
+        if job is None:
+            return
+        name, part, input_data = job
+        module = modules[name]
+        record = run.run_part(module, part,
+                              inputs.MemoryProvider({module.day: input_data}))
+        conn.send((record, memory.rss_peak()))
+
+
+def default_context():
+    """Returns the multiprocessing context that workers are started with."""
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("forkserver")
+        context.set_forkserver_preload(["aoc.run"])
+        return context
+    return multiprocessing.get_context("spawn")
+
+
+class Worker:
+    """One warm solver process and the pipe to it."""
+
+    def __init__(self, context):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(target=serve, args=(child_conn,),
+                                       daemon=True)
+        self.process.start()
+        child_conn.close()
+        self.ready = False
+        self.requests = 0
+        self.rss = 0
+
+    def wait_ready(self):
+        """Waits for the worker to have loaded the solutions."""
+        if not self.ready:
+            if not self.conn.poll(STARTUP_TIMEOUT):
+                raise TimeoutError("worker did not start")
+            self.conn.recv()
+            self.ready = True
+
+    def send(self, job: tuple):
+        """Sends a job to the worker, once it is ready."""
+        self.wait_ready()
+        self.conn.send(job)
+        self.requests += 1
+
+    def receive(self, timeout: float) -> dict:
+        """Returns the record of the job sent, or raises TimeoutError if it
+        takes longer than timeout seconds (or EOFError if the worker died)."""
+        if not self.conn.poll(timeout):
+            raise TimeoutError
+        record, self.rss = self.conn.recv()
+        return record
+
+    def worn_out(self, max_requests: int, max_rss: int) -> bool:
+        """Returns whether the worker should be replaced after its last job."""
+        return self.requests >= max_requests or self.rss > max_rss
+
+    def kill(self):
+        """Stops the worker at once, whatever it is doing."""
+        self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+    def close(self):
+        """Asks the worker to exit once it is idle, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except OSError:
+            pass
+        self.process.join(timeout=1.0)
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.conn.close()
+
+
+class WorkerPool:
+    """A fixed number of warm workers that solve jobs, one job each at a time.
+
+    solve() may be called from several threads; a job waits for an idle
+    worker."""
+
+    def __init__(self, size: int = None, timeout: float = DEFAULT_TIMEOUT,
+                 max_requests: int = MAX_REQUESTS, max_rss: int = MAX_RSS,
+                 context=None):
+        self.modules = {m.name: m for m in days.discover()}
+        self.timeout = timeout
+        self.max_requests = max_requests
+        self.max_rss = max_rss
+        self.context = context or default_context()
+        self.workers_started = 0
+        self.lock = threading.Lock()
+        self.idle = queue.Queue()
+        for _ in range(size or multiprocessing.cpu_count()):
+            self.idle.put(self.new_worker())
+
+    def new_worker(self) -> Worker:
+        """Starts a worker to add to (or return to) the pool."""
+        with self.lock:
+            self.workers_started += 1
+        return Worker(self.context)
+
+    def module(self, day: int, name: str = None) -> days.DayModule:
+        """Returns the solution module to use for a day: the named one, or
+        else the day's main module.  Raises ValueError if there is none."""
+        name = name or f"day{day:02d}"
+        module = self.modules.get(name)
+        if module is None or module.day != day:
+            raise ValueError(f"No solution module {name} for day {day}")
+        return module
+
+    def solve(self, day: int, part: str, input_data: str, module: str = None,
+              timeout: float = None) -> dict:
+        """Solves one part for one input in a worker, and returns its record
+        (see aoc.run).  A job that times out, or whose worker dies, is
+        recorded as an error.  Raises ValueError for an unknown module."""
+        m = self.module(day, module)
+        timeout = self.timeout if timeout is None else timeout
+        worker = self.idle.get()
+        try:
+            worker.send((m.name, part, input_data))
+            record = worker.receive(timeout)
+        except TimeoutError:
+            worker.kill()
+            worker = self.new_worker()
+            record = run.new_record(m, part)
+            record["error"] = f"TimeoutError: no answer within {timeout}s"
+        except (EOFError, OSError) as e:
+            worker.kill()
+            worker = self.new_worker()
+            record = run.new_record(m, part)
+            record["error"] = f"WorkerError: worker died ({type(e).__name__})"
+        else:
+            if worker.worn_out(self.max_requests, self.max_rss):
+                worker.close()
+                worker = self.new_worker()
+        finally:
+            self.idle.put(worker)
+        return record
+
+    def close(self):
+        """Stops the workers, once no jobs are running."""
+        while True:
+            try:
+                worker = self.idle.get_nowait()
+            except queue.Empty:
+                return
+            worker.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
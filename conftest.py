@@ -0,0 +1,4 @@
+"""Pytest configuration.
+
+Having a conftest.py here puts the repository root on sys.path, so that
+the day modules and their tests can import the shared aoc package."""
@@ -1,7 +1,5 @@
 """Solves day DAY_NUMBER, Advent of Code 2021."""
 
-from aocd.models import Puzzle
-
 
 def part_a(input_data: str) -> int:
     """Given the puzzle input data, return the solution for part A."""
@@ -16,6 +14,8 @@ def part_b(input_data: str) -> int:
 
 
 if __name__ == '__main__':
+    from aocd.models import Puzzle
+
     puzzle = Puzzle(year=2021, day=DAY_NUMBER)
 
     print(f"Puzzle {puzzle.year}-12-{puzzle.day:02d}: {puzzle.title}")